@@ -0,0 +1,4 @@
+"""Benchmarks da API.
+
+Execute a partir de backend/ com ``python -m benchmarks.<nome>``.
+"""
@@ -0,0 +1,116 @@
+"""Fluxo de caixa e distribuição por categoria sobre transações sintéticas.
+
+Compara o motor vetorizado (AnalyticsEngine sobre arrays colunares) com a
+agregação linha a linha usando ``Transaction.signed_amount``.
+
+Uso:
+    python -m benchmarks.analytics_engine [--rows 1000000] [--categories 20]
+"""
+
+import argparse
+import time
+from collections import defaultdict
+from datetime import datetime
+from decimal import Decimal
+from uuid import uuid4
+
+import numpy as np
+
+from src.domain.entities import AggregationPeriod, Transaction, TransactionType
+from src.infrastructure.analytics import AnalyticsEngine, TransactionColumns
+
+
+def _columns(rows: int, categories: int, seed: int = 42) -> TransactionColumns:
+    rng = np.random.default_rng(seed)
+    start = np.datetime64("2020-01-01T00:00:00", "us")
+    span = np.timedelta64(5 * 365 * 24 * 3600, "s").astype("timedelta64[us]")
+    offsets = np.sort(rng.integers(0, span.astype(np.int64), rows))
+    return TransactionColumns(
+        cents=rng.integers(100, 500_000, rows, dtype=np.int64),
+        dates=start + offsets.astype("timedelta64[us]"),
+        category_codes=rng.integers(0, categories + 1, rows, dtype=np.int32),
+        income=rng.random(rows) < 0.3,
+        category_ids=[None, *(uuid4() for _ in range(categories))],
+    )
+
+
+def _entities(columns: TransactionColumns, user_id) -> list[Transaction]:
+    return [
+        Transaction.rehydrate(
+            id=uuid4(),
+            description="",
+            amount=Decimal(cents).scaleb(-2),
+            type=TransactionType.INCOME if income else TransactionType.EXPENSE,
+            date=date,
+            user_id=user_id,
+            category_id=columns.category_ids[code],
+            notes=None,
+            created_at=date,
+            updated_at=None,
+        )
+        for cents, date, code, income in zip(
+            columns.cents.tolist(),
+            columns.dates.astype(datetime).tolist(),
+            columns.category_codes.tolist(),
+            columns.income.tolist(),
+        )
+    ]
+
+
+def _row_by_row(transactions: list[Transaction]) -> tuple[dict, dict]:
+    cashflow: dict = defaultdict(Decimal)
+    breakdown: dict = defaultdict(Decimal)
+    for transaction in transactions:
+        month = transaction.date.replace(
+            day=1, hour=0, minute=0, second=0, microsecond=0
+        )
+        cashflow[month] += transaction.signed_amount
+        if transaction.type == TransactionType.EXPENSE:
+            breakdown[(month, transaction.category_id)] += transaction.amount
+
+    balance = Decimal("0")
+    for month in sorted(cashflow):
+        balance += cashflow[month]
+    sorted(breakdown.items(), key=lambda item: item[1], reverse=True)[:5]
+    return cashflow, breakdown
+
+
+def _timed(name: str, func) -> float:
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"{name:>30}: {elapsed * 1000:9.1f} ms")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--categories", type=int, default=20)
+    args = parser.parse_args()
+
+    columns = _columns(args.rows, args.categories)
+    engine = AnalyticsEngine(columns)
+    arrays = (columns.cents, columns.dates, columns.category_codes, columns.income)
+    memory = sum(array.nbytes for array in arrays)
+    print(f"{args.rows} transações, {memory / 1024 / 1024:.1f} MiB em arrays")
+
+    vectorized = _timed(
+        "vetorizado: fluxo + categorias",
+        lambda: (
+            engine.cashflow(AggregationPeriod.MONTH, 0, 3),
+            engine.breakdown(AggregationPeriod.MONTH, False, 5),
+        ),
+    )
+    _timed(
+        "vetorizado: fluxo diário",
+        lambda: engine.cashflow(AggregationPeriod.DAY, 0, 30),
+    )
+
+    transactions = _entities(columns, uuid4())
+    python = _timed("linha a linha (signed_amount)", lambda: _row_by_row(transactions))
+    print(f"{'aceleração':>30}: {python / vectorized:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Latência do event loop durante logins concorrentes.
+
+Compara a verificação de senha síncrona (bloqueando o loop) com a versão
+assíncrona executada no pool limitado de threads.
+
+Uso:
+    python -m benchmarks.bcrypt_event_loop [--logins 32] [--rounds 12] [--workers 4]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Awaitable, Callable
+
+from src.infrastructure.security import PasswordHashExecutor, PasswordServiceImpl
+
+TICK = 0.005
+
+
+async def _measure_lag(stop: asyncio.Event, lags: list[float]) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(TICK)
+        lags.append(time.perf_counter() - start - TICK)
+
+
+async def _run(logins: int, verify: Callable[[], Awaitable[bool]]) -> dict[str, float]:
+    lags: list[float] = []
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(_measure_lag(stop, lags))
+    await asyncio.sleep(TICK * 2)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(verify() for _ in range(logins)))
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await ticker
+    lags.sort()
+    return {
+        "elapsed_s": elapsed,
+        "lag_p50_ms": statistics.median(lags) * 1000,
+        "lag_p99_ms": lags[int(len(lags) * 0.99) - 1] * 1000 if lags else 0.0,
+        "lag_max_ms": lags[-1] * 1000 if lags else 0.0,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=32)
+    parser.add_argument("--rounds", type=int, default=12)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    executor = PasswordHashExecutor(max_workers=args.workers, max_queue=args.logins)
+    service = PasswordServiceImpl(args.rounds, executor)
+    hashed = service.hash_password("senha-de-teste")
+
+    async def blocking() -> bool:
+        return service.verify_password("senha-de-teste", hashed)
+
+    async def offloaded() -> bool:
+        return await service.verify_password_async("senha-de-teste", hashed)
+
+    print(f"{args.logins} logins, bcrypt rounds={args.rounds}, workers={args.workers}")
+    for name, verify in (("síncrono", blocking), ("executor", offloaded)):
+        result = await _run(args.logins, verify)
+        print(
+            f"{name:>9}: total {result['elapsed_s']:.2f}s | lag do loop "
+            f"p50 {result['lag_p50_ms']:.1f}ms p99 {result['lag_p99_ms']:.1f}ms "
+            f"máx {result['lag_max_ms']:.1f}ms"
+        )
+    executor.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
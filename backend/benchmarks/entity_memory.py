@@ -0,0 +1,94 @@
+"""Memória e tempo para hidratar 100 mil transações.
+
+Compara uma dataclass comum (com __dict__, construída pelo __init__ com
+__post_init__) com a entidade Transaction atual (slots=True, rehydrate).
+
+Uso:
+    python -m benchmarks.entity_memory [--count 100000]
+"""
+
+import argparse
+import time
+import tracemalloc
+from dataclasses import dataclass, field, fields, make_dataclass
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any, Callable
+from uuid import uuid4
+
+from src.domain.entities import Transaction, TransactionType
+
+
+def _rows(count: int) -> list[dict[str, Any]]:
+    user_id = uuid4()
+    start = datetime(2026, 1, 1)
+    return [
+        {
+            "id": uuid4(),
+            "description": f"Transação {i}",
+            "amount": Decimal(i) / 100,
+            "type": TransactionType.EXPENSE,
+            "date": start + timedelta(minutes=i),
+            "notes": None,
+            "user_id": user_id,
+            "category_id": None,
+            "created_at": start,
+            "updated_at": None,
+        }
+        for i in range(count)
+    ]
+
+
+def _legacy_class() -> type:
+    def __post_init__(self: Any) -> None:
+        if self.amount < 0:
+            raise ValueError("O valor da transação não pode ser negativo")
+
+    return dataclass(
+        make_dataclass(
+            "LegacyTransaction",
+            [(f.name, f.type, field(default=None)) for f in fields(Transaction)],
+            namespace={"__post_init__": __post_init__},
+        )
+    )
+
+
+def _measure(
+    build: Callable[[dict[str, Any]], Any], rows: list[dict[str, Any]]
+) -> tuple[int, float]:
+    start = time.perf_counter()
+    entities = [build(row) for row in rows]
+    elapsed = time.perf_counter() - start
+    del entities
+
+    tracemalloc.start()
+    entities = [build(row) for row in rows]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del entities
+    return size, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+
+    rows = _rows(args.count)
+    legacy = _legacy_class()
+
+    print(f"{args.count} transações (valores compartilhados; mede só as instâncias)")
+    for name, build in (
+        ("dataclass + __init__", lambda row: legacy(**row)),
+        ("slots + __init__", lambda row: Transaction(**row)),
+        ("slots + rehydrate", lambda row: Transaction.rehydrate(**row)),
+    ):
+        size, elapsed = _measure(build, rows)
+        print(
+            f"{name:>21}: {size / 1024 / 1024:6.1f} MiB "
+            f"({size / args.count:5.0f} bytes/transação) | {elapsed * 1000:6.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
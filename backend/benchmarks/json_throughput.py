@@ -0,0 +1,158 @@
+"""Custo de serializar respostas JSON e vazão de GET /transactions/?limit=1000.
+
+Compara a serialização antiga (jsonable_encoder + json.dumps) com o
+serializador pré-compilado do pydantic-core usado pelas rotas e pelo
+ConditionalResponder, e mede requisições por segundo na aplicação em processo.
+
+Uso:
+    python -m benchmarks.json_throughput [--rows 1000] [--repeat 50] [--requests 100]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import insert, select
+
+from src.application.dtos import TransactionResponseDTO
+from src.domain.entities import TransactionType
+from src.presentation.api.responses import dump_json
+
+
+def _legacy_dump(value: object) -> bytes:
+    return json.dumps(
+        jsonable_encoder(value),
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def _serialization(rows: int, repeat: int) -> None:
+    now = datetime(2026, 1, 1)
+    dtos = [
+        TransactionResponseDTO(
+            id=uuid4(),
+            description=f"Transação {i}",
+            amount=Decimal("10.50") + i,
+            type=TransactionType.EXPENSE if i % 3 else TransactionType.INCOME,
+            date=now + timedelta(hours=i),
+            category_id=None,
+            user_id=uuid4(),
+            notes=None,
+            created_at=now,
+            updated_at=None,
+        )
+        for i in range(rows)
+    ]
+    response_type = list[TransactionResponseDTO]
+
+    print(f"Serialização de {rows} transações, média de {repeat} execuções")
+    for name, dump in (
+        ("jsonable_encoder+json", _legacy_dump),
+        ("pydantic-core", lambda value: dump_json(value, response_type)),
+    ):
+        dump(dtos)
+        start = time.perf_counter()
+        for _ in range(repeat):
+            body = dump(dtos)
+        elapsed_ms = (time.perf_counter() - start) / repeat * 1000
+        print(f"{name:>22}: {elapsed_ms:7.2f} ms | {len(body) / 1024:7.1f} KiB")
+
+
+async def _throughput(rows: int, requests: int) -> None:
+    import httpx
+
+    database_url = f"sqlite+aiosqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+    os.environ["DATABASE_URL"] = database_url
+    os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
+    from src.infrastructure.database import TransactionModel, UserModel
+    from src.infrastructure.database.database import get_database
+    from src.infrastructure.database.schema import upgrade_schema
+    from src.main import create_app, lifespan
+
+    await asyncio.to_thread(upgrade_schema, database_url)
+    app = create_app()
+    async with lifespan(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench"
+        ) as client:
+            credentials = {
+                "email": "bench@example.com",
+                "name": "Bench",
+                "password": "benchmark",
+            }
+            await client.post("/api/v1/auth/register", json=credentials)
+            login = await client.post(
+                "/api/v1/auth/login",
+                data={
+                    "username": credentials["email"],
+                    "password": credentials["password"],
+                },
+            )
+            headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+            now = datetime(2026, 1, 1)
+            async for session in get_database().get_session():
+                user_id = await session.scalar(
+                    select(UserModel.id).where(UserModel.email == credentials["email"])
+                )
+                await session.execute(
+                    insert(TransactionModel),
+                    [
+                        {
+                            "id": uuid4(),
+                            "description": f"Transação {i}",
+                            "amount": Decimal("10.50") + i,
+                            "type": (
+                                TransactionType.EXPENSE
+                                if i % 3
+                                else TransactionType.INCOME
+                            ),
+                            "date": now + timedelta(hours=i),
+                            "user_id": user_id,
+                            "created_at": now,
+                        }
+                        for i in range(rows)
+                    ],
+                )
+
+            print(f"\nVazão em processo, {requests} requisições sequenciais")
+            for path in (
+                f"/api/v1/transactions/?limit={rows}",
+                "/api/v1/transactions/summary",
+            ):
+                await client.get(path, headers=headers)
+                start = time.perf_counter()
+                for _ in range(requests):
+                    response = await client.get(path, headers=headers)
+                elapsed = time.perf_counter() - start
+                size = len(response.content) / 1024
+                print(
+                    f"{path:>38}: {requests / elapsed:8.1f} req/s | "
+                    f"{elapsed / requests * 1000:6.2f} ms/req | {size:6.1f} KiB"
+                )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=100)
+    args = parser.parse_args()
+
+    _serialization(args.rows, args.repeat)
+    await _throughput(args.rows, args.requests)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,37 @@
+"""Custo da verificação do token JWT por requisição.
+
+Uso:
+    python -m benchmarks.jwt_auth [--iterations 20000]
+"""
+
+import argparse
+import timeit
+from uuid import uuid4
+
+from src.infrastructure.config import Settings
+from src.infrastructure.security import JWTService
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20_000)
+    args = parser.parse_args()
+
+    print(f"{args.iterations} verificações por cenário")
+    for backend in ("jose", "hmac"):
+        for cache_size in (0, 10_000):
+            settings = Settings(jwt_backend=backend, jwt_cache_size=cache_size)
+            service = JWTService(settings)
+            claims = {"sub": str(uuid4()), "email": "a@b.com"}
+            token = service.create_access_token(claims)
+            assert service.get_user_id_from_token(token) is not None
+
+            seconds = timeit.timeit(
+                lambda: service.get_user_id_from_token(token), number=args.iterations
+            )
+            label = f"{backend}, {'com' if cache_size else 'sem'} cache"
+            print(f"{label:>17}: {seconds / args.iterations * 1e6:8.2f} µs/requisição")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""Custo de mapear uma página de 1000 transações até os DTOs de resposta.
+
+Compara o caminho ORM (TransactionModel -> Transaction -> model_validate)
+com o caminho atual (colunas via Core -> Transaction -> TypeAdapter da lista).
+
+Uso:
+    python -m benchmarks.read_mapping [--rows 1000] [--repeat 50]
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Awaitable, Callable
+from uuid import uuid4
+
+from sqlalchemy import insert, select
+
+from src.application.dtos import TransactionResponseDTO
+from src.application.use_cases import GetTransactionsUseCase
+from src.domain.entities import TransactionType
+from src.infrastructure.config import Settings
+from src.infrastructure.database import Database, TransactionModel, UserModel
+from src.infrastructure.database.repositories import TransactionRepositoryImpl
+
+
+async def _measure(
+    page: Callable[[], Awaitable[list[TransactionResponseDTO]]], repeat: int
+) -> tuple[float, int, int]:
+    await page()
+
+    start = time.process_time()
+    for _ in range(repeat):
+        await page()
+    cpu_ms = (time.process_time() - start) / repeat * 1000
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    dtos = await page()
+    after = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    del dtos
+    return cpu_ms, peak, blocks
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    database = Database(f"sqlite+aiosqlite:///{path}", Settings())
+    await database.create_tables()
+
+    user_id = uuid4()
+    now = datetime(2026, 1, 1)
+    async for session in database.get_session():
+        session.add(
+            UserModel(
+                id=user_id,
+                email="bench@example.com",
+                name="Bench",
+                hashed_password="x",
+            )
+        )
+        await session.flush()
+        await session.execute(
+            insert(TransactionModel),
+            [
+                {
+                    "id": uuid4(),
+                    "description": f"Transação {i}",
+                    "amount": Decimal("10.50") + i,
+                    "type": (
+                        TransactionType.EXPENSE if i % 3 else TransactionType.INCOME
+                    ),
+                    "date": now + timedelta(hours=i),
+                    "user_id": user_id,
+                    "created_at": now,
+                }
+                for i in range(args.rows)
+            ],
+        )
+
+    async for session in database.get_session():
+        repository = TransactionRepositoryImpl(session)
+        use_case = GetTransactionsUseCase(repository)
+
+        async def orm_page() -> list[TransactionResponseDTO]:
+            result = await session.execute(
+                select(TransactionModel)
+                .where(TransactionModel.user_id == user_id)
+                .order_by(TransactionModel.date.desc(), TransactionModel.id.desc())
+                .limit(args.rows)
+            )
+            models = result.scalars().all()
+            session.expunge_all()
+            return [
+                TransactionResponseDTO.model_validate(repository._to_entity(m))
+                for m in models
+            ]
+
+        async def core_page() -> list[TransactionResponseDTO]:
+            return await use_case.execute(user_id, limit=args.rows)
+
+        print(f"Página de {args.rows} transações, média de {args.repeat} execuções")
+        for name, page in (("ORM", orm_page), ("Core", core_page)):
+            cpu_ms, peak, blocks = await _measure(page, args.repeat)
+            print(
+                f"{name:>5}: {cpu_ms:7.2f} ms de CPU | pico {peak / 1024:8.1f} KiB | "
+                f"{blocks:6d} blocos retidos"
+            )
+
+    await database.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
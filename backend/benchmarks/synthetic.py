@@ -0,0 +1,374 @@
+"""Gerador determinístico de dados sintéticos para benchmarks e testes de carga.
+
+Cria N usuários, cada um com M categorias, K transações distribuídas em Y
+anos, orçamentos do último ano e algumas regras recorrentes, usando INSERTs
+em lote, e reconstrói os rollups e o índice de busca. A mesma semente gera
+sempre os mesmos IDs, valores e datas.
+
+Uso:
+    python -m benchmarks.synthetic --database-url sqlite+aiosqlite:///./bench.db \\
+        [--users 20] [--categories 12] [--transactions 5000] [--years 3] [--seed 42]
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any, Iterator
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy import exc, func, insert, select
+
+from src.domain.entities import RecurrenceFrequency, RecurringRule, TransactionType
+from src.infrastructure.config import Settings
+from src.infrastructure.database import (
+    BudgetModel,
+    CategoryModel,
+    Database,
+    RecurringRuleModel,
+    TransactionModel,
+    UserModel,
+)
+from src.infrastructure.database.rollups import MonthlyRollupStore
+from src.infrastructure.database.search import TransactionSearchIndex
+from src.infrastructure.security import PasswordServiceImpl
+
+PASSWORD = "benchmark-password"
+
+_CATEGORIES = [
+    ("Alimentação", "#ef4444", "utensils"),
+    ("Transporte", "#f97316", "car"),
+    ("Moradia", "#eab308", "home"),
+    ("Saúde", "#22c55e", "heart"),
+    ("Lazer", "#06b6d4", "gamepad"),
+    ("Educação", "#3b82f6", "book"),
+    ("Salário", "#8b5cf6", "briefcase"),
+    ("Investimentos", "#ec4899", "trending-up"),
+    ("Assinaturas", "#14b8a6", "repeat"),
+    ("Compras", "#a855f7", "shopping-bag"),
+    ("Viagens", "#0ea5e9", "plane"),
+    ("Impostos", "#64748b", "file-text"),
+]
+_DESCRIPTIONS = {
+    TransactionType.INCOME: [
+        "Salário",
+        "Freelance",
+        "Reembolso",
+        "Dividendos",
+        "Venda",
+    ],
+    TransactionType.EXPENSE: [
+        "Supermercado",
+        "Restaurante",
+        "Combustível",
+        "Aluguel",
+        "Farmácia",
+        "Cinema",
+        "Mensalidade",
+        "Conta de luz",
+        "Internet",
+        "Padaria",
+    ],
+}
+
+# Fração de transações de receita e sem categoria
+_INCOME_SHARE = 0.2
+_UNCATEGORIZED_SHARE = 0.05
+
+
+@dataclass(slots=True)
+class DatasetSpec:
+    """Tamanho e semente do conjunto de dados sintético."""
+
+    users: int = 20
+    categories: int = 12
+    transactions: int = 5_000  # por usuário
+    years: int = 3
+    end_year: int = 2026  # as transações terminam em 1º de janeiro deste ano
+    recurring_rules: int = 2  # por usuário
+    seed: int = 42
+    batch_size: int = 5_000
+
+    @property
+    def start(self) -> datetime:
+        return datetime(self.end_year - self.years, 1, 1)
+
+    @property
+    def end(self) -> datetime:
+        return datetime(self.end_year, 1, 1)
+
+
+@dataclass(slots=True)
+class SeededUser:
+    """Usuário gerado, com o que o driver de carga precisa para montar requisições."""
+
+    id: UUID
+    email: str
+    category_ids: list[UUID] = field(default_factory=list)
+    transaction_ids: list[UUID] = field(default_factory=list)
+
+
+class _Ids:
+    """UUIDs v4 reproduzíveis a partir da semente."""
+
+    def __init__(self, seed: int) -> None:
+        self._random = random.Random(seed)
+
+    def __call__(self) -> UUID:
+        return UUID(int=self._random.getrandbits(128), version=4)
+
+
+def _batches(rows: list[dict[str, Any]], size: int) -> Iterator[list[dict[str, Any]]]:
+    for start in range(0, len(rows), size):
+        yield rows[start : start + size]
+
+
+def _category_rows(
+    spec: DatasetSpec, user: SeededUser, new_id: _Ids
+) -> list[dict[str, Any]]:
+    rows = []
+    for index in range(spec.categories):
+        name, color, icon = _CATEGORIES[index % len(_CATEGORIES)]
+        if index >= len(_CATEGORIES):
+            name = f"{name} {index // len(_CATEGORIES) + 1}"
+        category_id = new_id()
+        user.category_ids.append(category_id)
+        rows.append(
+            {
+                "id": category_id,
+                "name": name,
+                "color": color,
+                "icon": icon,
+                "user_id": user.id,
+                "created_at": spec.start,
+            }
+        )
+    return rows
+
+
+def _transaction_rows(
+    spec: DatasetSpec, user: SeededUser, rng: np.random.Generator, new_id: _Ids
+) -> list[dict[str, Any]]:
+    count = spec.transactions
+    span = int((spec.end - spec.start).total_seconds())
+    offsets = np.sort(rng.integers(0, span, count)).tolist()
+    income = (rng.random(count) < _INCOME_SHARE).tolist()
+    # Receitas são maiores e mais raras que despesas
+    cents = np.where(
+        income,
+        rng.integers(100_000, 1_500_000, count),
+        rng.lognormal(8.5, 1.0, count).astype(np.int64) + 100,
+    ).tolist()
+    categories = rng.integers(0, max(spec.categories, 1), count).tolist()
+    uncategorized = (rng.random(count) < _UNCATEGORIZED_SHARE).tolist()
+    picks = rng.integers(0, 1 << 16, count).tolist()
+
+    rows = []
+    for i in range(count):
+        type = TransactionType.INCOME if income[i] else TransactionType.EXPENSE
+        descriptions = _DESCRIPTIONS[type]
+        date = spec.start + timedelta(seconds=offsets[i])
+        transaction_id = new_id()
+        user.transaction_ids.append(transaction_id)
+        rows.append(
+            {
+                "id": transaction_id,
+                "description": descriptions[picks[i] % len(descriptions)],
+                "amount": Decimal(cents[i]).scaleb(-2),
+                "type": type,
+                "date": date,
+                "notes": None,
+                "user_id": user.id,
+                "category_id": (
+                    None
+                    if uncategorized[i] or not user.category_ids
+                    else user.category_ids[categories[i]]
+                ),
+                "created_at": date,
+            }
+        )
+    return rows
+
+
+def _budget_rows(
+    spec: DatasetSpec, user: SeededUser, rng: np.random.Generator, new_id: _Ids
+) -> list[dict[str, Any]]:
+    year = spec.end_year - 1
+    amounts = rng.integers(20_000, 300_000, (12, len(user.category_ids))).tolist()
+    return [
+        {
+            "id": new_id(),
+            "amount": Decimal(amounts[month - 1][index]).scaleb(-2),
+            "month": month,
+            "year": year,
+            "user_id": user.id,
+            "category_id": category_id,
+            "created_at": spec.start,
+        }
+        for month in range(1, 13)
+        for index, category_id in enumerate(user.category_ids)
+    ]
+
+
+def _recurring_rule_rows(
+    spec: DatasetSpec, user: SeededUser, rng: np.random.Generator, new_id: _Ids
+) -> list[dict[str, Any]]:
+    rows = []
+    for index in range(spec.recurring_rules):
+        monthly = index % 2 == 0
+        rule = RecurringRule(
+            id=new_id(),
+            user_id=user.id,
+            description="Aluguel" if monthly else "Feira",
+            amount=Decimal(int(rng.integers(5_000, 250_000))).scaleb(-2),
+            type=TransactionType.EXPENSE,
+            frequency=(
+                RecurrenceFrequency.MONTHLY if monthly else RecurrenceFrequency.WEEKLY
+            ),
+            start_date=spec.end,
+            category_id=(
+                user.category_ids[index % len(user.category_ids)]
+                if user.category_ids
+                else None
+            ),
+            created_at=spec.start,
+        )
+        rows.append(
+            {
+                "id": rule.id,
+                "description": rule.description,
+                "amount": rule.amount,
+                "type": rule.type,
+                "frequency": rule.frequency,
+                "interval": rule.interval,
+                "day_of_month": rule.day_of_month,
+                "weekday": rule.weekday,
+                "start_date": rule.start_date,
+                "next_occurrence": rule.next_occurrence,
+                "is_active": rule.is_active,
+                "user_id": rule.user_id,
+                "category_id": rule.category_id,
+                "created_at": rule.created_at,
+            }
+        )
+    return rows
+
+
+async def populate(database: Database, spec: DatasetSpec) -> list[SeededUser]:
+    """Insere o conjunto de dados em um banco vazio e reconstrói os rollups
+    e o índice de busca.
+
+    Todos os usuários compartilham a senha ``PASSWORD``; o hash é calculado
+    uma única vez.
+    """
+    rng = np.random.default_rng(spec.seed)
+    new_id = _Ids(spec.seed)
+    hashed_password = PasswordServiceImpl().hash_password(PASSWORD)
+
+    users = [
+        SeededUser(id=new_id(), email=f"user{index}@benchmark.example.com")
+        for index in range(spec.users)
+    ]
+
+    async for session in database.get_session():
+        await session.execute(
+            insert(UserModel),
+            [
+                {
+                    "id": user.id,
+                    "email": user.email,
+                    "name": f"Usuário {index}",
+                    "hashed_password": hashed_password,
+                    "is_active": True,
+                    "initial_balance": Decimal("1000.00"),
+                    "created_at": spec.start,
+                }
+                for index, user in enumerate(users)
+            ],
+        )
+
+        for user in users:
+            for model, rows in (
+                (CategoryModel, _category_rows(spec, user, new_id)),
+                (TransactionModel, _transaction_rows(spec, user, rng, new_id)),
+                (BudgetModel, _budget_rows(spec, user, rng, new_id)),
+                (RecurringRuleModel, _recurring_rule_rows(spec, user, rng, new_id)),
+            ):
+                for batch in _batches(rows, spec.batch_size):
+                    await session.execute(insert(model), batch)
+
+        await MonthlyRollupStore(session).rebuild()
+        await TransactionSearchIndex(session).rebuild()
+
+    return users
+
+
+async def is_empty(database: Database) -> bool:
+    """Indica se o banco ainda não tem usuários (ou tabelas)."""
+    count = 0
+    try:
+        async for session in database.get_session():
+            result = await session.execute(select(func.count()).select_from(UserModel))
+            count = result.scalar() or 0
+    except exc.DBAPIError:
+        pass
+    return count == 0
+
+
+def add_dataset_arguments(parser: argparse.ArgumentParser) -> None:
+    """Opções de linha de comando do DatasetSpec, também usadas pelo driver de carga."""
+    defaults = DatasetSpec()
+    parser.add_argument("--users", type=int, default=defaults.users)
+    parser.add_argument("--categories", type=int, default=defaults.categories)
+    parser.add_argument(
+        "--transactions", type=int, default=defaults.transactions, help="por usuário"
+    )
+    parser.add_argument("--years", type=int, default=defaults.years)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+
+
+def dataset_spec(args: argparse.Namespace) -> DatasetSpec:
+    return DatasetSpec(
+        users=args.users,
+        categories=args.categories,
+        transactions=args.transactions,
+        years=args.years,
+        seed=args.seed,
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", required=True)
+    add_dataset_arguments(parser)
+    parser.add_argument(
+        "--reset",
+        action="store_true",
+        help="apaga e recria as tabelas antes de inserir",
+    )
+    args = parser.parse_args()
+
+    spec = dataset_spec(args)
+    database = Database(args.database_url, Settings(database_url=args.database_url))
+    if args.reset:
+        await database.drop_tables()
+    elif not await is_empty(database):
+        parser.error("o banco já tem usuários; use --reset para recriar as tabelas")
+    await database.create_tables()
+
+    start = time.perf_counter()
+    await populate(database, spec)
+    elapsed = time.perf_counter() - start
+    await database.dispose()
+
+    rows = spec.users * spec.transactions
+    print(f"{rows} transações de {spec.users} usuários em {elapsed:.1f} s")
+    print(asdict(spec))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,102 @@
+"""Busca textual de transações: índice (FTS5/tsvector) contra LIKE '%termo%'.
+
+Popula um banco com o gerador sintético (ou usa um já populado) e mede, para
+termos comuns, prefixos e termos inexistentes, a página de 50 resultados de
+``TransactionRepositoryImpl.search`` e a consulta LIKE equivalente.
+
+Uso:
+    python -m benchmarks.transaction_search [--rows 1000000] [--repeat 10]
+    python -m benchmarks.transaction_search --database-url sqlite+aiosqlite:///./bench.db
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import tempfile
+import time
+from typing import Awaitable, Callable
+
+from sqlalchemy import func, or_, select
+
+from benchmarks.synthetic import DatasetSpec, is_empty, populate
+from src.infrastructure.config import Settings
+from src.infrastructure.database import Database, TransactionModel, UserModel
+from src.infrastructure.database.repositories import TransactionRepositoryImpl
+
+QUERIES = ["supermercado", "conta luz", "farm", "dividendos", "inexistente"]
+
+
+async def _measure(run: Callable[[], Awaitable[int]], repeat: int) -> tuple[float, int]:
+    found = await run()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        await run()
+    return (time.perf_counter() - start) / repeat * 1000, found
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    # As consultas LIKE excedem o limite de consulta lenta e poluiriam a saída
+    logging.getLogger("src.infrastructure.observability").setLevel(logging.ERROR)
+
+    database_url = args.database_url or (
+        f"sqlite+aiosqlite:///{os.path.join(tempfile.mkdtemp(), 'search.db')}"
+    )
+    database = Database(database_url, Settings(database_url=database_url))
+    if await is_empty(database):
+        await database.create_tables()
+        spec = DatasetSpec(users=args.users, transactions=args.rows // args.users)
+        print(f"Populando {spec.users * spec.transactions} transações...")
+        await populate(database, spec)
+
+    async for session in database.get_session():
+        user_id = (await session.execute(select(UserModel.id).limit(1))).scalar_one()
+        total = (
+            await session.execute(
+                select(func.count()).where(TransactionModel.user_id == user_id)
+            )
+        ).scalar_one()
+        repository = TransactionRepositoryImpl(session)
+        print(f"Página de 50 resultados para um usuário com {total} transações")
+
+        for query in QUERIES:
+
+            async def indexed() -> int:
+                return len(await repository.search(user_id, query, limit=50))
+
+            pattern = f"%{query.split()[0]}%"
+            like = (
+                select(TransactionModel.id)
+                .where(
+                    TransactionModel.user_id == user_id,
+                    or_(
+                        TransactionModel.description.ilike(pattern),
+                        TransactionModel.notes.ilike(pattern),
+                    ),
+                )
+                .order_by(TransactionModel.date.desc())
+                .limit(50)
+            )
+
+            async def scan() -> int:
+                return len((await session.execute(like)).all())
+
+            index_ms, index_found = await _measure(indexed, args.repeat)
+            like_ms, like_found = await _measure(scan, args.repeat)
+            print(
+                f"{query!r:>15}: índice {index_ms:8.2f} ms ({index_found:2d}) | "
+                f"LIKE {like_ms:8.2f} ms ({like_found:2d})"
+            )
+
+    await database.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
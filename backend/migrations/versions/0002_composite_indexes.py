@@ -0,0 +1,58 @@
+"""composite indexes for user-scoped access paths
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 04:10:12.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Todas as consultas de transações filtram por user_id primeiro; o índice
+    # isolado em date deixa de ser útil com os índices compostos abaixo.
+    op.drop_index("ix_transactions_date", table_name="transactions")
+    op.create_index(
+        "ix_transactions_user_id_date", "transactions", ["user_id", "date"]
+    )
+    op.create_index(
+        "ix_transactions_user_id_category_id_date",
+        "transactions",
+        ["user_id", "category_id", "date"],
+    )
+    op.create_index(
+        "ix_transactions_user_id_type_date",
+        "transactions",
+        ["user_id", "type", "date"],
+    )
+
+    op.create_index("ix_categories_user_id_name", "categories", ["user_id", "name"])
+
+    op.create_index(
+        "ix_budgets_user_id_year_month", "budgets", ["user_id", "year", "month"]
+    )
+    op.create_index(
+        "uq_budgets_user_id_category_id_year_month",
+        "budgets",
+        ["user_id", "category_id", "year", "month"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_budgets_user_id_category_id_year_month", table_name="budgets")
+    op.drop_index("ix_budgets_user_id_year_month", table_name="budgets")
+    op.drop_index("ix_categories_user_id_name", table_name="categories")
+    op.drop_index("ix_transactions_user_id_type_date", table_name="transactions")
+    op.drop_index(
+        "ix_transactions_user_id_category_id_date", table_name="transactions"
+    )
+    op.drop_index("ix_transactions_user_id_date", table_name="transactions")
+    op.create_index("ix_transactions_date", "transactions", ["date"])
@@ -0,0 +1,29 @@
+"""extend transactions listing index with id for keyset pagination
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 04:25:40.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_transactions_user_id_date_id", "transactions", ["user_id", "date", "id"]
+    )
+    op.drop_index("ix_transactions_user_id_date", table_name="transactions")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_transactions_user_id_date", "transactions", ["user_id", "date"]
+    )
+    op.drop_index("ix_transactions_user_id_date_id", table_name="transactions")
@@ -0,0 +1,75 @@
+"""monthly rollups table
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 04:40:05.000000
+
+"""
+import uuid
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    rollups = op.create_table(
+        "monthly_rollups",
+        sa.Column("user_id", sa.Uuid(), nullable=False),
+        sa.Column("year", sa.Integer(), nullable=False),
+        sa.Column("month", sa.Integer(), nullable=False),
+        sa.Column("category_id", sa.Uuid(), nullable=False),
+        sa.Column(
+            "type",
+            sa.Enum("INCOME", "EXPENSE", name="transactiontype", create_type=False),
+            nullable=False,
+        ),
+        sa.Column("total", sa.Numeric(precision=14, scale=2), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "year", "month", "category_id", "type"),
+    )
+
+    # Popula a tabela a partir das transações existentes. A consulta fica
+    # congelada aqui, como era nesta revisão, em vez de vir do código atual;
+    # transações sem categoria usam o UUID nulo, pois a chave primária não
+    # aceita NULL
+    transactions = sa.table(
+        "transactions",
+        sa.column("id", sa.Uuid()),
+        sa.column("user_id", sa.Uuid()),
+        sa.column("category_id", sa.Uuid()),
+        sa.column("type", sa.String()),
+        sa.column("amount", sa.Numeric(precision=14, scale=2)),
+        sa.column("date", sa.DateTime()),
+    )
+    year = sa.extract("year", transactions.c.date)
+    month = sa.extract("month", transactions.c.date)
+    category_id = sa.func.coalesce(
+        transactions.c.category_id, sa.literal(uuid.UUID(int=0), sa.Uuid())
+    )
+    op.execute(
+        sa.insert(rollups).from_select(
+            ["user_id", "year", "month", "category_id", "type", "total", "count"],
+            sa.select(
+                transactions.c.user_id,
+                year,
+                month,
+                category_id,
+                transactions.c.type,
+                sa.func.sum(transactions.c.amount),
+                sa.func.count(transactions.c.id),
+            ).group_by(
+                transactions.c.user_id, year, month, category_id, transactions.c.type
+            ),
+        )
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("monthly_rollups")
@@ -0,0 +1,91 @@
+"""recurring rules table and occurrence key on transactions
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 09:12:37.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "recurring_rules",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("description", sa.String(length=200), nullable=False),
+        sa.Column("amount", sa.Numeric(precision=12, scale=2), nullable=False),
+        sa.Column(
+            "type",
+            sa.Enum("INCOME", "EXPENSE", name="transactiontype", create_type=False),
+            nullable=False,
+        ),
+        sa.Column(
+            "frequency",
+            sa.Enum("WEEKLY", "MONTHLY", name="recurrencefrequency"),
+            nullable=False,
+        ),
+        sa.Column("interval", sa.Integer(), nullable=False),
+        sa.Column("day_of_month", sa.Integer(), nullable=True),
+        sa.Column("weekday", sa.Integer(), nullable=True),
+        sa.Column("start_date", sa.DateTime(), nullable=False),
+        sa.Column("end_date", sa.DateTime(), nullable=True),
+        sa.Column("next_occurrence", sa.DateTime(), nullable=True),
+        sa.Column("notes", sa.String(length=500), nullable=True),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.Column("user_id", sa.Uuid(), nullable=False),
+        sa.Column("category_id", sa.Uuid(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["category_id"], ["categories.id"], ondelete="SET NULL"
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_recurring_rules_user_id", "recurring_rules", ["user_id"])
+    op.create_index(
+        "ix_recurring_rules_is_active_next_occurrence",
+        "recurring_rules",
+        ["is_active", "next_occurrence"],
+    )
+
+    with op.batch_alter_table("transactions") as batch_op:
+        batch_op.add_column(sa.Column("recurring_rule_id", sa.Uuid(), nullable=True))
+        batch_op.add_column(sa.Column("occurrence_date", sa.Date(), nullable=True))
+        batch_op.create_foreign_key(
+            "fk_transactions_recurring_rule_id",
+            "recurring_rules",
+            ["recurring_rule_id"],
+            ["id"],
+            ondelete="SET NULL",
+        )
+        batch_op.create_index(
+            "uq_transactions_recurring_rule_id_occurrence_date",
+            ["recurring_rule_id", "occurrence_date"],
+            unique=True,
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("transactions") as batch_op:
+        batch_op.drop_index("uq_transactions_recurring_rule_id_occurrence_date")
+        batch_op.drop_constraint(
+            "fk_transactions_recurring_rule_id", type_="foreignkey"
+        )
+        batch_op.drop_column("occurrence_date")
+        batch_op.drop_column("recurring_rule_id")
+
+    op.drop_index(
+        "ix_recurring_rules_is_active_next_occurrence", table_name="recurring_rules"
+    )
+    op.drop_index("ix_recurring_rules_user_id", table_name="recurring_rules")
+    op.drop_table("recurring_rules")
+    sa.Enum(name="recurrencefrequency").drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,55 @@
+"""full-text search index over transaction descriptions and notes
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18 14:05:12.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Congelados como nesta revisão; a expressão do índice precisa ser idêntica à
+# de transaction_search_vector() para que o PostgreSQL o use
+SEARCH_VECTOR = (
+    "setweight(to_tsvector('simple', description), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(notes, '')), 'B')"
+)
+TRANSACTIONS_FTS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS transactions_fts USING fts5("
+    "description, notes, user_id, transaction_id, "
+    "tokenize = 'unicode61 remove_diacritics 2')"
+)
+POPULATE_FTS = (
+    "INSERT INTO transactions_fts (description, notes, user_id, transaction_id) "
+    "SELECT description, coalesce(notes, ''), user_id, id FROM transactions"
+)
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name == "postgresql":
+        op.create_index(
+            "ix_transactions_search",
+            "transactions",
+            [sa.text(f"({SEARCH_VECTOR})")],
+            postgresql_using="gin",
+        )
+        return
+
+    # SQLite: tabela FTS5 populada com as transações existentes
+    op.execute(TRANSACTIONS_FTS_DDL)
+    op.execute(POPULATE_FTS)
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name == "postgresql":
+        op.drop_index("ix_transactions_search", table_name="transactions")
+        return
+
+    op.execute("DROP TABLE IF EXISTS transactions_fts")
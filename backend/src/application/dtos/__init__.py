@@ -1,8 +1,31 @@
 from .user_dto import UserCreateDTO, UserResponseDTO, UserUpdateDTO
-from .transaction_dto import TransactionCreateDTO, TransactionResponseDTO, TransactionUpdateDTO
+from .transaction_dto import (
+    TransactionBulkChangesDTO,
+    TransactionBulkDeleteDTO,
+    TransactionBulkResultDTO,
+    TransactionBulkUpdateDTO,
+    TransactionCreateDTO,
+    TransactionFilterDTO,
+    TransactionImportErrorDTO,
+    TransactionImportResultDTO,
+    TransactionPageDTO,
+    TransactionResponseDTO,
+    TransactionUpdateDTO,
+)
 from .category_dto import CategoryCreateDTO, CategoryResponseDTO, CategoryUpdateDTO
 from .budget_dto import BudgetCreateDTO, BudgetResponseDTO, BudgetUpdateDTO
+from .recurring_rule_dto import (
+    RecurringRuleCreateDTO,
+    RecurringRuleResponseDTO,
+    RecurringRuleUpdateDTO,
+)
 from .auth_dto import LoginDTO, TokenDTO
+from .analytics_dto import (
+    CashflowDTO,
+    CashflowPointDTO,
+    CategoryBreakdownDTO,
+    CategoryBreakdownItemDTO,
+)
 
 __all__ = [
     "UserCreateDTO",
@@ -10,13 +33,28 @@ __all__ = [
     "UserUpdateDTO",
     "TransactionCreateDTO",
     "TransactionResponseDTO",
+    "TransactionPageDTO",
+    "TransactionImportErrorDTO",
+    "TransactionImportResultDTO",
     "TransactionUpdateDTO",
+    "TransactionFilterDTO",
+    "TransactionBulkChangesDTO",
+    "TransactionBulkUpdateDTO",
+    "TransactionBulkDeleteDTO",
+    "TransactionBulkResultDTO",
     "CategoryCreateDTO",
     "CategoryResponseDTO",
     "CategoryUpdateDTO",
     "BudgetCreateDTO",
     "BudgetResponseDTO",
     "BudgetUpdateDTO",
+    "RecurringRuleCreateDTO",
+    "RecurringRuleResponseDTO",
+    "RecurringRuleUpdateDTO",
     "LoginDTO",
     "TokenDTO",
+    "CashflowDTO",
+    "CashflowPointDTO",
+    "CategoryBreakdownDTO",
+    "CategoryBreakdownItemDTO",
 ]
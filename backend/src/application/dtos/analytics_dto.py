@@ -0,0 +1,50 @@
+from datetime import date
+from decimal import Decimal
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from src.domain.entities import AggregationPeriod, TransactionType
+
+
+class CashflowPointDTO(BaseModel):
+    """DTO para um período do fluxo de caixa."""
+
+    period_start: date
+    income: Decimal
+    expense: Decimal
+    net: Decimal
+    balance: Decimal
+    moving_average: Optional[Decimal] = None
+
+
+class CashflowDTO(BaseModel):
+    """DTO para resposta do fluxo de caixa."""
+
+    period: AggregationPeriod
+    window: int
+    opening_balance: Decimal
+    closing_balance: Decimal
+    points: list[CashflowPointDTO]
+
+
+class CategoryBreakdownItemDTO(BaseModel):
+    """DTO para o total de uma categoria, com a série por período."""
+
+    category_id: Optional[UUID]
+    name: str
+    total: Decimal
+    share: float
+    series: list[Decimal]
+
+
+class CategoryBreakdownDTO(BaseModel):
+    """DTO para resposta da distribuição por categoria."""
+
+    period: AggregationPeriod
+    type: TransactionType
+    periods: list[date]
+    total: Decimal
+    categories: list[CategoryBreakdownItemDTO]
+    other: Optional[CategoryBreakdownItemDTO] = None
@@ -0,0 +1,59 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from src.domain.entities import RecurrenceFrequency, TransactionType
+
+
+class RecurringRuleCreateDTO(BaseModel):
+    """DTO para criação de regra recorrente."""
+
+    description: str = Field(..., min_length=1, max_length=200)
+    amount: Decimal = Field(..., gt=0, decimal_places=2)
+    type: TransactionType
+    category_id: Optional[UUID] = None
+    notes: Optional[str] = Field(None, max_length=500)
+    frequency: RecurrenceFrequency
+    interval: int = Field(1, ge=1, le=52)
+    day_of_month: Optional[int] = Field(None, ge=1, le=31)
+    weekday: Optional[int] = Field(None, ge=0, le=6)
+    start_date: datetime
+    end_date: Optional[datetime] = None
+
+
+class RecurringRuleUpdateDTO(BaseModel):
+    """DTO para atualização de regra recorrente."""
+
+    description: Optional[str] = Field(None, min_length=1, max_length=200)
+    amount: Optional[Decimal] = Field(None, gt=0, decimal_places=2)
+    category_id: Optional[UUID] = None
+    notes: Optional[str] = Field(None, max_length=500)
+    end_date: Optional[datetime] = None
+    is_active: Optional[bool] = None
+
+
+class RecurringRuleResponseDTO(BaseModel):
+    """DTO para resposta de regra recorrente."""
+
+    id: UUID
+    user_id: UUID
+    description: str
+    amount: Decimal
+    type: TransactionType
+    category_id: Optional[UUID]
+    notes: Optional[str]
+    frequency: RecurrenceFrequency
+    interval: int
+    day_of_month: Optional[int]
+    weekday: Optional[int]
+    start_date: datetime
+    end_date: Optional[datetime]
+    next_occurrence: Optional[datetime]
+    is_active: bool
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+    model_config = {"from_attributes": True}
@@ -1,9 +1,9 @@
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
+from typing import Optional, Self
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 from src.domain.entities import TransactionType
 
@@ -45,3 +45,75 @@ class TransactionResponseDTO(BaseModel):
     updated_at: Optional[datetime] = None
 
     model_config = {"from_attributes": True}
+
+
+class TransactionPageDTO(BaseModel):
+    """DTO para uma página de transações paginada por cursor."""
+
+    items: list[TransactionResponseDTO]
+    next_cursor: Optional[str] = None
+
+
+class TransactionImportErrorDTO(BaseModel):
+    """DTO para erro de uma linha da importação."""
+
+    row: int
+    message: str
+
+
+class TransactionImportResultDTO(BaseModel):
+    """DTO para resultado de importação de transações."""
+
+    imported: int
+    failed: int
+    errors: list[TransactionImportErrorDTO]
+
+
+class TransactionFilterDTO(BaseModel):
+    """DTO para filtro de transações em operações em lote."""
+
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    type: Optional[TransactionType] = None
+    category_id: Optional[UUID] = None
+
+
+class TransactionBulkDeleteDTO(BaseModel):
+    """DTO para remoção em lote, por ids ou por filtro."""
+
+    ids: Optional[list[UUID]] = Field(None, min_length=1, max_length=1000)
+    filter: Optional[TransactionFilterDTO] = None
+
+    @model_validator(mode="after")
+    def _check_selection(self) -> Self:
+        if (self.ids is None) == (self.filter is None):
+            raise ValueError("Informe ids ou filter")
+        return self
+
+
+class TransactionBulkChangesDTO(BaseModel):
+    """Campos alteráveis em lote; category_id nulo remove a categoria."""
+
+    category_id: Optional[UUID] = None
+    type: Optional[TransactionType] = None
+    notes: Optional[str] = Field(None, max_length=500)
+
+
+class TransactionBulkUpdateDTO(TransactionBulkDeleteDTO):
+    """DTO para atualização em lote, por ids ou por filtro."""
+
+    changes: TransactionBulkChangesDTO
+
+    @model_validator(mode="after")
+    def _check_changes(self) -> Self:
+        if not self.changes.model_fields_set:
+            raise ValueError("Informe ao menos um campo em changes")
+        if "type" in self.changes.model_fields_set and self.changes.type is None:
+            raise ValueError("type não pode ser nulo")
+        return self
+
+
+class TransactionBulkResultDTO(BaseModel):
+    """DTO para resultado de operação em lote."""
+
+    affected: int
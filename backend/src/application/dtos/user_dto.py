@@ -1,4 +1,5 @@
 from datetime import datetime
+from decimal import Decimal
 from typing import Optional
 from uuid import UUID
 
@@ -17,6 +18,7 @@ class UserUpdateDTO(BaseModel):
     """DTO para atualização de usuário."""
 
     name: Optional[str] = Field(None, min_length=2, max_length=100)
+    initial_balance: Optional[Decimal] = Field(None, max_digits=12, decimal_places=2)
 
 
 class UserResponseDTO(BaseModel):
@@ -26,6 +28,7 @@ class UserResponseDTO(BaseModel):
     email: str
     name: str
     is_active: bool
+    initial_balance: Decimal
     created_at: datetime
     updated_at: Optional[datetime] = None
 
@@ -2,9 +2,14 @@ from .user_use_cases import CreateUserUseCase, GetUserUseCase, UpdateUserUseCase
 from .auth_use_cases import LoginUseCase
 from .transaction_use_cases import (
     CreateTransactionUseCase,
+    ImportTransactionsUseCase,
     GetTransactionsUseCase,
+    GetTransactionsPageUseCase,
+    SearchTransactionsUseCase,
     UpdateTransactionUseCase,
     DeleteTransactionUseCase,
+    BulkUpdateTransactionsUseCase,
+    BulkDeleteTransactionsUseCase,
     GetTransactionSummaryUseCase,
 )
 from .category_use_cases import (
@@ -19,6 +24,13 @@ from .budget_use_cases import (
     UpdateBudgetUseCase,
     DeleteBudgetUseCase,
 )
+from .recurring_rule_use_cases import (
+    CreateRecurringRuleUseCase,
+    GetRecurringRulesUseCase,
+    UpdateRecurringRuleUseCase,
+    DeleteRecurringRuleUseCase,
+    MaterializeRecurringRulesUseCase,
+)
 
 __all__ = [
     "CreateUserUseCase",
@@ -26,9 +38,14 @@ __all__ = [
     "UpdateUserUseCase",
     "LoginUseCase",
     "CreateTransactionUseCase",
+    "ImportTransactionsUseCase",
     "GetTransactionsUseCase",
+    "GetTransactionsPageUseCase",
+    "SearchTransactionsUseCase",
     "UpdateTransactionUseCase",
     "DeleteTransactionUseCase",
+    "BulkUpdateTransactionsUseCase",
+    "BulkDeleteTransactionsUseCase",
     "GetTransactionSummaryUseCase",
     "CreateCategoryUseCase",
     "GetCategoriesUseCase",
@@ -38,4 +55,9 @@ __all__ = [
     "GetBudgetsUseCase",
     "UpdateBudgetUseCase",
     "DeleteBudgetUseCase",
+    "CreateRecurringRuleUseCase",
+    "GetRecurringRulesUseCase",
+    "UpdateRecurringRuleUseCase",
+    "DeleteRecurringRuleUseCase",
+    "MaterializeRecurringRulesUseCase",
 ]
@@ -25,7 +25,9 @@ class LoginUseCase:
         if not user:
             return None
 
-        if not self._password_service.verify_password(dto.password, user.hashed_password):
+        if not await self._password_service.verify_password_async(
+            dto.password, user.hashed_password
+        ):
             return None
 
         if not user.is_active:
@@ -60,14 +60,16 @@ class GetBudgetsUseCase:
         else:
             end_date = datetime(year, month + 1, 1)
 
+        spent_by_category = await self._transaction_repository.get_totals_by_categories(
+            user_id=user_id,
+            category_ids=[budget.category_id for budget in budgets],
+            start_date=start_date,
+            end_date=end_date,
+        )
+
         results = []
         for budget in budgets:
-            spent = await self._transaction_repository.get_total_by_category(
-                user_id=user_id,
-                category_id=budget.category_id,
-                start_date=start_date,
-                end_date=end_date,
-            )
+            spent = spent_by_category[budget.category_id]
 
             budget_dto = BudgetResponseDTO.model_validate(budget)
             budget_dto.spent = spent
@@ -106,9 +108,4 @@ class DeleteBudgetUseCase:
         self._budget_repository = budget_repository
 
     async def execute(self, budget_id: UUID, user_id: UUID) -> bool:
-        budget = await self._budget_repository.get_by_id(budget_id)
-
-        if not budget or budget.user_id != user_id:
-            return False
-
-        return await self._budget_repository.delete(budget_id)
+        return await self._budget_repository.delete(budget_id, user_id)
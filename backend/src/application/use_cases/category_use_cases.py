@@ -1,11 +1,16 @@
 from typing import Optional
 from uuid import UUID
 
+from pydantic import TypeAdapter
+
 from src.application.dtos import CategoryCreateDTO, CategoryResponseDTO, CategoryUpdateDTO
 from src.domain.entities import Category
 from src.domain.repositories import CategoryRepository
 
 
+_CATEGORY_LIST = TypeAdapter(list[CategoryResponseDTO])
+
+
 class CreateCategoryUseCase:
     """Caso de uso para criação de categoria."""
 
@@ -32,7 +37,7 @@ class GetCategoriesUseCase:
 
     async def execute(self, user_id: UUID) -> list[CategoryResponseDTO]:
         categories = await self._category_repository.get_all_by_user(user_id)
-        return [CategoryResponseDTO.model_validate(c) for c in categories]
+        return _CATEGORY_LIST.validate_python(categories, from_attributes=True)
 
 
 class UpdateCategoryUseCase:
@@ -61,9 +66,4 @@ class DeleteCategoryUseCase:
         self._category_repository = category_repository
 
     async def execute(self, category_id: UUID, user_id: UUID) -> bool:
-        category = await self._category_repository.get_by_id(category_id)
-
-        if not category or category.user_id != user_id:
-            return False
-
-        return await self._category_repository.delete(category_id)
+        return await self._category_repository.delete(category_id, user_id)
@@ -0,0 +1,122 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from src.application.dtos import (
+    RecurringRuleCreateDTO,
+    RecurringRuleResponseDTO,
+    RecurringRuleUpdateDTO,
+)
+from src.domain.entities import RecurringRule
+from src.domain.repositories import RecurringRuleRepository, TransactionRepository
+
+
+class CreateRecurringRuleUseCase:
+    """Caso de uso para criação de regra recorrente."""
+
+    def __init__(self, rule_repository: RecurringRuleRepository):
+        self._rule_repository = rule_repository
+
+    async def execute(
+        self, user_id: UUID, dto: RecurringRuleCreateDTO
+    ) -> RecurringRuleResponseDTO:
+        rule = RecurringRule(
+            user_id=user_id,
+            description=dto.description,
+            amount=dto.amount,
+            type=dto.type,
+            category_id=dto.category_id,
+            notes=dto.notes,
+            frequency=dto.frequency,
+            interval=dto.interval,
+            day_of_month=dto.day_of_month,
+            weekday=dto.weekday,
+            start_date=dto.start_date,
+            end_date=dto.end_date,
+        )
+
+        created_rule = await self._rule_repository.create(rule)
+        return RecurringRuleResponseDTO.model_validate(created_rule)
+
+
+class GetRecurringRulesUseCase:
+    """Caso de uso para listar regras recorrentes."""
+
+    def __init__(self, rule_repository: RecurringRuleRepository):
+        self._rule_repository = rule_repository
+
+    async def execute(self, user_id: UUID) -> list[RecurringRuleResponseDTO]:
+        rules = await self._rule_repository.get_all_by_user(user_id)
+        return [RecurringRuleResponseDTO.model_validate(rule) for rule in rules]
+
+
+class UpdateRecurringRuleUseCase:
+    """Caso de uso para atualizar regra recorrente."""
+
+    def __init__(self, rule_repository: RecurringRuleRepository):
+        self._rule_repository = rule_repository
+
+    async def execute(
+        self, rule_id: UUID, user_id: UUID, dto: RecurringRuleUpdateDTO
+    ) -> Optional[RecurringRuleResponseDTO]:
+        rule = await self._rule_repository.get_by_id(rule_id)
+
+        if not rule or rule.user_id != user_id:
+            return None
+
+        rule.update(
+            description=dto.description,
+            amount=dto.amount,
+            category_id=dto.category_id,
+            notes=dto.notes,
+            end_date=dto.end_date,
+            is_active=dto.is_active,
+        )
+
+        updated_rule = await self._rule_repository.update(rule)
+        return RecurringRuleResponseDTO.model_validate(updated_rule)
+
+
+class DeleteRecurringRuleUseCase:
+    """Caso de uso para deletar regra recorrente."""
+
+    def __init__(self, rule_repository: RecurringRuleRepository):
+        self._rule_repository = rule_repository
+
+    async def execute(self, rule_id: UUID, user_id: UUID) -> bool:
+        return await self._rule_repository.delete(rule_id, user_id)
+
+
+class MaterializeRecurringRulesUseCase:
+    """Caso de uso que gera as transações pendentes das regras recorrentes.
+
+    Processa um lote limitado: até ``rule_limit`` regras e, de cada uma, até
+    ``occurrence_limit`` ocorrências. Regras muito atrasadas continuam nos
+    lotes seguintes a partir de onde pararam.
+    """
+
+    def __init__(
+        self,
+        rule_repository: RecurringRuleRepository,
+        transaction_repository: TransactionRepository,
+        rule_limit: int = 200,
+        occurrence_limit: int = 24,
+    ):
+        self._rule_repository = rule_repository
+        self._transaction_repository = transaction_repository
+        self._rule_limit = rule_limit
+        self._occurrence_limit = occurrence_limit
+
+    async def execute(self, now: datetime) -> tuple[int, int]:
+        """Retorna (regras processadas, transações criadas)."""
+        rules = await self._rule_repository.get_due(now, self._rule_limit)
+
+        occurrences = [
+            (rule.id, rule.build_transaction(occurrence))
+            for rule in rules
+            for occurrence in rule.advance(now, self._occurrence_limit)
+        ]
+
+        created = await self._transaction_repository.create_occurrences(occurrences)
+        await self._rule_repository.update_next_occurrences(rules)
+        return len(rules), created
@@ -1,17 +1,29 @@
+import base64
+import binascii
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
+from typing import Any, Iterable, Optional
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from src.application.dtos import (
+    TransactionBulkDeleteDTO,
+    TransactionBulkResultDTO,
+    TransactionBulkUpdateDTO,
     TransactionCreateDTO,
+    TransactionImportErrorDTO,
+    TransactionImportResultDTO,
+    TransactionPageDTO,
     TransactionResponseDTO,
     TransactionUpdateDTO,
 )
 from src.domain.entities import Transaction, TransactionType
-from src.domain.repositories import TransactionRepository
+from src.domain.repositories import CategoryRepository, TransactionRepository
+
+# Valida a lista inteira em uma única chamada ao pydantic-core, bem mais
+# barato que model_validate linha a linha
+_TRANSACTION_LIST = TypeAdapter(list[TransactionResponseDTO])
 
 
 class TransactionSummaryDTO(BaseModel):
@@ -23,6 +35,30 @@ class TransactionSummaryDTO(BaseModel):
     transaction_count: int
 
 
+class MonthlySummaryDTO(BaseModel):
+    """DTO para os totais de um mês no gráfico anual."""
+
+    name: str
+    receitas: Decimal
+    despesas: Decimal
+
+
+def encode_transaction_cursor(date: datetime, transaction_id: UUID) -> str:
+    """Gera um cursor opaco a partir da chave de ordenação (date, id)."""
+    raw = f"{date.isoformat()}|{transaction_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_transaction_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Decodifica um cursor gerado por encode_transaction_cursor."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        date, transaction_id = raw.split("|")
+        return datetime.fromisoformat(date), UUID(transaction_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError("Cursor inválido")
+
+
 class CreateTransactionUseCase:
     """Caso de uso para criação de transação."""
 
@@ -46,6 +82,99 @@ class CreateTransactionUseCase:
         return TransactionResponseDTO.model_validate(created_transaction)
 
 
+class ImportTransactionsUseCase:
+    """Caso de uso para importação de transações em lote."""
+
+    MAX_REPORTED_ERRORS = 100
+
+    def __init__(
+        self,
+        transaction_repository: TransactionRepository,
+        category_repository: CategoryRepository,
+        batch_size: int = 1000,
+    ):
+        self._transaction_repository = transaction_repository
+        self._category_repository = category_repository
+        self._batch_size = batch_size
+
+    async def _save(
+        self, user_id: UUID, batch: list[tuple[int, Transaction]]
+    ) -> tuple[int, list[int]]:
+        """Grava o lote e retorna (gravadas, linhas recusadas): categorias
+        inexistentes ou de outro usuário não chegam ao banco."""
+        owned = await self._category_repository.get_owned_ids(
+            user_id, {t.category_id for _, t in batch if t.category_id}
+        )
+        valid: list[Transaction] = []
+        rejected: list[int] = []
+        for row_number, transaction in batch:
+            if transaction.category_id and transaction.category_id not in owned:
+                rejected.append(row_number)
+            else:
+                valid.append(transaction)
+
+        return await self._transaction_repository.create_many(valid), rejected
+
+    async def execute(
+        self, user_id: UUID, rows: Iterable[tuple[int, dict[str, Any]]]
+    ) -> TransactionImportResultDTO:
+        imported = 0
+        failed = 0
+        errors: list[TransactionImportErrorDTO] = []
+        batch: list[tuple[int, Transaction]] = []
+
+        def report(row_number: int, message: str) -> None:
+            nonlocal failed
+            failed += 1
+            if len(errors) < self.MAX_REPORTED_ERRORS:
+                errors.append(
+                    TransactionImportErrorDTO(row=row_number, message=message)
+                )
+
+        async def flush() -> None:
+            nonlocal imported
+            saved, rejected = await self._save(user_id, batch)
+            imported += saved
+            for row_number in rejected:
+                report(row_number, "category_id: Categoria não encontrada")
+            batch.clear()
+
+        for row_number, data in rows:
+            try:
+                dto = TransactionCreateDTO.model_validate(data)
+            except ValidationError as e:
+                report(
+                    row_number,
+                    "; ".join(
+                        f"{'.'.join(str(loc) for loc in err['loc'])}: {err['msg']}"
+                        for err in e.errors()
+                    ),
+                )
+                continue
+
+            transaction = Transaction(
+                description=dto.description,
+                amount=dto.amount,
+                type=dto.type,
+                user_id=user_id,
+                category_id=dto.category_id,
+                date=dto.date or datetime.utcnow(),
+                notes=dto.notes,
+            )
+            batch.append((row_number, transaction))
+
+            if len(batch) >= self._batch_size:
+                await flush()
+
+        await flush()
+
+        # Recusas por categoria só surgem ao gravar o lote
+        errors.sort(key=lambda error: error.row)
+        return TransactionImportResultDTO(
+            imported=imported, failed=failed, errors=errors
+        )
+
+
 class GetTransactionsUseCase:
     """Caso de uso para listar transações."""
 
@@ -71,7 +200,65 @@ class GetTransactionsUseCase:
             limit=limit,
             offset=offset,
         )
-        return [TransactionResponseDTO.model_validate(t) for t in transactions]
+        return _TRANSACTION_LIST.validate_python(transactions, from_attributes=True)
+
+
+class SearchTransactionsUseCase:
+    """Caso de uso para buscar transações por texto."""
+
+    def __init__(self, transaction_repository: TransactionRepository):
+        self._transaction_repository = transaction_repository
+
+    async def execute(
+        self, user_id: UUID, query: str, limit: int = 50, offset: int = 0
+    ) -> list[TransactionResponseDTO]:
+        transactions = await self._transaction_repository.search(
+            user_id=user_id, query=query, limit=limit, offset=offset
+        )
+        return _TRANSACTION_LIST.validate_python(transactions, from_attributes=True)
+
+
+class GetTransactionsPageUseCase:
+    """Caso de uso para listar transações com paginação por cursor."""
+
+    def __init__(self, transaction_repository: TransactionRepository):
+        self._transaction_repository = transaction_repository
+
+    async def execute(
+        self,
+        user_id: UUID,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        type: Optional[TransactionType] = None,
+        category_id: Optional[UUID] = None,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+    ) -> TransactionPageDTO:
+        after = decode_transaction_cursor(cursor) if cursor else None
+
+        # Busca um item a mais para saber se existe uma próxima página
+        transactions = await self._transaction_repository.get_all_by_user(
+            user_id=user_id,
+            start_date=start_date,
+            end_date=end_date,
+            type=type,
+            category_id=category_id,
+            limit=limit + 1,
+            offset=offset,
+            after=after,
+        )
+
+        next_cursor = None
+        if len(transactions) > limit:
+            transactions = transactions[:limit]
+            last = transactions[-1]
+            next_cursor = encode_transaction_cursor(last.date, last.id)
+
+        return TransactionPageDTO(
+            items=_TRANSACTION_LIST.validate_python(transactions, from_attributes=True),
+            next_cursor=next_cursor,
+        )
 
 
 class UpdateTransactionUseCase:
@@ -108,12 +295,44 @@ class DeleteTransactionUseCase:
         self._transaction_repository = transaction_repository
 
     async def execute(self, transaction_id: UUID, user_id: UUID) -> bool:
-        transaction = await self._transaction_repository.get_by_id(transaction_id)
+        return await self._transaction_repository.delete(transaction_id, user_id)
 
-        if not transaction or transaction.user_id != user_id:
-            return False
 
-        return await self._transaction_repository.delete(transaction_id)
+class BulkUpdateTransactionsUseCase:
+    """Caso de uso para atualizar transações em lote."""
+
+    def __init__(self, transaction_repository: TransactionRepository):
+        self._transaction_repository = transaction_repository
+
+    async def execute(
+        self, user_id: UUID, dto: TransactionBulkUpdateDTO
+    ) -> TransactionBulkResultDTO:
+        filters = dto.filter.model_dump() if dto.filter else {}
+        affected = await self._transaction_repository.update_many(
+            user_id=user_id,
+            changes=dto.changes.model_dump(exclude_unset=True),
+            ids=dto.ids,
+            **filters,
+        )
+        return TransactionBulkResultDTO(affected=affected)
+
+
+class BulkDeleteTransactionsUseCase:
+    """Caso de uso para remover transações em lote."""
+
+    def __init__(self, transaction_repository: TransactionRepository):
+        self._transaction_repository = transaction_repository
+
+    async def execute(
+        self, user_id: UUID, dto: TransactionBulkDeleteDTO
+    ) -> TransactionBulkResultDTO:
+        filters = dto.filter.model_dump() if dto.filter else {}
+        affected = await self._transaction_repository.delete_many(
+            user_id=user_id,
+            ids=dto.ids,
+            **filters,
+        )
+        return TransactionBulkResultDTO(affected=affected)
 
 
 class GetTransactionSummaryUseCase:
@@ -128,29 +347,15 @@ class GetTransactionSummaryUseCase:
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
     ) -> TransactionSummaryDTO:
-        total_income = await self._transaction_repository.get_total_by_type(
-            user_id=user_id,
-            type=TransactionType.INCOME,
-            start_date=start_date,
-            end_date=end_date,
-        )
-
-        total_expense = await self._transaction_repository.get_total_by_type(
-            user_id=user_id,
-            type=TransactionType.EXPENSE,
-            start_date=start_date,
-            end_date=end_date,
-        )
-
-        transaction_count = await self._transaction_repository.count_by_user(
+        totals = await self._transaction_repository.get_summary(
             user_id=user_id,
             start_date=start_date,
             end_date=end_date,
         )
 
         return TransactionSummaryDTO(
-            total_income=total_income,
-            total_expense=total_expense,
-            balance=total_income - total_expense,
-            transaction_count=transaction_count,
+            total_income=totals.total_income,
+            total_expense=totals.total_expense,
+            balance=totals.balance,
+            transaction_count=totals.transaction_count,
         )
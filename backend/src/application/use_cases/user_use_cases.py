@@ -21,7 +21,7 @@ class CreateUserUseCase:
         if existing_user:
             raise ValueError("Email já cadastrado")
 
-        hashed_password = self._password_service.hash_password(dto.password)
+        hashed_password = await self._password_service.hash_password_async(dto.password)
 
         user = User(
             email=dto.email,
@@ -59,6 +59,8 @@ class UpdateUserUseCase:
 
         if dto.name:
             user.update_name(dto.name)
+        if dto.initial_balance is not None:
+            user.update_initial_balance(dto.initial_balance)
 
         updated_user = await self._user_repository.update(user)
         return UserResponseDTO.model_validate(updated_user)
@@ -2,5 +2,18 @@ from .user import User
 from .transaction import Transaction, TransactionType
 from .category import Category
 from .budget import Budget
+from .recurring_rule import RecurrenceFrequency, RecurringRule
+from .aggregates import AggregationPeriod, PeriodTotals, TransactionTotals
 
-__all__ = ["User", "Transaction", "TransactionType", "Category", "Budget"]
+__all__ = [
+    "User",
+    "Transaction",
+    "TransactionType",
+    "Category",
+    "Budget",
+    "RecurrenceFrequency",
+    "RecurringRule",
+    "AggregationPeriod",
+    "PeriodTotals",
+    "TransactionTotals",
+]
@@ -0,0 +1,37 @@
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+
+
+class AggregationPeriod(str, Enum):
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+    YEAR = "year"
+
+
+@dataclass
+class PeriodTotals:
+    """Totais de receitas e despesas agregados em um período."""
+
+    period_start: datetime
+    total_income: Decimal
+    total_expense: Decimal
+
+    @property
+    def balance(self) -> Decimal:
+        return self.total_income - self.total_expense
+
+
+@dataclass
+class TransactionTotals:
+    """Totais de receitas, despesas e quantidade de transações."""
+
+    total_income: Decimal
+    total_expense: Decimal
+    transaction_count: int
+
+    @property
+    def balance(self) -> Decimal:
+        return self.total_income - self.total_expense
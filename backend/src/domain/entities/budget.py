@@ -5,7 +5,7 @@ from typing import Optional
 from uuid import UUID, uuid4
 
 
-@dataclass
+@dataclass(slots=True)
 class Budget:
     """Entidade de domínio que representa um orçamento mensal."""
 
@@ -26,6 +26,30 @@ class Budget:
         if self.year < 2000:
             raise ValueError("Ano inválido")
 
+    @classmethod
+    def rehydrate(
+        cls,
+        id: UUID,
+        user_id: UUID,
+        category_id: UUID,
+        amount: Decimal,
+        month: int,
+        year: int,
+        created_at: datetime,
+        updated_at: Optional[datetime],
+    ) -> "Budget":
+        """Reconstrói um orçamento já persistido, sem revalidar os dados."""
+        self = object.__new__(cls)
+        self.id = id
+        self.user_id = user_id
+        self.category_id = category_id
+        self.amount = amount
+        self.month = month
+        self.year = year
+        self.created_at = created_at
+        self.updated_at = updated_at
+        return self
+
     def update_amount(self, amount: Decimal) -> None:
         if amount < 0:
             raise ValueError("O valor do orçamento não pode ser negativo")
@@ -4,7 +4,7 @@ from typing import Optional
 from uuid import UUID, uuid4
 
 
-@dataclass
+@dataclass(slots=True)
 class Category:
     """Entidade de domínio que representa uma categoria de transação."""
 
@@ -0,0 +1,198 @@
+import calendar
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from decimal import Decimal
+from enum import Enum
+from typing import Optional
+from uuid import UUID, uuid4
+
+from src.domain.entities.transaction import Transaction, TransactionType
+
+
+class RecurrenceFrequency(str, Enum):
+    WEEKLY = "weekly"
+    MONTHLY = "monthly"
+
+
+@dataclass(slots=True)
+class RecurringRule:
+    """Entidade de domínio que representa uma transação recorrente.
+
+    Semelhante a uma RRULE: a cada ``interval`` semanas (no dia ``weekday``,
+    0 = segunda) ou meses (no dia ``day_of_month``, limitado ao último dia
+    do mês), a partir de ``start_date`` e até ``end_date``, inclusive.
+    ``next_occurrence`` é a próxima ocorrência ainda não gerada; ``None``
+    quando a regra terminou.
+    """
+
+    user_id: UUID
+    description: str
+    amount: Decimal
+    type: TransactionType
+    frequency: RecurrenceFrequency
+    start_date: datetime
+    interval: int = 1
+    day_of_month: Optional[int] = None
+    weekday: Optional[int] = None
+    end_date: Optional[datetime] = None
+    category_id: Optional[UUID] = None
+    notes: Optional[str] = None
+    is_active: bool = True
+    next_occurrence: Optional[datetime] = None
+    id: UUID = field(default_factory=uuid4)
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    updated_at: Optional[datetime] = None
+
+    def __post_init__(self) -> None:
+        if self.amount < 0:
+            raise ValueError("O valor da transação não pode ser negativo")
+        if self.interval < 1:
+            raise ValueError("O intervalo deve ser de pelo menos 1")
+        if self.frequency == RecurrenceFrequency.MONTHLY:
+            self.weekday = None
+            if self.day_of_month is None:
+                self.day_of_month = self.start_date.day
+            if not 1 <= self.day_of_month <= 31:
+                raise ValueError("Dia do mês deve estar entre 1 e 31")
+        else:
+            self.day_of_month = None
+            if self.weekday is None:
+                self.weekday = self.start_date.weekday()
+            if not 0 <= self.weekday <= 6:
+                raise ValueError("Dia da semana deve estar entre 0 e 6")
+        if self.end_date and self.end_date < self.start_date:
+            raise ValueError("A data final deve ser posterior à data inicial")
+        if self.next_occurrence is None:
+            self.next_occurrence = self._first_occurrence()
+
+    @classmethod
+    def rehydrate(
+        cls,
+        id: UUID,
+        user_id: UUID,
+        description: str,
+        amount: Decimal,
+        type: TransactionType,
+        frequency: RecurrenceFrequency,
+        interval: int,
+        day_of_month: Optional[int],
+        weekday: Optional[int],
+        start_date: datetime,
+        end_date: Optional[datetime],
+        next_occurrence: Optional[datetime],
+        category_id: Optional[UUID],
+        notes: Optional[str],
+        is_active: bool,
+        created_at: datetime,
+        updated_at: Optional[datetime],
+    ) -> "RecurringRule":
+        """Reconstrói uma regra já persistida, sem revalidar os dados."""
+        self = object.__new__(cls)
+        self.id = id
+        self.user_id = user_id
+        self.description = description
+        self.amount = amount
+        self.type = type
+        self.frequency = frequency
+        self.interval = interval
+        self.day_of_month = day_of_month
+        self.weekday = weekday
+        self.start_date = start_date
+        self.end_date = end_date
+        self.next_occurrence = next_occurrence
+        self.category_id = category_id
+        self.notes = notes
+        self.is_active = is_active
+        self.created_at = created_at
+        self.updated_at = updated_at
+        return self
+
+    def _within_end(self, occurrence: datetime) -> Optional[datetime]:
+        if self.end_date and occurrence > self.end_date:
+            return None
+        return occurrence
+
+    def _monthly(self, year: int, month: int) -> datetime:
+        # Os padrões de __post_init__: só ficam nulos na outra frequência
+        day_of_month = self.day_of_month or self.start_date.day
+        day = min(day_of_month, calendar.monthrange(year, month)[1])
+        return self.start_date.replace(year=year, month=month, day=day)
+
+    def _first_occurrence(self) -> Optional[datetime]:
+        start = self.start_date
+        if self.frequency == RecurrenceFrequency.WEEKLY:
+            weekday = start.weekday() if self.weekday is None else self.weekday
+            first = start + timedelta(days=(weekday - start.weekday()) % 7)
+        else:
+            first = self._monthly(start.year, start.month)
+            if first < start:
+                first = self._following(first)
+        return self._within_end(first)
+
+    def _following(self, occurrence: datetime) -> datetime:
+        if self.frequency == RecurrenceFrequency.WEEKLY:
+            return occurrence + timedelta(weeks=self.interval)
+        index = occurrence.year * 12 + occurrence.month - 1 + self.interval
+        return self._monthly(index // 12, index % 12 + 1)
+
+    def advance(self, until: datetime, limit: int) -> list[datetime]:
+        """Retorna até ``limit`` ocorrências pendentes até ``until`` e avança
+        ``next_occurrence`` para a seguinte."""
+        occurrences: list[datetime] = []
+        current = self.next_occurrence
+        while current is not None and current <= until and len(occurrences) < limit:
+            occurrences.append(current)
+            current = self._within_end(self._following(current))
+        self.next_occurrence = current
+        return occurrences
+
+    def build_transaction(self, occurrence: datetime) -> Transaction:
+        """Transação correspondente a uma ocorrência da regra."""
+        return Transaction(
+            description=self.description,
+            amount=self.amount,
+            type=self.type,
+            user_id=self.user_id,
+            category_id=self.category_id,
+            date=occurrence,
+            notes=self.notes,
+        )
+
+    def update(
+        self,
+        description: Optional[str] = None,
+        amount: Optional[Decimal] = None,
+        category_id: Optional[UUID] = None,
+        notes: Optional[str] = None,
+        end_date: Optional[datetime] = None,
+        is_active: Optional[bool] = None,
+    ) -> None:
+        if description:
+            self.description = description
+        if amount is not None:
+            if amount < 0:
+                raise ValueError("O valor da transação não pode ser negativo")
+            self.amount = amount
+        if category_id:
+            self.category_id = category_id
+        if notes is not None:
+            self.notes = notes
+        if end_date:
+            if end_date < self.start_date:
+                raise ValueError("A data final deve ser posterior à data inicial")
+            self.end_date = end_date
+            if self.next_occurrence:
+                self.next_occurrence = self._within_end(self.next_occurrence)
+        if is_active is not None:
+            if is_active and not self.is_active:
+                self._skip_paused(datetime.utcnow())
+            self.is_active = is_active
+        self.updated_at = datetime.utcnow()
+
+    def _skip_paused(self, now: datetime) -> None:
+        """Ao reativar, descarta as ocorrências do período em que a regra
+        esteve pausada em vez de gerá-las retroativamente."""
+        current = self.next_occurrence
+        while current is not None and current < now:
+            current = self._within_end(self._following(current))
+        self.next_occurrence = current
@@ -11,7 +11,7 @@ class TransactionType(str, Enum):
     EXPENSE = "expense"
 
 
-@dataclass
+@dataclass(slots=True)
 class Transaction:
     """Entidade de domínio que representa uma transação financeira."""
 
@@ -30,6 +30,34 @@ class Transaction:
         if self.amount < 0:
             raise ValueError("O valor da transação não pode ser negativo")
 
+    @classmethod
+    def rehydrate(
+        cls,
+        id: UUID,
+        description: str,
+        amount: Decimal,
+        type: TransactionType,
+        date: datetime,
+        notes: Optional[str],
+        user_id: UUID,
+        category_id: Optional[UUID],
+        created_at: datetime,
+        updated_at: Optional[datetime],
+    ) -> "Transaction":
+        """Reconstrói uma transação já persistida, sem revalidar os dados."""
+        self = object.__new__(cls)
+        self.id = id
+        self.description = description
+        self.amount = amount
+        self.type = type
+        self.date = date
+        self.notes = notes
+        self.user_id = user_id
+        self.category_id = category_id
+        self.created_at = created_at
+        self.updated_at = updated_at
+        return self
+
     def update(
         self,
         description: Optional[str] = None,
@@ -5,7 +5,7 @@ from typing import Optional
 from uuid import UUID, uuid4
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """Entidade de domínio que representa um usuário do sistema."""
 
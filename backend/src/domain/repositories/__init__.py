@@ -2,5 +2,12 @@ from .user_repository import UserRepository
 from .transaction_repository import TransactionRepository
 from .category_repository import CategoryRepository
 from .budget_repository import BudgetRepository
+from .recurring_rule_repository import RecurringRuleRepository
 
-__all__ = ["UserRepository", "TransactionRepository", "CategoryRepository", "BudgetRepository"]
+__all__ = [
+    "UserRepository",
+    "TransactionRepository",
+    "CategoryRepository",
+    "BudgetRepository",
+    "RecurringRuleRepository",
+]
@@ -38,6 +38,7 @@ class BudgetRepository(ABC):
         pass
 
     @abstractmethod
-    async def delete(self, budget_id: UUID) -> bool:
-        """Remove um orçamento."""
+    async def delete(self, budget_id: UUID, user_id: UUID) -> bool:
+        """Remove um orçamento do usuário; retorna False se não existir ou
+        pertencer a outro usuário."""
         pass
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Iterable, Optional
 from uuid import UUID
 
 from src.domain.entities import Category
@@ -23,12 +23,20 @@ class CategoryRepository(ABC):
         """Busca todas as categorias de um usuário."""
         pass
 
+    @abstractmethod
+    async def get_owned_ids(
+        self, user_id: UUID, category_ids: Iterable[UUID]
+    ) -> set[UUID]:
+        """Retorna, dentre ``category_ids``, os das categorias do usuário."""
+        pass
+
     @abstractmethod
     async def update(self, category: Category) -> Category:
         """Atualiza uma categoria existente."""
         pass
 
     @abstractmethod
-    async def delete(self, category_id: UUID) -> bool:
-        """Remove uma categoria."""
+    async def delete(self, category_id: UUID, user_id: UUID) -> bool:
+        """Remove uma categoria do usuário; retorna False se não existir ou
+        pertencer a outro usuário."""
         pass
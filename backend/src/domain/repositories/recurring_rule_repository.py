@@ -0,0 +1,46 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from src.domain.entities import RecurringRule
+
+
+class RecurringRuleRepository(ABC):
+    """Interface abstrata para o repositório de regras recorrentes."""
+
+    @abstractmethod
+    async def create(self, rule: RecurringRule) -> RecurringRule:
+        """Cria uma nova regra recorrente."""
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, rule_id: UUID) -> Optional[RecurringRule]:
+        """Busca uma regra pelo ID."""
+        pass
+
+    @abstractmethod
+    async def get_all_by_user(self, user_id: UUID) -> list[RecurringRule]:
+        """Busca todas as regras de um usuário."""
+        pass
+
+    @abstractmethod
+    async def get_due(self, until: datetime, limit: int) -> list[RecurringRule]:
+        """Busca regras ativas, de todos os usuários, com ocorrência pendente
+        até ``until``. Regras já reservadas por outro processo são ignoradas."""
+        pass
+
+    @abstractmethod
+    async def update(self, rule: RecurringRule) -> RecurringRule:
+        """Atualiza uma regra existente."""
+        pass
+
+    @abstractmethod
+    async def update_next_occurrences(self, rules: list[RecurringRule]) -> None:
+        """Grava ``next_occurrence`` de várias regras em lote."""
+        pass
+
+    @abstractmethod
+    async def delete(self, rule_id: UUID, user_id: UUID) -> bool:
+        """Remove uma regra do usuário; as transações já geradas são mantidas."""
+        pass
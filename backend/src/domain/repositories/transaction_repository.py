@@ -1,10 +1,16 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
+from typing import Any, AsyncIterator, Optional
 from uuid import UUID
 
-from src.domain.entities import Transaction, TransactionType
+from src.domain.entities import (
+    AggregationPeriod,
+    PeriodTotals,
+    Transaction,
+    TransactionTotals,
+    TransactionType,
+)
 
 
 class TransactionRepository(ABC):
@@ -15,6 +21,22 @@ class TransactionRepository(ABC):
         """Cria uma nova transação."""
         pass
 
+    @abstractmethod
+    async def create_many(self, transactions: list[Transaction]) -> int:
+        """Cria várias transações com um INSERT em lote."""
+        pass
+
+    @abstractmethod
+    async def create_occurrences(
+        self, occurrences: list[tuple[UUID, Transaction]]
+    ) -> int:
+        """Cria as transações geradas por regras recorrentes, em lote.
+
+        Cada item é (rule_id, transação); ocorrências já geradas para a mesma
+        regra e data são ignoradas. Retorna quantas foram criadas.
+        """
+        pass
+
     @abstractmethod
     async def get_by_id(self, transaction_id: UUID) -> Optional[Transaction]:
         """Busca uma transação pelo ID."""
@@ -30,8 +52,39 @@ class TransactionRepository(ABC):
         category_id: Optional[UUID] = None,
         limit: int = 100,
         offset: int = 0,
+        after: Optional[tuple[datetime, UUID]] = None,
     ) -> list[Transaction]:
-        """Busca todas as transações de um usuário com filtros opcionais."""
+        """Busca todas as transações de um usuário com filtros opcionais.
+
+        As transações são ordenadas por (date, id) decrescente. Quando ``after`` é
+        informado, retorna apenas as transações posteriores a essa chave na
+        ordenação (paginação por cursor).
+        """
+        pass
+
+    @abstractmethod
+    async def search(
+        self, user_id: UUID, query: str, limit: int = 50, offset: int = 0
+    ) -> list[Transaction]:
+        """Busca transações do usuário por descrição e observações, das mais
+        relevantes para as menos relevantes."""
+        pass
+
+    @abstractmethod
+    def stream_by_user(
+        self,
+        user_id: UUID,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        type: Optional[TransactionType] = None,
+        category_id: Optional[UUID] = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[list[tuple[Any, ...]]]:
+        """Percorre as transações de um usuário em lotes, sem materializar o resultado.
+
+        Cada linha é uma tupla (id, date, description, amount, type, category_id,
+        notes), na ordem de get_all_by_user.
+        """
         pass
 
     @abstractmethod
@@ -56,14 +109,76 @@ class TransactionRepository(ABC):
         """Calcula o total de transações por categoria."""
         pass
 
+    @abstractmethod
+    async def get_summary(
+        self,
+        user_id: UUID,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> TransactionTotals:
+        """Calcula receitas, despesas e número de transações em uma consulta."""
+        pass
+
+    @abstractmethod
+    async def get_totals_by_categories(
+        self,
+        user_id: UUID,
+        category_ids: list[UUID],
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> dict[UUID, Decimal]:
+        """Calcula o total de despesas de várias categorias em uma única consulta."""
+        pass
+
+    @abstractmethod
+    async def get_totals_by_period(
+        self,
+        user_id: UUID,
+        period: AggregationPeriod,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> list[PeriodTotals]:
+        """Calcula receitas e despesas agrupadas por período em uma única consulta."""
+        pass
+
     @abstractmethod
     async def update(self, transaction: Transaction) -> Transaction:
         """Atualiza uma transação existente."""
         pass
 
     @abstractmethod
-    async def delete(self, transaction_id: UUID) -> bool:
-        """Remove uma transação."""
+    async def delete(self, transaction_id: UUID, user_id: UUID) -> bool:
+        """Remove uma transação do usuário; retorna False se não existir ou
+        pertencer a outro usuário."""
+        pass
+
+    @abstractmethod
+    async def update_many(
+        self,
+        user_id: UUID,
+        changes: dict[str, Any],
+        ids: Optional[list[UUID]] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        type: Optional[TransactionType] = None,
+        category_id: Optional[UUID] = None,
+    ) -> int:
+        """Atualiza em um único comando as transações do usuário selecionadas
+        por ids e/ou filtros. Retorna a quantidade afetada."""
+        pass
+
+    @abstractmethod
+    async def delete_many(
+        self,
+        user_id: UUID,
+        ids: Optional[list[UUID]] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        type: Optional[TransactionType] = None,
+        category_id: Optional[UUID] = None,
+    ) -> int:
+        """Remove em um único comando as transações do usuário selecionadas
+        por ids e/ou filtros. Retorna a quantidade removida."""
         pass
 
     @abstractmethod
@@ -1,3 +1,3 @@
-from .password_service import PasswordService
+from .password_service import PasswordService, PasswordServiceBusyError
 
-__all__ = ["PasswordService"]
+__all__ = ["PasswordService", "PasswordServiceBusyError"]
@@ -1,6 +1,10 @@
 from abc import ABC, abstractmethod
 
 
+class PasswordServiceBusyError(Exception):
+    """Fila de hashing de senhas cheia; a requisição deve ser recusada."""
+
+
 class PasswordService(ABC):
     """Interface abstrata para o serviço de senhas."""
 
@@ -13,3 +17,15 @@ class PasswordService(ABC):
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """Verifica se uma senha corresponde ao hash."""
         pass
+
+    @abstractmethod
+    async def hash_password_async(self, password: str) -> str:
+        """Gera o hash de uma senha sem bloquear o event loop."""
+        pass
+
+    @abstractmethod
+    async def verify_password_async(
+        self, plain_password: str, hashed_password: str
+    ) -> bool:
+        """Verifica uma senha sem bloquear o event loop."""
+        pass
@@ -0,0 +1,17 @@
+from .columns import (
+    TransactionColumns,
+    load_balance_before,
+    load_category_names,
+    load_transaction_columns,
+)
+from .engine import AnalyticsEngine, CashflowSeries, CategoryBreakdown
+
+__all__ = [
+    "AnalyticsEngine",
+    "CashflowSeries",
+    "CategoryBreakdown",
+    "TransactionColumns",
+    "load_balance_before",
+    "load_category_names",
+    "load_transaction_columns",
+]
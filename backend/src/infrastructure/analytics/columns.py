@@ -0,0 +1,119 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Optional, Sequence
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy import BigInteger, cast, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities import TransactionType
+from src.infrastructure.database.models import CategoryModel, TransactionModel
+
+_CENTS = cast(func.round(TransactionModel.amount * 100), BigInteger)
+
+
+def naive_utc(value: datetime) -> datetime:
+    """Data sem fuso, em UTC: o numpy não representa fusos em datetime64."""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+@dataclass(slots=True)
+class TransactionColumns:
+    """Transações de um usuário em arrays colunares, ordenadas por data.
+
+    ``category_codes`` indexa ``category_ids``; o código 0 é sempre
+    "sem categoria" (``None``).
+    """
+
+    cents: np.ndarray
+    dates: np.ndarray
+    category_codes: np.ndarray
+    income: np.ndarray
+    category_ids: list[Optional[UUID]]
+
+    def __len__(self) -> int:
+        return len(self.cents)
+
+    @property
+    def signed_cents(self) -> np.ndarray:
+        """Valores com sinal: receitas positivas, despesas negativas."""
+        return np.where(self.income, self.cents, -self.cents)
+
+    @classmethod
+    def from_rows(
+        cls, rows: Sequence[tuple[int, datetime, Optional[UUID], TransactionType]]
+    ) -> "TransactionColumns":
+        category_index: dict[Optional[UUID], int] = {None: 0}
+        if not rows:
+            return cls(
+                cents=np.empty(0, dtype=np.int64),
+                dates=np.empty(0, dtype="datetime64[us]"),
+                category_codes=np.empty(0, dtype=np.int32),
+                income=np.empty(0, dtype=bool),
+                category_ids=[None],
+            )
+
+        cents, dates, categories, types = zip(*rows)
+        codes = [category_index.setdefault(c, len(category_index)) for c in categories]
+        return cls(
+            cents=np.fromiter(cents, dtype=np.int64, count=len(rows)),
+            dates=np.array([naive_utc(d) for d in dates], dtype="datetime64[us]"),
+            category_codes=np.fromiter(codes, dtype=np.int32, count=len(rows)),
+            income=np.fromiter(
+                (t == TransactionType.INCOME for t in types),
+                dtype=bool,
+                count=len(rows),
+            ),
+            category_ids=list(category_index),
+        )
+
+
+async def load_transaction_columns(
+    session: AsyncSession,
+    user_id: UUID,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+) -> TransactionColumns:
+    """Carrega as transações do período, já em centavos, ordenadas por data."""
+    query = select(
+        _CENTS,
+        TransactionModel.date,
+        TransactionModel.category_id,
+        TransactionModel.type,
+    ).where(TransactionModel.user_id == user_id)
+
+    if start_date:
+        query = query.where(TransactionModel.date >= start_date)
+    if end_date:
+        query = query.where(TransactionModel.date < end_date)
+
+    result = await session.execute(query.order_by(TransactionModel.date))
+    return TransactionColumns.from_rows(result.all())
+
+
+async def load_balance_before(
+    session: AsyncSession, user_id: UUID, before: datetime
+) -> int:
+    """Saldo em centavos das transações anteriores a ``before``."""
+    is_income = TransactionModel.type == TransactionType.INCOME
+    is_expense = TransactionModel.type == TransactionType.EXPENSE
+    result = await session.execute(
+        select(
+            func.coalesce(func.sum(_CENTS).filter(is_income), 0),
+            func.coalesce(func.sum(_CENTS).filter(is_expense), 0),
+        ).where(TransactionModel.user_id == user_id, TransactionModel.date < before)
+    )
+    income, expense = result.one()
+    return int(income) - int(expense)
+
+
+async def load_category_names(session: AsyncSession, user_id: UUID) -> dict[UUID, str]:
+    result = await session.execute(
+        select(CategoryModel.id, CategoryModel.name).where(
+            CategoryModel.user_id == user_id
+        )
+    )
+    return dict(result.all())
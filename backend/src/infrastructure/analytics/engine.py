@@ -0,0 +1,180 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+import numpy as np
+
+from src.domain.entities import AggregationPeriod
+from src.infrastructure.analytics.columns import TransactionColumns, naive_utc
+
+_MONTH_UNITS = {AggregationPeriod.MONTH: "M", AggregationPeriod.YEAR: "Y"}
+
+MAX_PERIODS = 5000
+
+
+def period_starts(dates: np.ndarray, period: AggregationPeriod) -> np.ndarray:
+    """Início do período (datetime64[D]) de cada data; semanas começam na segunda."""
+    days = dates.astype("datetime64[D]")
+    if period == AggregationPeriod.DAY:
+        return days
+    if period == AggregationPeriod.WEEK:
+        # 1970-01-01 foi uma quinta-feira
+        offset = (days.astype(np.int64) + 3) % 7
+        mondays: np.ndarray = days - offset.astype("timedelta64[D]")
+        return mondays
+    unit = _MONTH_UNITS[period]
+    return days.astype(f"datetime64[{unit}]").astype("datetime64[D]")
+
+
+def period_grid(
+    first: np.datetime64, last: np.datetime64, period: AggregationPeriod
+) -> np.ndarray:
+    """Todos os inícios de período entre ``first`` e ``last``, inclusive."""
+    first, last = period_starts(np.array([first, last]), period)
+    if period == AggregationPeriod.DAY:
+        return np.arange(first, last + 1)
+    if period == AggregationPeriod.WEEK:
+        return np.arange(first, last + 1, 7)
+    unit = _MONTH_UNITS[period]
+    start = first.astype(f"datetime64[{unit}]")
+    stop = last.astype(f"datetime64[{unit}]")
+    return np.arange(start, stop + 1).astype("datetime64[D]")
+
+
+def moving_average(values: np.ndarray, window: int) -> np.ndarray:
+    """Média móvel simples; as posições sem janela completa ficam NaN."""
+    result = np.full(len(values), np.nan)
+    if window < 1 or len(values) < window:
+        return result
+    cumulative = np.cumsum(values, dtype=np.float64)
+    cumulative[window:] = cumulative[window:] - cumulative[:-window]
+    result[window - 1:] = cumulative[window - 1:] / window
+    return result
+
+
+@dataclass(slots=True)
+class CashflowSeries:
+    """Série de fluxo de caixa por período, em centavos."""
+
+    periods: np.ndarray
+    income: np.ndarray
+    expense: np.ndarray
+    balance: np.ndarray
+    moving_average: np.ndarray
+
+    @property
+    def net(self) -> np.ndarray:
+        net: np.ndarray = self.income - self.expense
+        return net
+
+
+@dataclass(slots=True)
+class CategoryBreakdown:
+    """Pivô categoria x período, em centavos, com as N maiores categorias."""
+
+    periods: np.ndarray
+    category_ids: list[Optional[UUID]]
+    totals: np.ndarray
+    series: np.ndarray
+    other_total: int
+    other_series: np.ndarray
+    grand_total: int
+
+
+class AnalyticsEngine:
+    """Agregações vetorizadas sobre as transações de um usuário."""
+
+    def __init__(
+        self,
+        columns: TransactionColumns,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> None:
+        self._columns = columns
+        self._start = np.datetime64(naive_utc(start_date), "D") if start_date else None
+        # end_date é exclusivo, como nos filtros de transações
+        self._end = np.datetime64(naive_utc(end_date), "us") - 1 if end_date else None
+
+    def _grid(self, period: AggregationPeriod) -> tuple[np.ndarray, np.ndarray]:
+        """Grade de períodos e a posição da primeira transação de cada um."""
+        dates = self._columns.dates
+        empty = np.empty(0, dtype="datetime64[D]"), np.empty(0, dtype=np.intp)
+        if not len(dates) and (self._start is None or self._end is None):
+            return empty
+
+        first = self._start if self._start is not None else dates[0]
+        last = self._end if self._end is not None else dates[-1]
+        if first > last:
+            return empty
+
+        grid = period_grid(first, last, period)
+        if len(grid) > MAX_PERIODS:
+            raise ValueError("Intervalo longo demais para o período escolhido")
+        # As datas chegam ordenadas: basta localizar o início de cada período
+        # em vez de converter cada data para a unidade de calendário
+        return grid, np.searchsorted(dates, grid.astype(dates.dtype), side="left")
+
+    def _segment_sums(self, values: np.ndarray, bounds: np.ndarray) -> np.ndarray:
+        """Soma exata (int64) de ``values`` entre posições seguidas de ``bounds``."""
+        cumulative = np.concatenate(([0], np.cumsum(values)))
+        ends = np.append(bounds[1:], len(values))
+        sums: np.ndarray = cumulative[ends] - cumulative[bounds]
+        return sums
+
+    def pivot(
+        self, period: AggregationPeriod, mask: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Soma em centavos por (período, categoria) das transações em ``mask``."""
+        grid, bounds = self._grid(period)
+        columns = self._columns
+        n_categories = len(columns.category_ids)
+
+        counts = np.diff(bounds, append=len(columns))
+        index = np.repeat(np.arange(len(grid)), counts)
+        sums = np.bincount(
+            index * n_categories + columns.category_codes,
+            weights=np.where(mask, columns.cents, 0),
+            minlength=len(grid) * n_categories,
+        )
+        return grid, np.rint(sums).astype(np.int64).reshape(len(grid), n_categories)
+
+    def cashflow(
+        self, period: AggregationPeriod, opening_cents: int, window: int
+    ) -> CashflowSeries:
+        """Receitas, despesas, saldo acumulado e média móvel do líquido."""
+        grid, bounds = self._grid(period)
+        cents = self._columns.cents
+        income_cents = np.where(self._columns.income, cents, 0)
+
+        income = self._segment_sums(income_cents, bounds)
+        expense = self._segment_sums(cents - income_cents, bounds)
+        net = income - expense
+        return CashflowSeries(
+            periods=grid,
+            income=income,
+            expense=expense,
+            balance=opening_cents + np.cumsum(net),
+            moving_average=moving_average(net, window),
+        )
+
+    def breakdown(
+        self, period: AggregationPeriod, income: bool, top: int
+    ) -> CategoryBreakdown:
+        """Categorias ordenadas pelo total; após as ``top`` primeiras, "outras"."""
+        mask = self._columns.income if income else ~self._columns.income
+        grid, pivot = self.pivot(period, mask)
+        totals = pivot.sum(axis=0)
+
+        order = np.argsort(-totals, kind="stable")
+        order = order[totals[order] > 0]
+        head, tail = order[:top], order[top:]
+        return CategoryBreakdown(
+            periods=grid,
+            category_ids=[self._columns.category_ids[code] for code in head],
+            totals=totals[head],
+            series=pivot[:, head].T,
+            other_total=int(totals[tail].sum()),
+            other_series=pivot[:, tail].sum(axis=1),
+            grand_total=int(totals.sum()),
+        )
@@ -0,0 +1,15 @@
+from .response_cache import (
+    InMemoryResponseCache,
+    ResponseCacheBackend,
+    get_response_cache,
+)
+from .user_cache import InMemoryUserCache, UserCacheBackend, get_user_cache
+
+__all__ = [
+    "UserCacheBackend",
+    "InMemoryUserCache",
+    "get_user_cache",
+    "ResponseCacheBackend",
+    "InMemoryResponseCache",
+    "get_response_cache",
+]
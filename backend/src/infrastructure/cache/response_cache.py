@@ -0,0 +1,68 @@
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+from src.infrastructure.config import get_settings
+
+
+class ResponseCacheBackend(ABC):
+    """Interface para o cache de corpos de resposta já serializados.
+
+    As chaves incluem a versão dos dados do usuário, então nunca é preciso
+    invalidar: entradas de versões antigas apenas deixam de ser consultadas.
+    """
+
+    @abstractmethod
+    async def get(self, key: Hashable) -> Optional[bytes]:
+        """Retorna o corpo em cache, ou None se ausente."""
+        pass
+
+    @abstractmethod
+    async def set(self, key: Hashable, body: bytes) -> None:
+        """Armazena um corpo serializado."""
+        pass
+
+
+class InMemoryResponseCache(ResponseCacheBackend):
+    """Cache em memória do processo com descarte LRU."""
+
+    def __init__(self, max_size: int) -> None:
+        self._max_size = max_size
+        self._entries: OrderedDict[Hashable, bytes] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: Hashable) -> Optional[bytes]:
+        body = self._entries.get(key)
+        if body is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return body
+
+    async def set(self, key: Hashable, body: bytes) -> None:
+        self._entries[key] = body
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+
+_response_cache: Optional[ResponseCacheBackend] = None
+
+
+def get_response_cache() -> Optional[ResponseCacheBackend]:
+    """Retorna o cache de respostas, ou None se estiver desativado."""
+    global _response_cache
+    settings = get_settings()
+    if not settings.response_cache_enabled:
+        return None
+    if _response_cache is None:
+        _response_cache = InMemoryResponseCache(
+            max_size=settings.response_cache_max_size
+        )
+    return _response_cache
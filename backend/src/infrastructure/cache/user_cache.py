@@ -0,0 +1,102 @@
+import copy
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Optional
+from uuid import UUID
+
+from src.domain.entities import User
+from src.infrastructure.config import get_settings
+from src.infrastructure.observability import REGISTRY
+
+USER_CACHE_HITS = REGISTRY.counter(
+    "user_cache_hits_total", "Usuários autenticados encontrados no cache"
+)
+USER_CACHE_MISSES = REGISTRY.counter(
+    "user_cache_misses_total", "Usuários autenticados ausentes ou expirados no cache"
+)
+
+
+class UserCacheBackend(ABC):
+    """Interface para o cache de usuários autenticados.
+
+    Implementações compartilhadas (ex.: Redis) permitem que vários workers
+    vejam as mesmas invalidações.
+    """
+
+    @abstractmethod
+    async def get(self, user_id: UUID) -> Optional[User]:
+        """Retorna o usuário em cache, ou None se ausente/expirado."""
+        pass
+
+    @abstractmethod
+    async def set(self, user: User) -> None:
+        """Armazena um usuário."""
+        pass
+
+    @abstractmethod
+    async def delete(self, user_id: UUID) -> None:
+        """Remove um usuário do cache."""
+        pass
+
+
+class InMemoryUserCache(UserCacheBackend):
+    """Cache em memória do processo com expiração (TTL) e descarte LRU."""
+
+    def __init__(self, ttl_seconds: float, max_size: int) -> None:
+        self._ttl = ttl_seconds
+        self._max_size = max_size
+        self._entries: OrderedDict[UUID, tuple[float, User]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, user_id: UUID) -> Optional[User]:
+        entry = self._entries.get(user_id)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[user_id]
+            self.misses += 1
+            USER_CACHE_MISSES.inc()
+            return None
+
+        self._entries.move_to_end(user_id)
+        self.hits += 1
+        USER_CACHE_HITS.inc()
+        # Cópia para que alterações no chamador não afetem o cache
+        return copy.copy(entry[1])
+
+    async def set(self, user: User) -> None:
+        self._entries[user.id] = (time.monotonic() + self._ttl, copy.copy(user))
+        self._entries.move_to_end(user.id)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    async def delete(self, user_id: UUID) -> None:
+        self._entries.pop(user_id, None)
+
+
+_user_cache: UserCacheBackend | None = None
+
+
+def get_user_cache() -> UserCacheBackend:
+    global _user_cache
+    if _user_cache is None:
+        settings = get_settings()
+        _user_cache = InMemoryUserCache(
+            ttl_seconds=settings.user_cache_ttl_seconds,
+            max_size=settings.user_cache_max_size,
+        )
+    return _user_cache
+
+
+def _user_cache_entries() -> dict[tuple[str, ...], float]:
+    cache = _user_cache
+    if not isinstance(cache, InMemoryUserCache):
+        return {(): 0.0}
+    return {(): float(len(cache))}
+
+
+REGISTRY.gauge("user_cache_entries", "Usuários no cache", callback=_user_cache_entries)
@@ -1,5 +1,5 @@
 from functools import lru_cache
-from typing import Optional
+from typing import Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -20,11 +20,84 @@ class Settings(BaseSettings):
 
     # Banco de dados
     database_url: str = "sqlite+aiosqlite:///./finance.db"
+    database_replica_urls: list[str] = []
+    database_replica_strategy: Literal["round_robin", "least_connections"] = (
+        "round_robin"
+    )
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+    db_statement_cache_size: int = 100  # asyncpg
+    db_command_timeout: float = 30.0  # asyncpg
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_mmap_size: int = 256 * 1024 * 1024
+
+    # Instrumentação SQL: consultas lentas e requisições com muito tempo ou
+    # muitas consultas no banco geram logs estruturados
+    slow_query_threshold_ms: float = 100.0
+    slow_request_db_threshold_ms: float = 250.0
+    slow_request_query_count: int = 25
+    server_timing_enabled: bool = True
+
+    # Importação de transações
+    import_batch_size: int = 1000
+
+    # Agendador de transações recorrentes
+    recurring_scheduler_enabled: bool = True
+    recurring_scheduler_interval_seconds: float = 60.0
+    recurring_rule_batch_size: int = 200
+    recurring_occurrence_batch_size: int = 24
 
     # JWT
     jwt_secret_key: str = "your-secret-key-change-in-production"
     jwt_algorithm: str = "HS256"
     jwt_expire_minutes: int = 60 * 24  # 24 horas
+    jwt_backend: Literal["jose", "hmac"] = "jose"
+    jwt_cache_size: int = 10_000
+
+    # Hashing de senhas (bcrypt)
+    bcrypt_rounds: int = 12
+    password_hash_workers: int = 4
+    password_hash_max_queue: int = 32
+
+    # Cache de usuários autenticados
+    user_cache_ttl_seconds: int = 60
+    user_cache_max_size: int = 10_000
+
+    # Cache de respostas das rotas de leitura (ETag sempre ativo)
+    response_cache_enabled: bool = False
+    response_cache_max_size: int = 1000
+
+    # Rate limit: token bucket por usuário (JWT) ou IP; cada rota consome
+    # o custo configurado ("MÉTODO /caminho", padrão 1)
+    rate_limit_enabled: bool = True
+    rate_limit_backend: Literal["memory", "redis"] = "memory"
+    rate_limit_redis_url: str = "redis://localhost:6379/0"
+    rate_limit_rate: float = 20.0  # fichas por segundo
+    rate_limit_burst: float = 100.0
+    rate_limit_max_keys: int = 100_000  # backend em memória
+    rate_limit_route_costs: dict[str, float] = {
+        "POST /api/v1/auth/login": 20,
+        "POST /api/v1/auth/register": 20,
+        "GET /api/v1/transactions/monthly": 10,
+        "GET /api/v1/transactions/export": 10,
+        "POST /api/v1/transactions/import": 10,
+        "GET /api/v1/transactions/search": 5,
+        "GET /api/v1/analytics/cashflow": 5,
+        "GET /api/v1/analytics/breakdown": 5,
+    }
+
+    # Controle de admissão: com o pool de conexões acima da saturação (ou
+    # acima de admission_max_concurrency requisições simultâneas, se
+    # definido), novas requisições esperam na fila e, com a fila cheia ou
+    # após o tempo máximo, recebem 503
+    admission_control_enabled: bool = True
+    admission_max_concurrency: int = 0  # 0: só a saturação do pool limita
+    admission_pool_saturation: float = 0.9
+    admission_max_queue: int = 100
+    admission_queue_timeout: float = 2.0
 
     # CORS
     cors_origins: list[str] = ["http://localhost:3000", "http://localhost:3001"]
@@ -1,12 +1,25 @@
-from .database import Database, get_db
-from .models import Base, UserModel, CategoryModel, TransactionModel, BudgetModel
+from .database import Database, get_db, get_read_db
+from .models import (
+    Base,
+    UserModel,
+    CategoryModel,
+    TransactionModel,
+    BudgetModel,
+    RecurringRuleModel,
+    MonthlyRollupModel,
+    UserDataVersionModel,
+)
 
 __all__ = [
     "Database",
     "get_db",
+    "get_read_db",
     "Base",
     "UserModel",
     "CategoryModel",
     "TransactionModel",
     "BudgetModel",
+    "RecurringRuleModel",
+    "MonthlyRollupModel",
+    "UserDataVersionModel",
 ]
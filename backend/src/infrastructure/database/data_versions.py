@@ -0,0 +1,39 @@
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.database.models import UserDataVersionModel
+
+
+class DataVersionStore:
+    """Contador de versão dos dados por usuário, usado para gerar ETags.
+
+    Os repositórios incrementam a versão na mesma transação da escrita, então
+    todos os workers (e réplicas) enxergam a nova versão junto com os dados.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get(self, user_id: UUID) -> int:
+        result = await self._session.execute(
+            select(UserDataVersionModel.version).where(
+                UserDataVersionModel.user_id == user_id
+            )
+        )
+        return result.scalar() or 0
+
+    async def bump(self, user_id: UUID) -> None:
+        stmt: postgresql.Insert | sqlite.Insert
+        if self._session.get_bind().dialect.name == "postgresql":
+            stmt = postgresql.insert(UserDataVersionModel)
+        else:
+            stmt = sqlite.insert(UserDataVersionModel)
+        stmt = stmt.values(user_id=user_id, version=1)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id"],
+            set_={"version": UserDataVersionModel.version + 1},
+        )
+        await self._session.execute(stmt)
@@ -1,28 +1,273 @@
-from typing import AsyncGenerator
+import itertools
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncGenerator, Iterator, Optional
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import event, exc, text
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, PoolProxiedConnection
 
-from src.infrastructure.config import get_settings
+from src.infrastructure.config import Settings, get_settings
+from src.infrastructure.observability import REGISTRY, instrument_engine
+
+POOL_CHECKOUT_WAIT = REGISTRY.histogram(
+    "db_pool_checkout_wait_seconds",
+    "Tempo para obter uma conexão do pool",
+    ("pool",),
+)
+POOL_CHECKOUT_TIMEOUTS = REGISTRY.counter(
+    "db_pool_checkout_timeouts_total",
+    "Checkouts que excederam pool_timeout",
+    ("pool",),
+)
+
+_pools: dict[str, Pool] = {}
+
+
+def _pool_usage() -> dict[tuple[str, ...], float]:
+    usage: dict[tuple[str, ...], float] = {}
+    for name, pool in _pools.items():
+        if isinstance(pool, AsyncAdaptedQueuePool):
+            usage[(name, "size")] = pool.size()
+            usage[(name, "checked_out")] = pool.checkedout()
+            usage[(name, "idle")] = pool.checkedin()
+            usage[(name, "overflow")] = max(pool.overflow(), 0)
+    return usage
+
+
+def pool_saturation() -> float:
+    """Maior fração de conexões em uso entre os pools (0 a 1).
+
+    Pools sem limite de overflow não entram no cálculo.
+    """
+    saturation = 0.0
+    for pool in _pools.values():
+        if not isinstance(pool, AsyncAdaptedQueuePool) or pool._max_overflow < 0:
+            continue
+        capacity = pool.size() + pool._max_overflow
+        if capacity:
+            saturation = max(saturation, pool.checkedout() / capacity)
+    return saturation
+
+
+REGISTRY.gauge(
+    "db_pool_connections",
+    "Conexões do pool por estado",
+    ("pool", "state"),
+    callback=_pool_usage,
+)
+
+
+# Marca a requisição atual depois de uma escrita, para que as leituras
+# seguintes usem o primário (read-your-writes)
+_request_wrote: ContextVar[bool] = ContextVar("db_request_wrote", default=False)
+
+
+@contextmanager
+def request_routing_scope() -> Iterator[None]:
+    """Isola o estado de leitura-após-escrita de uma requisição."""
+    token = _request_wrote.set(False)
+    try:
+        yield
+    finally:
+        _request_wrote.reset(token)
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Pool que registra o tempo de espera e os timeouts de checkout."""
+
+    metrics_name = "primary"
+
+    def connect(self) -> PoolProxiedConnection:
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            POOL_CHECKOUT_TIMEOUTS.inc(pool=self.metrics_name)
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            POOL_CHECKOUT_WAIT.observe(elapsed, pool=self.metrics_name)
+
+
+class ReplicaSet:
+    """Seleciona a réplica de leitura por round-robin ou menor número de conexões."""
+
+    def __init__(
+        self, engines: list[AsyncEngine], strategy: str = "round_robin"
+    ) -> None:
+        self._engines = engines
+        self._strategy = strategy
+        self._cycle = itertools.cycle(engines)
+
+    @property
+    def engines(self) -> list[AsyncEngine]:
+        return self._engines
+
+    def choose(self) -> Engine:
+        if self._strategy == "least_connections":
+            engine = min(self._engines, key=lambda e: _checked_out(e.pool))
+        else:
+            engine = next(self._cycle)
+        return engine.sync_engine
+
+
+def _checked_out(pool: Pool) -> int:
+    return pool.checkedout() if isinstance(pool, AsyncAdaptedQueuePool) else 0
+
+
+class RoutingSession(Session):
+    """Sessão que envia leituras a uma réplica quando configurada.
+
+    Escritas, flushes e qualquer leitura feita depois de uma escrita na mesma
+    requisição vão para o primário.
+    """
+
+    def get_bind(self, mapper: Any = None, *, clause: Any = None, **kw: Any) -> Any:
+        replicas: Optional[ReplicaSet] = self.info.get("replicas")
+        is_read = clause is not None and getattr(clause, "is_select", False)
+
+        if replicas is None or self._flushing or not is_read or _request_wrote.get():
+            return super().get_bind(mapper, clause=clause, **kw)
+
+        # Mantém a mesma réplica durante toda a sessão
+        if "replica" not in self.info:
+            self.info["replica"] = replicas.choose()
+        return self.info["replica"]
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _mark_flush_write(session: Session, flush_context: Any) -> None:
+    _request_wrote.set(True)
+
+
+@event.listens_for(RoutingSession, "do_orm_execute")
+def _mark_statement_write(orm_execute_state: Any) -> None:
+    if not orm_execute_state.is_select:
+        _request_wrote.set(True)
+
+
+def _engine_options(database_url: str, settings: Settings) -> dict[str, Any]:
+    url = make_url(database_url)
+
+    if url.get_backend_name() == "sqlite":
+        if url.database in (None, "", ":memory:"):
+            # Banco em memória: uma única conexão compartilhada, sem pool
+            return {}
+        return {
+            "poolclass": InstrumentedQueuePool,
+            "pool_size": settings.db_pool_size,
+            "max_overflow": settings.db_max_overflow,
+            "pool_timeout": settings.db_pool_timeout,
+        }
+
+    connect_args: dict[str, Any] = {}
+    if url.get_driver_name() == "asyncpg":
+        connect_args = {
+            "prepared_statement_cache_size": settings.db_statement_cache_size,
+            "command_timeout": settings.db_command_timeout,
+        }
+
+    return {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "connect_args": connect_args,
+    }
 
 
 class Database:
     """Gerenciador de conexão com o banco de dados."""
 
-    def __init__(self, database_url: str) -> None:
-        self._engine = create_async_engine(
-            database_url,
-            echo=False,
-            future=True,
-        )
-        self._session_factory = async_sessionmaker(
+    def __init__(
+        self,
+        database_url: str,
+        settings: Optional[Settings] = None,
+        replica_urls: Optional[list[str]] = None,
+    ) -> None:
+        settings = settings or get_settings()
+        self._engine = self._create_engine(database_url, settings, "primary")
+
+        self._replicas: Optional[ReplicaSet] = None
+        if replica_urls:
+            self._replicas = ReplicaSet(
+                [
+                    self._create_engine(url, settings, f"replica-{index}")
+                    for index, url in enumerate(replica_urls)
+                ],
+                strategy=settings.database_replica_strategy,
+            )
+
+        session_options: dict[str, Any] = dict(
             bind=self._engine,
             class_=AsyncSession,
+            sync_session_class=RoutingSession,
             expire_on_commit=False,
             autocommit=False,
             autoflush=False,
         )
+        self._session_factory = async_sessionmaker(**session_options)
+        self._read_session_factory = async_sessionmaker(
+            **session_options, info={"replicas": self._replicas}
+        )
+
+    @staticmethod
+    def _create_engine(database_url: str, settings: Settings, name: str) -> AsyncEngine:
+        engine = create_async_engine(
+            database_url,
+            echo=False,
+            future=True,
+            **_engine_options(database_url, settings),
+        )
+        if engine.dialect.name == "sqlite":
+            Database._configure_sqlite(engine, settings)
+        instrument_engine(
+            engine.sync_engine, name, settings.slow_query_threshold_ms / 1000
+        )
+        engine.pool.metrics_name = name  # type: ignore[attr-defined]
+        _pools[name] = engine.pool
+        return engine
+
+    @staticmethod
+    def _configure_sqlite(engine: AsyncEngine, settings: Settings) -> None:
+        """Aplica os PRAGMAs de concorrência a cada nova conexão SQLite."""
+        pragmas = [
+            f"PRAGMA busy_timeout = {settings.sqlite_busy_timeout_ms}",
+            "PRAGMA synchronous = NORMAL",
+            f"PRAGMA mmap_size = {settings.sqlite_mmap_size}",
+        ]
+        if engine.url.database not in (None, "", ":memory:"):
+            # WAL permite leituras concorrentes com uma escrita em andamento
+            pragmas.insert(0, "PRAGMA journal_mode = WAL")
+
+        @event.listens_for(engine.sync_engine, "connect")
+        def set_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+            cursor = dbapi_connection.cursor()
+            for pragma in pragmas:
+                cursor.execute(pragma)
+            cursor.close()
+
+    @property
+    def engine(self) -> AsyncEngine:
+        return self._engine
 
     async def create_tables(self) -> None:
+        """Cria as tabelas direto dos modelos, fora do Alembic.
+
+        Só para bancos descartáveis (benchmarks); a aplicação exige o esquema
+        aplicado por ``alembic upgrade head``.
+        """
         from src.infrastructure.database.models import Base
 
         async with self._engine.begin() as conn:
@@ -33,6 +278,13 @@ class Database:
 
         async with self._engine.begin() as conn:
             await conn.run_sync(Base.metadata.drop_all)
+            await conn.execute(text("DROP TABLE IF EXISTS alembic_version"))
+
+    async def dispose(self) -> None:
+        await self._engine.dispose()
+        if self._replicas:
+            for engine in self._replicas.engines:
+                await engine.dispose()
 
     async def get_session(self) -> AsyncGenerator[AsyncSession, None]:
         async with self._session_factory() as session:
@@ -43,6 +295,16 @@ class Database:
                 await session.rollback()
                 raise
 
+    async def get_read_session(self) -> AsyncGenerator[AsyncSession, None]:
+        """Sessão para consultas somente leitura, roteada para as réplicas."""
+        async with self._read_session_factory() as session:
+            try:
+                yield session
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+
 
 _database: Database | None = None
 
@@ -51,7 +313,11 @@ def get_database() -> Database:
     global _database
     if _database is None:
         settings = get_settings()
-        _database = Database(settings.database_url)
+        _database = Database(
+            settings.database_url,
+            settings,
+            replica_urls=settings.database_replica_urls,
+        )
     return _database
 
 
@@ -59,3 +325,9 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     database = get_database()
     async for session in database.get_session():
         yield session
+
+
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    database = get_database()
+    async for session in database.get_read_session():
+        yield session
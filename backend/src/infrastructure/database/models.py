@@ -1,12 +1,18 @@
-from datetime import datetime
+from datetime import date as calendar_date, datetime
 from decimal import Decimal
-from typing import Optional
+from typing import Any, Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import ForeignKey, String, Numeric, Enum as SQLEnum
+from sqlalchemy import Connection, ForeignKey, Index, String, Numeric, Enum as SQLEnum
+from sqlalchemy import event, func, text
+from sqlalchemy.dialects import postgresql  # noqa: F401 - registra func.to_tsvector
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from sqlalchemy.sql.elements import ColumnElement
 
-from src.domain.entities import TransactionType
+from src.domain.entities import RecurrenceFrequency, TransactionType
+
+
+UNCATEGORIZED_ID = UUID(int=0)
 
 
 class Base(DeclarativeBase):
@@ -53,6 +59,8 @@ class CategoryModel(Base):
     created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow)
     updated_at: Mapped[Optional[datetime]] = mapped_column(nullable=True)
 
+    __table_args__ = (Index("ix_categories_user_id_name", "user_id", "name"),)
+
     user: Mapped["UserModel"] = relationship(back_populates="categories")
     transactions: Mapped[list["TransactionModel"]] = relationship(
         back_populates="category"
@@ -69,7 +77,7 @@ class TransactionModel(Base):
     description: Mapped[str] = mapped_column(String(200))
     amount: Mapped[Decimal] = mapped_column(Numeric(12, 2))
     type: Mapped[TransactionType] = mapped_column(SQLEnum(TransactionType))
-    date: Mapped[datetime] = mapped_column(default=datetime.utcnow, index=True)
+    date: Mapped[datetime] = mapped_column(default=datetime.utcnow)
     notes: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
     user_id: Mapped[UUID] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
     category_id: Mapped[Optional[UUID]] = mapped_column(
@@ -77,6 +85,28 @@ class TransactionModel(Base):
     )
     created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow)
     updated_at: Mapped[Optional[datetime]] = mapped_column(nullable=True)
+    recurring_rule_id: Mapped[Optional[UUID]] = mapped_column(
+        ForeignKey("recurring_rules.id", ondelete="SET NULL"), nullable=True
+    )
+    # TransactionModel.date sombreia datetime.date no corpo da classe
+    occurrence_date: Mapped[Optional[calendar_date]] = mapped_column(nullable=True)
+
+    __table_args__ = (
+        Index("ix_transactions_user_id_date_id", "user_id", "date", "id"),
+        Index(
+            "ix_transactions_user_id_category_id_date",
+            "user_id",
+            "category_id",
+            "date",
+        ),
+        Index("ix_transactions_user_id_type_date", "user_id", "type", "date"),
+        Index(
+            "uq_transactions_recurring_rule_id_occurrence_date",
+            "recurring_rule_id",
+            "occurrence_date",
+            unique=True,
+        ),
+    )
 
     user: Mapped["UserModel"] = relationship(back_populates="transactions")
     category: Mapped[Optional["CategoryModel"]] = relationship(
@@ -84,6 +114,52 @@ class TransactionModel(Base):
     )
 
 
+def transaction_search_vector() -> ColumnElement[str]:
+    """tsvector (PostgreSQL) com a descrição (peso A) e as observações (peso B).
+
+    As buscas precisam usar exatamente esta expressão para aproveitar o
+    índice GIN abaixo.
+    """
+    simple = text("'simple'")
+    return func.setweight(
+        func.to_tsvector(simple, TransactionModel.description), text("'A'")
+    ).op("||")(
+        func.setweight(
+            func.to_tsvector(
+                simple, func.coalesce(TransactionModel.notes, text("''"))
+            ),
+            text("'B'"),
+        )
+    )
+
+
+Index(
+    "ix_transactions_search",
+    transaction_search_vector(),
+    postgresql_using="gin",
+).ddl_if(dialect="postgresql")
+
+# No SQLite a busca usa uma tabela FTS5, criada junto com transactions e
+# mantida pelo TransactionRepositoryImpl (ver database/search.py)
+TRANSACTIONS_FTS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS transactions_fts USING fts5("
+    "description, notes, user_id, transaction_id, "
+    "tokenize = 'unicode61 remove_diacritics 2')"
+)
+
+
+@event.listens_for(TransactionModel.__table__, "after_create")
+def _create_transactions_fts(target: Any, connection: Connection, **kw: Any) -> None:
+    if connection.dialect.name == "sqlite":
+        connection.exec_driver_sql(TRANSACTIONS_FTS_DDL)
+
+
+@event.listens_for(TransactionModel.__table__, "after_drop")
+def _drop_transactions_fts(target: Any, connection: Connection, **kw: Any) -> None:
+    if connection.dialect.name == "sqlite":
+        connection.exec_driver_sql("DROP TABLE IF EXISTS transactions_fts")
+
+
 class BudgetModel(Base):
     """Modelo de banco de dados para orçamento."""
 
@@ -100,5 +176,83 @@ class BudgetModel(Base):
     created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow)
     updated_at: Mapped[Optional[datetime]] = mapped_column(nullable=True)
 
+    __table_args__ = (
+        Index("ix_budgets_user_id_year_month", "user_id", "year", "month"),
+        Index(
+            "uq_budgets_user_id_category_id_year_month",
+            "user_id",
+            "category_id",
+            "year",
+            "month",
+            unique=True,
+        ),
+    )
+
     user: Mapped["UserModel"] = relationship(back_populates="budgets")
     category: Mapped["CategoryModel"] = relationship(back_populates="budgets")
+
+
+class RecurringRuleModel(Base):
+    """Modelo de banco de dados para regra de transação recorrente."""
+
+    __tablename__ = "recurring_rules"
+
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
+    description: Mapped[str] = mapped_column(String(200))
+    amount: Mapped[Decimal] = mapped_column(Numeric(12, 2))
+    type: Mapped[TransactionType] = mapped_column(SQLEnum(TransactionType))
+    frequency: Mapped[RecurrenceFrequency] = mapped_column(SQLEnum(RecurrenceFrequency))
+    interval: Mapped[int] = mapped_column(default=1)
+    day_of_month: Mapped[Optional[int]] = mapped_column(nullable=True)
+    weekday: Mapped[Optional[int]] = mapped_column(nullable=True)
+    start_date: Mapped[datetime] = mapped_column()
+    end_date: Mapped[Optional[datetime]] = mapped_column(nullable=True)
+    next_occurrence: Mapped[Optional[datetime]] = mapped_column(nullable=True)
+    notes: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
+    is_active: Mapped[bool] = mapped_column(default=True)
+    user_id: Mapped[UUID] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
+    category_id: Mapped[Optional[UUID]] = mapped_column(
+        ForeignKey("categories.id", ondelete="SET NULL"), nullable=True
+    )
+    created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(nullable=True)
+
+    __table_args__ = (
+        Index("ix_recurring_rules_user_id", "user_id"),
+        Index(
+            "ix_recurring_rules_is_active_next_occurrence",
+            "is_active",
+            "next_occurrence",
+        ),
+    )
+
+
+class MonthlyRollupModel(Base):
+    """Totais mensais materializados por usuário, categoria e tipo de transação."""
+
+    __tablename__ = "monthly_rollups"
+
+    user_id: Mapped[UUID] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    year: Mapped[int] = mapped_column(primary_key=True)
+    month: Mapped[int] = mapped_column(primary_key=True)
+    # Transações sem categoria usam UNCATEGORIZED_ID, pois a chave primária
+    # não aceita NULL
+    category_id: Mapped[UUID] = mapped_column(primary_key=True)
+    type: Mapped[TransactionType] = mapped_column(
+        SQLEnum(TransactionType), primary_key=True
+    )
+    total: Mapped[Decimal] = mapped_column(Numeric(14, 2), default=0)
+    count: Mapped[int] = mapped_column(default=0)
+
+
+class UserDataVersionModel(Base):
+    """Versão dos dados financeiros do usuário, incrementada a cada escrita."""
+
+    __tablename__ = "user_data_versions"
+
+    user_id: Mapped[UUID] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    version: Mapped[int] = mapped_column(default=0)
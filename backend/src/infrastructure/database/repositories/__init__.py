@@ -2,10 +2,12 @@ from .user_repository_impl import UserRepositoryImpl
 from .category_repository_impl import CategoryRepositoryImpl
 from .transaction_repository_impl import TransactionRepositoryImpl
 from .budget_repository_impl import BudgetRepositoryImpl
+from .recurring_rule_repository_impl import RecurringRuleRepositoryImpl
 
 __all__ = [
     "UserRepositoryImpl",
     "CategoryRepositoryImpl",
     "TransactionRepositoryImpl",
     "BudgetRepositoryImpl",
+    "RecurringRuleRepositoryImpl",
 ]
@@ -1,11 +1,12 @@
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import delete, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.entities import Budget
 from src.domain.repositories import BudgetRepository
+from src.infrastructure.database.data_versions import DataVersionStore
 from src.infrastructure.database.models import BudgetModel
 
 
@@ -14,9 +15,10 @@ class BudgetRepositoryImpl(BudgetRepository):
 
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
+        self._versions = DataVersionStore(session)
 
     def _to_entity(self, model: BudgetModel) -> Budget:
-        return Budget(
+        return Budget.rehydrate(
             id=model.id,
             user_id=model.user_id,
             category_id=model.category_id,
@@ -43,6 +45,7 @@ class BudgetRepositoryImpl(BudgetRepository):
         model = self._to_model(budget)
         self._session.add(model)
         await self._session.flush()
+        await self._versions.bump(model.user_id)
         return self._to_entity(model)
 
     async def get_by_id(self, budget_id: UUID) -> Optional[Budget]:
@@ -81,27 +84,30 @@ class BudgetRepositoryImpl(BudgetRepository):
 
     async def update(self, budget: Budget) -> Budget:
         result = await self._session.execute(
-            select(BudgetModel).where(BudgetModel.id == budget.id)
+            update(BudgetModel)
+            .where(BudgetModel.id == budget.id, BudgetModel.user_id == budget.user_id)
+            .values(amount=budget.amount, updated_at=budget.updated_at)
+            .returning(BudgetModel)
+            .execution_options(synchronize_session=False, populate_existing=True)
         )
         model = result.scalar_one_or_none()
 
         if model:
-            model.amount = budget.amount
-            model.updated_at = budget.updated_at
-            await self._session.flush()
+            await self._versions.bump(model.user_id)
             return self._to_entity(model)
 
         raise ValueError("Orçamento não encontrado")
 
-    async def delete(self, budget_id: UUID) -> bool:
+    async def delete(self, budget_id: UUID, user_id: UUID) -> bool:
         result = await self._session.execute(
-            select(BudgetModel).where(BudgetModel.id == budget_id)
+            delete(BudgetModel)
+            .where(BudgetModel.id == budget_id, BudgetModel.user_id == user_id)
+            .returning(BudgetModel.id)
+            .execution_options(synchronize_session=False)
         )
-        model = result.scalar_one_or_none()
 
-        if model:
-            await self._session.delete(model)
-            await self._session.flush()
-            return True
+        if result.scalar_one_or_none() is None:
+            return False
 
-        return False
+        await self._versions.bump(user_id)
+        return True
@@ -1,12 +1,19 @@
-from typing import Optional
+from typing import Iterable, Optional
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import delete, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.entities import Category
 from src.domain.repositories import CategoryRepository
-from src.infrastructure.database.models import CategoryModel
+from src.infrastructure.database.data_versions import DataVersionStore
+from src.infrastructure.database.models import (
+    BudgetModel,
+    CategoryModel,
+    RecurringRuleModel,
+    TransactionModel,
+)
+from src.infrastructure.database.rollups import MonthlyRollupStore
 
 
 class CategoryRepositoryImpl(CategoryRepository):
@@ -14,6 +21,7 @@ class CategoryRepositoryImpl(CategoryRepository):
 
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
+        self._versions = DataVersionStore(session)
 
     def _to_entity(self, model: CategoryModel) -> Category:
         return Category(
@@ -41,6 +49,7 @@ class CategoryRepositoryImpl(CategoryRepository):
         model = self._to_model(category)
         self._session.add(model)
         await self._session.flush()
+        await self._versions.bump(model.user_id)
         return self._to_entity(model)
 
     async def get_by_id(self, category_id: UUID) -> Optional[Category]:
@@ -52,38 +61,88 @@ class CategoryRepositoryImpl(CategoryRepository):
 
     async def get_all_by_user(self, user_id: UUID) -> list[Category]:
         result = await self._session.execute(
-            select(CategoryModel)
+            select(
+                CategoryModel.id,
+                CategoryModel.name,
+                CategoryModel.color,
+                CategoryModel.icon,
+                CategoryModel.user_id,
+                CategoryModel.created_at,
+                CategoryModel.updated_at,
+            )
             .where(CategoryModel.user_id == user_id)
             .order_by(CategoryModel.name)
         )
-        models = result.scalars().all()
-        return [self._to_entity(m) for m in models]
+        return [Category(**row._mapping) for row in result]
+
+    async def get_owned_ids(
+        self, user_id: UUID, category_ids: Iterable[UUID]
+    ) -> set[UUID]:
+        ids = set(category_ids)
+        if not ids:
+            return set()
+
+        result = await self._session.execute(
+            select(CategoryModel.id).where(
+                CategoryModel.user_id == user_id, CategoryModel.id.in_(ids)
+            )
+        )
+        return set(result.scalars())
 
     async def update(self, category: Category) -> Category:
         result = await self._session.execute(
-            select(CategoryModel).where(CategoryModel.id == category.id)
+            update(CategoryModel)
+            .where(
+                CategoryModel.id == category.id,
+                CategoryModel.user_id == category.user_id,
+            )
+            .values(
+                name=category.name,
+                color=category.color,
+                icon=category.icon,
+                updated_at=category.updated_at,
+            )
+            .returning(CategoryModel)
+            .execution_options(synchronize_session=False, populate_existing=True)
         )
         model = result.scalar_one_or_none()
 
         if model:
-            model.name = category.name
-            model.color = category.color
-            model.icon = category.icon
-            model.updated_at = category.updated_at
-            await self._session.flush()
+            await self._versions.bump(model.user_id)
             return self._to_entity(model)
 
         raise ValueError("Categoria não encontrada")
 
-    async def delete(self, category_id: UUID) -> bool:
+    async def delete(self, category_id: UUID, user_id: UUID) -> bool:
         result = await self._session.execute(
-            select(CategoryModel).where(CategoryModel.id == category_id)
+            delete(CategoryModel)
+            .where(CategoryModel.id == category_id, CategoryModel.user_id == user_id)
+            .returning(CategoryModel.id)
+            .execution_options(synchronize_session=False)
         )
-        model = result.scalar_one_or_none()
 
-        if model:
-            await self._session.delete(model)
-            await self._session.flush()
-            return True
+        if result.scalar_one_or_none() is None:
+            return False
 
-        return False
+        # Desvincula as transações e as regras recorrentes, remove os
+        # orçamentos da categoria e move os rollups para "sem categoria",
+        # cada um em um único comando (o SQLite não aplica ON DELETE SET NULL)
+        await self._session.execute(
+            update(TransactionModel)
+            .where(TransactionModel.category_id == category_id)
+            .values(category_id=None)
+        )
+        await self._session.execute(
+            update(RecurringRuleModel)
+            .where(
+                RecurringRuleModel.category_id == category_id,
+                RecurringRuleModel.user_id == user_id,
+            )
+            .values(category_id=None)
+        )
+        await self._session.execute(
+            delete(BudgetModel).where(BudgetModel.category_id == category_id)
+        )
+        await MonthlyRollupStore(self._session).move_category(user_id, category_id)
+        await self._versions.bump(user_id)
+        return True
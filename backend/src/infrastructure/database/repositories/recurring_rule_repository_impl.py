@@ -0,0 +1,157 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities import RecurringRule
+from src.domain.repositories import RecurringRuleRepository
+from src.infrastructure.database.models import RecurringRuleModel, TransactionModel
+
+
+class RecurringRuleRepositoryImpl(RecurringRuleRepository):
+    """Implementação do repositório de regras recorrentes com SQLAlchemy."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    def _to_entity(self, model: RecurringRuleModel) -> RecurringRule:
+        return RecurringRule.rehydrate(
+            id=model.id,
+            user_id=model.user_id,
+            description=model.description,
+            amount=model.amount,
+            type=model.type,
+            frequency=model.frequency,
+            interval=model.interval,
+            day_of_month=model.day_of_month,
+            weekday=model.weekday,
+            start_date=model.start_date,
+            end_date=model.end_date,
+            next_occurrence=model.next_occurrence,
+            category_id=model.category_id,
+            notes=model.notes,
+            is_active=model.is_active,
+            created_at=model.created_at,
+            updated_at=model.updated_at,
+        )
+
+    def _to_model(self, entity: RecurringRule) -> RecurringRuleModel:
+        return RecurringRuleModel(
+            id=entity.id,
+            user_id=entity.user_id,
+            description=entity.description,
+            amount=entity.amount,
+            type=entity.type,
+            frequency=entity.frequency,
+            interval=entity.interval,
+            day_of_month=entity.day_of_month,
+            weekday=entity.weekday,
+            start_date=entity.start_date,
+            end_date=entity.end_date,
+            next_occurrence=entity.next_occurrence,
+            category_id=entity.category_id,
+            notes=entity.notes,
+            is_active=entity.is_active,
+            created_at=entity.created_at,
+            updated_at=entity.updated_at,
+        )
+
+    async def create(self, rule: RecurringRule) -> RecurringRule:
+        model = self._to_model(rule)
+        self._session.add(model)
+        await self._session.flush()
+        return self._to_entity(model)
+
+    async def get_by_id(self, rule_id: UUID) -> Optional[RecurringRule]:
+        result = await self._session.execute(
+            select(RecurringRuleModel).where(RecurringRuleModel.id == rule_id)
+        )
+        model = result.scalar_one_or_none()
+        return self._to_entity(model) if model else None
+
+    async def get_all_by_user(self, user_id: UUID) -> list[RecurringRule]:
+        result = await self._session.execute(
+            select(RecurringRuleModel)
+            .where(RecurringRuleModel.user_id == user_id)
+            .order_by(RecurringRuleModel.created_at)
+        )
+        return [self._to_entity(m) for m in result.scalars().all()]
+
+    async def get_due(self, until: datetime, limit: int) -> list[RecurringRule]:
+        # SKIP LOCKED deixa cada worker com um lote diferente no PostgreSQL;
+        # no SQLite a cláusula é omitida e a escrita já é serializada
+        result = await self._session.execute(
+            select(RecurringRuleModel)
+            .where(
+                RecurringRuleModel.is_active.is_(True),
+                RecurringRuleModel.next_occurrence <= until,
+            )
+            .order_by(RecurringRuleModel.next_occurrence)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        return [self._to_entity(m) for m in result.scalars().all()]
+
+    async def update(self, rule: RecurringRule) -> RecurringRule:
+        result = await self._session.execute(
+            update(RecurringRuleModel)
+            .where(
+                RecurringRuleModel.id == rule.id,
+                RecurringRuleModel.user_id == rule.user_id,
+            )
+            .values(
+                description=rule.description,
+                amount=rule.amount,
+                category_id=rule.category_id,
+                notes=rule.notes,
+                end_date=rule.end_date,
+                next_occurrence=rule.next_occurrence,
+                is_active=rule.is_active,
+                updated_at=rule.updated_at,
+            )
+            .returning(RecurringRuleModel)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        model = result.scalar_one_or_none()
+
+        if model:
+            return self._to_entity(model)
+
+        raise ValueError("Regra recorrente não encontrada")
+
+    async def update_next_occurrences(self, rules: list[RecurringRule]) -> None:
+        if not rules:
+            return
+
+        # UPDATE em lote por chave primária (executemany), uma linha por regra
+        await self._session.execute(
+            update(RecurringRuleModel),
+            [
+                {"id": rule.id, "next_occurrence": rule.next_occurrence}
+                for rule in rules
+            ],
+        )
+
+    async def delete(self, rule_id: UUID, user_id: UUID) -> bool:
+        result = await self._session.execute(
+            delete(RecurringRuleModel)
+            .where(
+                RecurringRuleModel.id == rule_id, RecurringRuleModel.user_id == user_id
+            )
+            .returning(RecurringRuleModel.id)
+            .execution_options(synchronize_session=False)
+        )
+
+        if result.scalar_one_or_none() is None:
+            return False
+
+        # O SQLite não aplica o ON DELETE SET NULL sem PRAGMA foreign_keys:
+        # desvincula as ocorrências já geradas explicitamente
+        await self._session.execute(
+            update(TransactionModel)
+            .where(TransactionModel.recurring_rule_id == rule_id)
+            .values(recurring_rule_id=None)
+        )
+        return True
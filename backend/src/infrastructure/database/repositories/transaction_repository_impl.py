@@ -1,24 +1,84 @@
-from datetime import datetime
+from datetime import datetime, time
 from decimal import Decimal
-from typing import Optional
+from typing import Any, AsyncIterator, Optional
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import case, delete, func, insert, select, tuple_, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.elements import ColumnElement
 
-from src.domain.entities import Transaction, TransactionType
+from src.domain.entities import (
+    AggregationPeriod,
+    PeriodTotals,
+    Transaction,
+    TransactionTotals,
+    TransactionType,
+)
 from src.domain.repositories import TransactionRepository
-from src.infrastructure.database.models import TransactionModel
+from src.infrastructure.database.data_versions import DataVersionStore
+from src.infrastructure.database.models import (
+    UNCATEGORIZED_ID,
+    MonthlyRollupModel,
+    TransactionModel,
+)
+from src.infrastructure.database.rollups import MonthlyRollupStore, RollupKey
+from src.infrastructure.database.search import TransactionSearchIndex
+
+_SQLITE_BUCKET_FORMATS = {
+    AggregationPeriod.DAY: ("%Y-%m-%d",),
+    AggregationPeriod.WEEK: ("%Y-%m-%d", "weekday 0", "-6 days"),
+    AggregationPeriod.MONTH: ("%Y-%m-01",),
+    AggregationPeriod.YEAR: ("%Y-01-01",),
+}
+
+
+def _is_month_aligned(value: Optional[datetime]) -> bool:
+    return value is None or (value.day == 1 and value.time() == time.min)
+
+
+# Colunas com os mesmos nomes dos campos da entidade, para leituras que
+# dispensam a instância ORM
+_ENTITY_COLUMNS = (
+    TransactionModel.id,
+    TransactionModel.description,
+    TransactionModel.amount,
+    TransactionModel.type,
+    TransactionModel.date,
+    TransactionModel.notes,
+    TransactionModel.user_id,
+    TransactionModel.category_id,
+    TransactionModel.created_at,
+    TransactionModel.updated_at,
+)
 
 
 class TransactionRepositoryImpl(TransactionRepository):
-    """Implementação do repositório de transações com SQLAlchemy."""
+    """Implementação do repositório de transações com SQLAlchemy.
+
+    Toda escrita mantém a tabela monthly_rollups (e, no SQLite, o índice de
+    busca) na mesma transação, e as leituras agregadas cujo intervalo coincide
+    com meses inteiros são respondidas a partir dela.
+    """
 
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
+        self._rollups = MonthlyRollupStore(session)
+        self._versions = DataVersionStore(session)
+        self._search = TransactionSearchIndex(session)
+        # O identity map da sessão guarda referências fracas; mantemos os
+        # modelos lidos por get_by_id para que update não precise de outro SELECT
+        self._loaded: dict[UUID, TransactionModel] = {}
+
+    def _rollup_key(self, model: TransactionModel) -> RollupKey:
+        return MonthlyRollupStore.key_for(
+            model.user_id, model.date, model.category_id, model.type
+        )
 
     def _to_entity(self, model: TransactionModel) -> Transaction:
-        return Transaction(
+        return Transaction.rehydrate(
             id=model.id,
             description=model.description,
             amount=model.amount,
@@ -31,6 +91,19 @@ class TransactionRepositoryImpl(TransactionRepository):
             updated_at=model.updated_at,
         )
 
+    @staticmethod
+    def _row_to_entity(row: Row[*tuple[Any, ...]]) -> Transaction:
+        return Transaction.rehydrate(**row._mapping)
+
+    @staticmethod
+    def _search_row(model: TransactionModel) -> dict[str, Any]:
+        return {
+            "id": model.id,
+            "user_id": model.user_id,
+            "description": model.description,
+            "notes": model.notes,
+        }
+
     def _to_model(self, entity: Transaction) -> TransactionModel:
         return TransactionModel(
             id=entity.id,
@@ -48,15 +121,113 @@ class TransactionRepositoryImpl(TransactionRepository):
     async def create(self, transaction: Transaction) -> Transaction:
         model = self._to_model(transaction)
         self._session.add(model)
+        self._rollups.add(self._rollup_key(model), model.amount)
         await self._session.flush()
+        await self._rollups.flush()
+        await self._search.add([self._search_row(model)])
+        await self._versions.bump(model.user_id)
         return self._to_entity(model)
 
+    async def create_many(self, transactions: list[Transaction]) -> int:
+        if not transactions:
+            return 0
+
+        rows = []
+        for t in transactions:
+            rows.append({
+                "id": t.id,
+                "description": t.description,
+                "amount": t.amount,
+                "type": t.type,
+                "date": t.date,
+                "notes": t.notes,
+                "user_id": t.user_id,
+                "category_id": t.category_id,
+                "created_at": t.created_at,
+                "updated_at": t.updated_at,
+            })
+            self._rollups.add(
+                MonthlyRollupStore.key_for(t.user_id, t.date, t.category_id, t.type),
+                t.amount,
+            )
+
+        await self._session.execute(insert(TransactionModel), rows)
+        await self._rollups.flush()
+        await self._search.add(rows)
+        for user_id in {t.user_id for t in transactions}:
+            await self._versions.bump(user_id)
+        return len(rows)
+
+    async def create_occurrences(
+        self, occurrences: list[tuple[UUID, Transaction]]
+    ) -> int:
+        if not occurrences:
+            return 0
+
+        stmt: postgresql.Insert | sqlite.Insert
+        if self._session.get_bind().dialect.name == "postgresql":
+            stmt = postgresql.insert(TransactionModel)
+        else:
+            stmt = sqlite.insert(TransactionModel)
+
+        rows = [
+            {
+                "id": t.id,
+                "description": t.description,
+                "amount": t.amount,
+                "type": t.type,
+                "date": t.date,
+                "notes": t.notes,
+                "user_id": t.user_id,
+                "category_id": t.category_id,
+                "created_at": t.created_at,
+                "updated_at": t.updated_at,
+                "recurring_rule_id": rule_id,
+                "occurrence_date": t.date.date(),
+            }
+            for rule_id, t in occurrences
+        ]
+        # Ocorrências já geradas (por outro worker ou antes de uma queda)
+        # são ignoradas; só as inseridas de fato entram nos rollups
+        stmt = stmt.on_conflict_do_nothing(
+            index_elements=["recurring_rule_id", "occurrence_date"]
+        )
+        result = await self._session.execute(
+            stmt.returning(
+                TransactionModel.user_id,
+                TransactionModel.date,
+                TransactionModel.category_id,
+                TransactionModel.type,
+                TransactionModel.amount,
+                TransactionModel.id,
+                TransactionModel.description,
+                TransactionModel.notes,
+            ),
+            rows,
+        )
+        inserted = result.all()
+
+        for row in inserted:
+            key = MonthlyRollupStore.key_for(
+                row.user_id, row.date, row.category_id, row.type
+            )
+            self._rollups.add(key, row.amount)
+        await self._rollups.flush()
+        await self._search.add([dict(row._mapping) for row in inserted])
+        for user_id in {row.user_id for row in inserted}:
+            await self._versions.bump(user_id)
+        return len(inserted)
+
     async def get_by_id(self, transaction_id: UUID) -> Optional[Transaction]:
         result = await self._session.execute(
             select(TransactionModel).where(TransactionModel.id == transaction_id)
         )
         model = result.scalar_one_or_none()
-        return self._to_entity(model) if model else None
+        if model is None:
+            return None
+
+        self._loaded[model.id] = model
+        return self._to_entity(model)
 
     async def get_all_by_user(
         self,
@@ -67,8 +238,9 @@ class TransactionRepositoryImpl(TransactionRepository):
         category_id: Optional[UUID] = None,
         limit: int = 100,
         offset: int = 0,
+        after: Optional[tuple[datetime, UUID]] = None,
     ) -> list[Transaction]:
-        query = select(TransactionModel).where(TransactionModel.user_id == user_id)
+        query = select(*_ENTITY_COLUMNS).where(TransactionModel.user_id == user_id)
 
         if start_date:
             query = query.where(TransactionModel.date >= start_date)
@@ -79,11 +251,64 @@ class TransactionRepositoryImpl(TransactionRepository):
         if category_id:
             query = query.where(TransactionModel.category_id == category_id)
 
-        query = query.order_by(TransactionModel.date.desc()).limit(limit).offset(offset)
+        if after:
+            position = tuple_(TransactionModel.date, TransactionModel.id)
+            query = query.where(position < after)
+
+        query = (
+            query.order_by(TransactionModel.date.desc(), TransactionModel.id.desc())
+            .limit(limit)
+            .offset(offset)
+        )
 
         result = await self._session.execute(query)
-        models = result.scalars().all()
-        return [self._to_entity(m) for m in models]
+        return [self._row_to_entity(row) for row in result]
+
+    async def search(
+        self, user_id: UUID, query: str, limit: int = 50, offset: int = 0
+    ) -> list[Transaction]:
+        statement = self._search.apply(
+            select(*_ENTITY_COLUMNS), user_id, query, limit, offset
+        )
+
+        result = await self._session.execute(statement)
+        return [self._row_to_entity(row) for row in result]
+
+    async def stream_by_user(
+        self,
+        user_id: UUID,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        type: Optional[TransactionType] = None,
+        category_id: Optional[UUID] = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[list[tuple[Any, ...]]]:
+        query = select(
+            TransactionModel.id,
+            TransactionModel.date,
+            TransactionModel.description,
+            TransactionModel.amount,
+            TransactionModel.type,
+            TransactionModel.category_id,
+            TransactionModel.notes,
+        ).where(TransactionModel.user_id == user_id)
+
+        if start_date:
+            query = query.where(TransactionModel.date >= start_date)
+        if end_date:
+            query = query.where(TransactionModel.date < end_date)
+        if type:
+            query = query.where(TransactionModel.type == type)
+        if category_id:
+            query = query.where(TransactionModel.category_id == category_id)
+
+        query = query.order_by(
+            TransactionModel.date.desc(), TransactionModel.id.desc()
+        ).execution_options(yield_per=batch_size)
+
+        result = await self._session.stream(query)
+        async for partition in result.partitions():
+            yield [tuple(row) for row in partition]
 
     async def get_total_by_type(
         self,
@@ -128,13 +353,240 @@ class TransactionRepositoryImpl(TransactionRepository):
         total = result.scalar()
         return Decimal(str(total)) if total else Decimal("0")
 
-    async def update(self, transaction: Transaction) -> Transaction:
-        result = await self._session.execute(
-            select(TransactionModel).where(TransactionModel.id == transaction.id)
+    async def get_summary(
+        self,
+        user_id: UUID,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> TransactionTotals:
+        if _is_month_aligned(start_date) and _is_month_aligned(end_date):
+            return await self._get_summary_from_rollups(user_id, start_date, end_date)
+
+        query = select(
+            self._sum_by_type(TransactionType.INCOME),
+            self._sum_by_type(TransactionType.EXPENSE),
+            func.count(TransactionModel.id),
+        ).where(TransactionModel.user_id == user_id)
+
+        if start_date:
+            query = query.where(TransactionModel.date >= start_date)
+        if end_date:
+            query = query.where(TransactionModel.date < end_date)
+
+        result = await self._session.execute(query)
+        income, expense, count = result.one()
+        return TransactionTotals(
+            total_income=Decimal(str(income)) if income else Decimal("0"),
+            total_expense=Decimal(str(expense)) if expense else Decimal("0"),
+            transaction_count=count or 0,
         )
-        model = result.scalar_one_or_none()
 
-        if model:
+    async def _get_summary_from_rollups(
+        self,
+        user_id: UUID,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+    ) -> TransactionTotals:
+        query = self._filter_rollup_range(
+            select(
+                self._sum_rollup_by_type(TransactionType.INCOME),
+                self._sum_rollup_by_type(TransactionType.EXPENSE),
+                func.sum(MonthlyRollupModel.count),
+            ).where(MonthlyRollupModel.user_id == user_id),
+            start_date,
+            end_date,
+        )
+
+        result = await self._session.execute(query)
+        income, expense, count = result.one()
+        return TransactionTotals(
+            total_income=Decimal(str(income)) if income else Decimal("0"),
+            total_expense=Decimal(str(expense)) if expense else Decimal("0"),
+            transaction_count=count or 0,
+        )
+
+    async def get_totals_by_categories(
+        self,
+        user_id: UUID,
+        category_ids: list[UUID],
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> dict[UUID, Decimal]:
+        totals = {category_id: Decimal("0") for category_id in category_ids}
+        if not category_ids:
+            return totals
+
+        if _is_month_aligned(start_date) and _is_month_aligned(end_date):
+            query = self._filter_rollup_range(
+                select(
+                    MonthlyRollupModel.category_id, func.sum(MonthlyRollupModel.total)
+                )
+                .where(
+                    MonthlyRollupModel.user_id == user_id,
+                    MonthlyRollupModel.category_id.in_(category_ids),
+                    MonthlyRollupModel.type == TransactionType.EXPENSE,
+                )
+                .group_by(MonthlyRollupModel.category_id),
+                start_date,
+                end_date,
+            )
+            result = await self._session.execute(query)
+            for category_id, total in result.all():
+                totals[category_id] = Decimal(str(total)) if total else Decimal("0")
+            return totals
+
+        query = select(
+            TransactionModel.category_id, func.sum(TransactionModel.amount)
+        ).where(
+            TransactionModel.user_id == user_id,
+            TransactionModel.category_id.in_(category_ids),
+            TransactionModel.type == TransactionType.EXPENSE,
+        )
+
+        if start_date:
+            query = query.where(TransactionModel.date >= start_date)
+        if end_date:
+            query = query.where(TransactionModel.date < end_date)
+
+        query = query.group_by(TransactionModel.category_id)
+
+        result = await self._session.execute(query)
+        for category_id, total in result.all():
+            totals[category_id] = Decimal(str(total)) if total else Decimal("0")
+        return totals
+
+    def _filter_rollup_range(
+        self,
+        query: Select[*tuple[Any, ...]],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+    ) -> Select[*tuple[Any, ...]]:
+        """Restringe uma consulta de rollups a um intervalo de meses inteiros."""
+        period = tuple_(MonthlyRollupModel.year, MonthlyRollupModel.month)
+        if start_date:
+            query = query.where(period >= (start_date.year, start_date.month))
+        if end_date:
+            query = query.where(period < (end_date.year, end_date.month))
+        return query
+
+    def _sum_rollup_by_type(self, type: TransactionType) -> ColumnElement[Decimal]:
+        return func.sum(
+            case((MonthlyRollupModel.type == type, MonthlyRollupModel.total), else_=0)
+        )
+
+    def _sum_by_type(self, type: TransactionType) -> ColumnElement[Decimal]:
+        """SUM condicional do valor das transações de um tipo."""
+        return func.sum(
+            case((TransactionModel.type == type, TransactionModel.amount), else_=0)
+        )
+
+    def _period_bucket(self, period: AggregationPeriod) -> ColumnElement[str]:
+        """Expressão SQL com o início do período (YYYY-MM-DD) de cada transação."""
+        dialect = self._session.get_bind().dialect.name
+
+        if dialect == "postgresql":
+            return func.to_char(
+                func.date_trunc(period.value, TransactionModel.date), "YYYY-MM-DD"
+            )
+
+        fmt, *modifiers = _SQLITE_BUCKET_FORMATS[period]
+        return func.strftime(fmt, TransactionModel.date, *modifiers)
+
+    async def get_totals_by_period(
+        self,
+        user_id: UUID,
+        period: AggregationPeriod,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> list[PeriodTotals]:
+        if (
+            period in (AggregationPeriod.MONTH, AggregationPeriod.YEAR)
+            and _is_month_aligned(start_date)
+            and _is_month_aligned(end_date)
+        ):
+            return await self._get_totals_by_period_from_rollups(
+                user_id, period, start_date, end_date
+            )
+
+        bucket = self._period_bucket(period).label("bucket")
+        income = self._sum_by_type(TransactionType.INCOME)
+        expense = self._sum_by_type(TransactionType.EXPENSE)
+
+        query = select(bucket, income, expense).where(
+            TransactionModel.user_id == user_id
+        )
+
+        if start_date:
+            query = query.where(TransactionModel.date >= start_date)
+        if end_date:
+            query = query.where(TransactionModel.date < end_date)
+
+        query = query.group_by(bucket).order_by(bucket)
+
+        result = await self._session.execute(query)
+        return [
+            PeriodTotals(
+                period_start=datetime.strptime(row[0], "%Y-%m-%d"),
+                total_income=Decimal(str(row[1])) if row[1] else Decimal("0"),
+                total_expense=Decimal(str(row[2])) if row[2] else Decimal("0"),
+            )
+            for row in result.all()
+        ]
+
+    async def _get_totals_by_period_from_rollups(
+        self,
+        user_id: UUID,
+        period: AggregationPeriod,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+    ) -> list[PeriodTotals]:
+        if period == AggregationPeriod.MONTH:
+            buckets = [MonthlyRollupModel.year, MonthlyRollupModel.month]
+        else:
+            buckets = [MonthlyRollupModel.year]
+
+        query = self._filter_rollup_range(
+            select(
+                *buckets,
+                self._sum_rollup_by_type(TransactionType.INCOME),
+                self._sum_rollup_by_type(TransactionType.EXPENSE),
+            )
+            .where(MonthlyRollupModel.user_id == user_id)
+            .group_by(*buckets)
+            .order_by(*buckets),
+            start_date,
+            end_date,
+        )
+
+        result = await self._session.execute(query)
+        totals = []
+        for row in result.all():
+            year, month = (row[0], row[1]) if len(buckets) == 2 else (row[0], 1)
+            income, expense = row[-2], row[-1]
+            totals.append(
+                PeriodTotals(
+                    period_start=datetime(year, month, 1),
+                    total_income=Decimal(str(income)) if income else Decimal("0"),
+                    total_expense=Decimal(str(expense)) if expense else Decimal("0"),
+                )
+            )
+        return totals
+
+    async def update(self, transaction: Transaction) -> Transaction:
+        # Os valores anteriores são necessários para ajustar os rollups
+        model = self._loaded.pop(transaction.id, None)
+        if model is None:
+            result = await self._session.execute(
+                select(TransactionModel).where(TransactionModel.id == transaction.id)
+            )
+            model = result.scalar_one_or_none()
+
+        if model and model.user_id == transaction.user_id:
+            text_changed = (model.description, model.notes) != (
+                transaction.description,
+                transaction.notes,
+            )
+            self._rollups.add(self._rollup_key(model), -model.amount, -1)
             model.description = transaction.description
             model.amount = transaction.amount
             model.type = transaction.type
@@ -142,23 +594,158 @@ class TransactionRepositoryImpl(TransactionRepository):
             model.notes = transaction.notes
             model.category_id = transaction.category_id
             model.updated_at = transaction.updated_at
+            self._rollups.add(self._rollup_key(model), model.amount)
             await self._session.flush()
+            await self._rollups.flush()
+            if text_changed:
+                await self._search.remove([model.id])
+                await self._search.add([self._search_row(model)])
+            await self._versions.bump(model.user_id)
             return self._to_entity(model)
 
         raise ValueError("Transação não encontrada")
 
-    async def delete(self, transaction_id: UUID) -> bool:
+    async def delete(self, transaction_id: UUID, user_id: UUID) -> bool:
+        self._loaded.pop(transaction_id, None)
         result = await self._session.execute(
-            select(TransactionModel).where(TransactionModel.id == transaction_id)
+            delete(TransactionModel)
+            .where(
+                TransactionModel.id == transaction_id,
+                TransactionModel.user_id == user_id,
+            )
+            .returning(
+                TransactionModel.date,
+                TransactionModel.category_id,
+                TransactionModel.type,
+                TransactionModel.amount,
+            )
+            .execution_options(synchronize_session=False)
         )
-        model = result.scalar_one_or_none()
+        row = result.one_or_none()
 
-        if model:
-            await self._session.delete(model)
-            await self._session.flush()
-            return True
+        if row is None:
+            return False
+
+        key = MonthlyRollupStore.key_for(user_id, row.date, row.category_id, row.type)
+        self._rollups.add(key, -row.amount, -1)
+        await self._rollups.flush()
+        await self._search.remove([transaction_id])
+        await self._versions.bump(user_id)
+        return True
+
+    @staticmethod
+    def _bulk_conditions(
+        user_id: UUID,
+        ids: Optional[list[UUID]],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        type: Optional[TransactionType],
+        category_id: Optional[UUID],
+    ) -> list[ColumnElement[bool]]:
+        # A posse é sempre garantida pelo user_id no próprio WHERE
+        conditions = [TransactionModel.user_id == user_id]
+        if ids is not None:
+            conditions.append(TransactionModel.id.in_(ids))
+        if start_date:
+            conditions.append(TransactionModel.date >= start_date)
+        if end_date:
+            conditions.append(TransactionModel.date < end_date)
+        if type:
+            conditions.append(TransactionModel.type == type)
+        if category_id:
+            conditions.append(TransactionModel.category_id == category_id)
+        return conditions
+
+    async def _rollup_groups(
+        self, user_id: UUID, conditions: list[ColumnElement[bool]]
+    ) -> list[tuple[RollupKey, Decimal, int]]:
+        result = await self._session.execute(
+            MonthlyRollupStore.source_query(user_id).where(*conditions)
+        )
+        return [
+            ((uid, int(year), int(month), cat, t), Decimal(str(total)), count)
+            for uid, year, month, cat, t, total, count in result.all()
+        ]
+
+    async def update_many(
+        self,
+        user_id: UUID,
+        changes: dict[str, Any],
+        ids: Optional[list[UUID]] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        type: Optional[TransactionType] = None,
+        category_id: Optional[UUID] = None,
+    ) -> int:
+        conditions = self._bulk_conditions(
+            user_id, ids, start_date, end_date, type, category_id
+        )
+
+        # Só categoria e tipo mudam a chave dos rollups; valor e data não são
+        # alteráveis em lote, então os totais de cada grupo apenas migram
+        if "category_id" in changes or "type" in changes:
+            for key, total, count in await self._rollup_groups(user_id, conditions):
+                uid, year, month, old_category, old_type = key
+                new_category = changes.get("category_id", old_category)
+                new_key = (
+                    uid,
+                    year,
+                    month,
+                    new_category or UNCATEGORIZED_ID,
+                    changes.get("type", old_type),
+                )
+                self._rollups.add(key, -total, -count)
+                self._rollups.add(new_key, total, count)
+
+        result = await self._session.execute(
+            update(TransactionModel)
+            .where(*conditions)
+            .values(**changes, updated_at=datetime.utcnow())
+            .returning(
+                TransactionModel.id,
+                TransactionModel.user_id,
+                TransactionModel.description,
+                TransactionModel.notes,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        updated = result.all()
+        await self._rollups.flush()
+        if "description" in changes or "notes" in changes:
+            await self._search.remove([row.id for row in updated])
+            await self._search.add([dict(row._mapping) for row in updated])
+        if updated:
+            await self._versions.bump(user_id)
+        return len(updated)
+
+    async def delete_many(
+        self,
+        user_id: UUID,
+        ids: Optional[list[UUID]] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        type: Optional[TransactionType] = None,
+        category_id: Optional[UUID] = None,
+    ) -> int:
+        conditions = self._bulk_conditions(
+            user_id, ids, start_date, end_date, type, category_id
+        )
+
+        for key, total, count in await self._rollup_groups(user_id, conditions):
+            self._rollups.add(key, -total, -count)
 
-        return False
+        result = await self._session.execute(
+            delete(TransactionModel)
+            .where(*conditions)
+            .returning(TransactionModel.id)
+            .execution_options(synchronize_session=False)
+        )
+        deleted = list(result.scalars())
+        await self._rollups.flush()
+        await self._search.remove(deleted)
+        if deleted:
+            await self._versions.bump(user_id)
+        return len(deleted)
 
     async def count_by_user(
         self,
@@ -1,19 +1,56 @@
+import asyncio
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import delete, event, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.entities import User
 from src.domain.repositories import UserRepository
-from src.infrastructure.database.models import UserModel
+from src.infrastructure.cache import UserCacheBackend
+from src.infrastructure.database.models import (
+    BudgetModel,
+    CategoryModel,
+    MonthlyRollupModel,
+    RecurringRuleModel,
+    TransactionModel,
+    UserDataVersionModel,
+    UserModel,
+)
+from src.infrastructure.database.search import TransactionSearchIndex
+
+_pending_invalidations: set[asyncio.Task[None]] = set()
 
 
 class UserRepositoryImpl(UserRepository):
     """Implementação do repositório de usuários com SQLAlchemy."""
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(
+        self, session: AsyncSession, cache: Optional[UserCacheBackend] = None
+    ) -> None:
         self._session = session
+        self._cache = cache
+
+    async def _invalidate(self, user_id: UUID) -> None:
+        """Remove o usuário do cache agora e novamente após o commit.
+
+        A segunda remoção descarta o que outra requisição tenha lido do banco
+        antes de a alteração ser confirmada.
+        """
+        cache = self._cache
+        if cache is None:
+            return
+
+        await cache.delete(user_id)
+
+        def after_commit(session: object) -> None:
+            task = asyncio.get_running_loop().create_task(cache.delete(user_id))
+            _pending_invalidations.add(task)
+            task.add_done_callback(_pending_invalidations.discard)
+
+        event.listen(
+            self._session.sync_session, "after_commit", after_commit, once=True
+        )
 
     def _to_entity(self, model: UserModel) -> User:
         return User(
@@ -22,6 +59,7 @@ class UserRepositoryImpl(UserRepository):
             name=model.name,
             hashed_password=model.hashed_password,
             is_active=model.is_active,
+            initial_balance=model.initial_balance,
             created_at=model.created_at,
             updated_at=model.updated_at,
         )
@@ -33,6 +71,7 @@ class UserRepositoryImpl(UserRepository):
             name=entity.name,
             hashed_password=entity.hashed_password,
             is_active=entity.is_active,
+            initial_balance=entity.initial_balance,
             created_at=entity.created_at,
             updated_at=entity.updated_at,
         )
@@ -59,28 +98,48 @@ class UserRepositoryImpl(UserRepository):
 
     async def update(self, user: User) -> User:
         result = await self._session.execute(
-            select(UserModel).where(UserModel.id == user.id)
+            update(UserModel)
+            .where(UserModel.id == user.id)
+            .values(
+                name=user.name,
+                is_active=user.is_active,
+                initial_balance=user.initial_balance,
+                updated_at=user.updated_at,
+            )
+            .returning(UserModel)
+            .execution_options(synchronize_session=False, populate_existing=True)
         )
         model = result.scalar_one_or_none()
 
         if model:
-            model.name = user.name
-            model.is_active = user.is_active
-            model.updated_at = user.updated_at
-            await self._session.flush()
+            await self._invalidate(user.id)
             return self._to_entity(model)
 
         raise ValueError("Usuário não encontrado")
 
     async def delete(self, user_id: UUID) -> bool:
+        # Remove os dados dependentes com um comando por tabela, em vez de
+        # carregar cada linha pelas cascatas do ORM
+        await TransactionSearchIndex(self._session).remove_user(user_id)
+        for model in (
+            MonthlyRollupModel,
+            UserDataVersionModel,
+            BudgetModel,
+            TransactionModel,
+            RecurringRuleModel,
+            CategoryModel,
+        ):
+            await self._session.execute(delete(model).where(model.user_id == user_id))
+
         result = await self._session.execute(
-            select(UserModel).where(UserModel.id == user_id)
+            delete(UserModel)
+            .where(UserModel.id == user_id)
+            .returning(UserModel.id)
+            .execution_options(synchronize_session=False)
         )
-        model = result.scalar_one_or_none()
 
-        if model:
-            await self._session.delete(model)
-            await self._session.flush()
-            return True
+        if result.scalar_one_or_none() is None:
+            return False
 
-        return False
+        await self._invalidate(user_id)
+        return True
@@ -0,0 +1,206 @@
+"""Manutenção da tabela monthly_rollups.
+
+Uso:
+    python -m src.infrastructure.database.rollups verify
+    python -m src.infrastructure.database.rollups rebuild [--user-id UUID]
+"""
+
+import argparse
+import asyncio
+import sys
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Optional
+from uuid import UUID
+
+from sqlalchemy import delete, extract, func, insert, literal, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+from src.domain.entities import TransactionType
+from src.infrastructure.database.models import (
+    UNCATEGORIZED_ID,
+    MonthlyRollupModel,
+    TransactionModel,
+)
+
+RollupKey = tuple[UUID, int, int, UUID, TransactionType]
+
+_KEY_COLUMNS = ["user_id", "year", "month", "category_id", "type"]
+
+
+@dataclass
+class RollupDrift:
+    """Diferença entre a tabela de rollups e as transações de origem."""
+
+    key: RollupKey
+    expected_total: Decimal
+    expected_count: int
+    actual_total: Decimal
+    actual_count: int
+
+
+class MonthlyRollupStore:
+    """Aplica deltas, reconstrói e verifica os rollups mensais."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+        self._pending: dict[RollupKey, list[Any]] = {}
+
+    @staticmethod
+    def key_for(
+        user_id: UUID,
+        date: datetime,
+        category_id: Optional[UUID],
+        type: TransactionType,
+    ) -> RollupKey:
+        return (user_id, date.year, date.month, category_id or UNCATEGORIZED_ID, type)
+
+    def add(self, key: RollupKey, amount: Decimal, count: int = 1) -> None:
+        """Acumula um delta; use amount/count negativos para remover."""
+        pending = self._pending.setdefault(key, [Decimal("0"), 0])
+        pending[0] += amount
+        pending[1] += count
+
+    async def flush(self) -> None:
+        """Grava os deltas acumulados com um único upsert."""
+        values = [
+            dict(zip(_KEY_COLUMNS, key), total=total, count=count)
+            for key, (total, count) in self._pending.items()
+            if total or count
+        ]
+        self._pending.clear()
+        if not values:
+            return
+
+        stmt: postgresql.Insert | sqlite.Insert
+        if self._session.get_bind().dialect.name == "postgresql":
+            stmt = postgresql.insert(MonthlyRollupModel).values(values)
+        else:
+            stmt = sqlite.insert(MonthlyRollupModel).values(values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=_KEY_COLUMNS,
+            set_={
+                "total": MonthlyRollupModel.total + stmt.excluded.total,
+                "count": MonthlyRollupModel.count + stmt.excluded.count,
+            },
+        )
+        await self._session.execute(stmt)
+
+    async def move_category(self, user_id: UUID, category_id: UUID) -> None:
+        """Transfere os rollups de uma categoria removida para 'sem categoria'."""
+        result = await self._session.execute(
+            select(MonthlyRollupModel).where(
+                MonthlyRollupModel.user_id == user_id,
+                MonthlyRollupModel.category_id == category_id,
+            )
+        )
+        for row in result.scalars().all():
+            key = (user_id, row.year, row.month, UNCATEGORIZED_ID, row.type)
+            self.add(key, row.total, row.count)
+
+        await self._session.execute(
+            delete(MonthlyRollupModel).where(
+                MonthlyRollupModel.user_id == user_id,
+                MonthlyRollupModel.category_id == category_id,
+            )
+        )
+        await self.flush()
+
+    @staticmethod
+    def source_query(
+        user_id: Optional[UUID] = None,
+    ) -> Select[UUID, int, int, UUID, TransactionType, Decimal, int]:
+        """Agregação das transações no formato da tabela de rollups."""
+        year = extract("year", TransactionModel.date)
+        month = extract("month", TransactionModel.date)
+        category_id = func.coalesce(
+            TransactionModel.category_id,
+            literal(UNCATEGORIZED_ID, MonthlyRollupModel.category_id.type),
+        )
+        query = select(
+            TransactionModel.user_id,
+            year,
+            month,
+            category_id,
+            TransactionModel.type,
+            func.sum(TransactionModel.amount),
+            func.count(TransactionModel.id),
+        ).group_by(
+            TransactionModel.user_id, year, month, category_id, TransactionModel.type
+        )
+
+        if user_id:
+            query = query.where(TransactionModel.user_id == user_id)
+        return query
+
+    async def rebuild(self, user_id: Optional[UUID] = None) -> None:
+        """Recalcula os rollups a partir das transações."""
+        stmt = delete(MonthlyRollupModel)
+        if user_id:
+            stmt = stmt.where(MonthlyRollupModel.user_id == user_id)
+        await self._session.execute(stmt)
+
+        await self._session.execute(
+            insert(MonthlyRollupModel).from_select(
+                [*_KEY_COLUMNS, "total", "count"], self.source_query(user_id)
+            )
+        )
+
+    async def verify(self, user_id: Optional[UUID] = None) -> list[RollupDrift]:
+        """Compara os rollups com as transações e retorna as divergências."""
+        expected: dict[RollupKey, tuple[Decimal, int]] = {}
+        result = await self._session.execute(self.source_query(user_id))
+        for uid, year, month, category_id, type, total, count in result.all():
+            key = (uid, int(year), int(month), category_id, type)
+            expected[key] = (Decimal(str(total)), count)
+
+        query = select(MonthlyRollupModel)
+        if user_id:
+            query = query.where(MonthlyRollupModel.user_id == user_id)
+        actual: dict[RollupKey, tuple[Decimal, int]] = {}
+        rollups = await self._session.execute(query)
+        for row in rollups.scalars().all():
+            if row.count or row.total:
+                key = (row.user_id, row.year, row.month, row.category_id, row.type)
+                actual[key] = (Decimal(str(row.total)), row.count)
+
+        zero = (Decimal("0"), 0)
+        return [
+            RollupDrift(key, *expected.get(key, zero), *actual.get(key, zero))
+            for key in sorted(expected.keys() | actual.keys(), key=str)
+            if expected.get(key, zero) != actual.get(key, zero)
+        ]
+
+
+async def _main(argv: list[str]) -> int:
+    from src.infrastructure.database.database import get_database
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("command", choices=["verify", "rebuild"])
+    parser.add_argument("--user-id", type=UUID, default=None)
+    args = parser.parse_args(argv)
+
+    drifts: list[RollupDrift] = []
+    async for session in get_database().get_session():
+        store = MonthlyRollupStore(session)
+        if args.command == "rebuild":
+            await store.rebuild(args.user_id)
+            print("Rollups reconstruídos")
+        else:
+            drifts = await store.verify(args.user_id)
+            for drift in drifts:
+                print(
+                    f"{drift.key}: "
+                    f"esperado {drift.expected_total}/{drift.expected_count}, "
+                    f"encontrado {drift.actual_total}/{drift.actual_count}"
+                )
+            print(f"{len(drifts)} divergência(s) encontrada(s)")
+
+    return 1 if drifts else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(_main(sys.argv[1:])))
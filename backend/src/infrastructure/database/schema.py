@@ -0,0 +1,54 @@
+"""Revisão do esquema do banco, gerido exclusivamente pelo Alembic."""
+
+from pathlib import Path
+from typing import Optional
+
+from alembic import command
+from alembic.config import Config
+from alembic.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy.engine import Connection
+
+from src.infrastructure.database.database import Database
+
+ALEMBIC_INI = Path(__file__).resolve().parents[3] / "alembic.ini"
+
+
+class SchemaOutOfDateError(RuntimeError):
+    """O banco não está na última revisão das migrações."""
+
+
+def alembic_config(database_url: Optional[str] = None) -> Config:
+    config = Config(str(ALEMBIC_INI))
+    if database_url:
+        config.set_main_option("sqlalchemy.url", database_url)
+    return config
+
+
+def head_revision() -> Optional[str]:
+    return ScriptDirectory.from_config(alembic_config()).get_current_head()
+
+
+def upgrade_schema(database_url: str, revision: str = "head") -> None:
+    """Aplica as migrações (equivale a ``alembic upgrade head``).
+
+    Síncrono e fora de um event loop: o env.py do Alembic usa asyncio.run.
+    """
+    command.upgrade(alembic_config(database_url), revision)
+
+
+def _current_revision(connection: Connection) -> Optional[str]:
+    return MigrationContext.configure(connection).get_current_revision()
+
+
+async def ensure_schema_current(database: Database) -> None:
+    """Recusa iniciar a aplicação com o banco fora da última revisão."""
+    async with database.engine.connect() as connection:
+        current = await connection.run_sync(_current_revision)
+
+    head = head_revision()
+    if current != head:
+        raise SchemaOutOfDateError(
+            f"Banco na revisão {current or 'nenhuma'}, esperado {head}: "
+            "execute 'alembic upgrade head' antes de iniciar a aplicação"
+        )
@@ -0,0 +1,217 @@
+"""Índice de busca textual das transações (descrição e observações).
+
+No PostgreSQL a busca usa um índice GIN sobre ``transaction_search_vector()``,
+que o próprio banco mantém. No SQLite usa a tabela FTS5 ``transactions_fts``,
+atualizada pelo repositório na mesma transação de cada escrita.
+
+Uso:
+    python -m src.infrastructure.database.search rebuild
+"""
+
+import argparse
+import asyncio
+import re
+import sys
+from typing import Any, Iterable, Mapping, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import (
+    Column,
+    MetaData,
+    String,
+    Table,
+    Uuid,
+    delete,
+    func,
+    insert,
+    literal_column,
+    select,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Insert, Select
+from sqlalchemy.sql.elements import ColumnClause, Label
+
+from src.infrastructure.database.models import (
+    TransactionModel,
+    transaction_search_vector,
+)
+
+# Tabela virtual criada por TRANSACTIONS_FTS_DDL; fica fora de Base.metadata
+# para que create_all não tente criá-la como tabela comum
+TRANSACTIONS_FTS = Table(
+    "transactions_fts",
+    MetaData(),
+    Column("description", String),
+    Column("notes", String),
+    Column("user_id", Uuid),
+    Column("transaction_id", Uuid),
+)
+
+_MAX_TERMS = 10
+# IDs por comando DELETE ... MATCH
+_REMOVE_BATCH_SIZE = 200
+# Pesos do bm25 por coluna (descrição, observações, user_id, transaction_id)
+_BM25_WEIGHTS = (10.0, 5.0, 0.0, 0.0)
+
+_fts: ColumnClause[Any] = literal_column("transactions_fts")
+
+
+def search_terms(query: str) -> list[str]:
+    """Palavras da busca, sem a sintaxe de consulta do FTS5/tsquery."""
+    terms = re.findall(r"\w+", query.lower())[:_MAX_TERMS]
+    if not terms:
+        raise ValueError("Informe ao menos uma palavra para buscar")
+    return terms
+
+
+def _match_ids(column: str, ids: Iterable[UUID]) -> str:
+    """Expressão MATCH por IDs (gravados como hex, um único token)."""
+    quoted = " OR ".join(f'"{id.hex}"' for id in ids)
+    return f"{column} : ({quoted})"
+
+
+class TransactionSearchIndex:
+    """Mantém e consulta o índice de busca das transações."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    @property
+    def _uses_fts(self) -> bool:
+        return self._session.get_bind().dialect.name == "sqlite"
+
+    async def add(self, rows: Sequence[Mapping[str, Any]]) -> None:
+        """Indexa transações recém-gravadas (dicts com id, user_id,
+        description e notes)."""
+        if not rows or not self._uses_fts:
+            return
+
+        await self._session.execute(
+            insert(TRANSACTIONS_FTS),
+            [
+                {
+                    "description": row["description"],
+                    "notes": row["notes"] or "",
+                    "user_id": row["user_id"],
+                    "transaction_id": row["id"],
+                }
+                for row in rows
+            ],
+        )
+
+    async def remove(self, transaction_ids: list[UUID]) -> None:
+        if not transaction_ids or not self._uses_fts:
+            return
+
+        for start in range(0, len(transaction_ids), _REMOVE_BATCH_SIZE):
+            batch = transaction_ids[start : start + _REMOVE_BATCH_SIZE]
+            await self._session.execute(
+                delete(TRANSACTIONS_FTS).where(
+                    _fts.op("MATCH")(_match_ids("transaction_id", batch))
+                )
+            )
+
+    async def remove_user(self, user_id: UUID) -> None:
+        if self._uses_fts:
+            await self._session.execute(
+                delete(TRANSACTIONS_FTS).where(
+                    _fts.op("MATCH")(_match_ids("user_id", [user_id]))
+                )
+            )
+
+    def apply(
+        self,
+        query: Select[*tuple[Any, ...]],
+        user_id: UUID,
+        text: str,
+        limit: int,
+        offset: int,
+    ) -> Select[*tuple[Any, ...]]:
+        """Restringe uma consulta de transações às que casam com ``text``,
+        ordenadas por relevância e paginadas. Cada palavra casa também como
+        prefixo."""
+        terms = search_terms(text)
+
+        if not self._uses_fts:
+            vector = transaction_search_vector()
+            tsquery = func.to_tsquery(
+                literal_column("'simple'"), " & ".join(f"{term}:*" for term in terms)
+            )
+            return (
+                query.where(
+                    TransactionModel.user_id == user_id, vector.op("@@")(tsquery)
+                )
+                .order_by(
+                    func.ts_rank(vector, tsquery).desc(),
+                    TransactionModel.date.desc(),
+                    TransactionModel.id.desc(),
+                )
+                .limit(limit)
+                .offset(offset)
+            )
+
+        words = " AND ".join(f'"{term}"*' for term in terms)
+        match = (
+            f"{_match_ids('user_id', [user_id])} AND "
+            f"{{description notes}} : ({words})"
+        )
+        # Ordena e pagina dentro do FTS5; só a página é buscada em transactions
+        score = func.bm25(_fts, *_BM25_WEIGHTS).label("score")
+        rowid: Label[Any] = literal_column("transactions_fts.rowid").label("position")
+        page = (
+            select(TRANSACTIONS_FTS.c.transaction_id, score, rowid)
+            .where(_fts.op("MATCH")(match))
+            .order_by(score, rowid.desc())
+            .limit(limit)
+            .offset(offset)
+            .subquery("matches")
+        )
+        return query.join(page, page.c.transaction_id == TransactionModel.id).order_by(
+            page.c.score, page.c.position.desc()
+        )
+
+    async def rebuild(self, user_id: Optional[UUID] = None) -> None:
+        """Recria o índice FTS5 a partir das transações."""
+        if not self._uses_fts:
+            return
+
+        if user_id:
+            await self.remove_user(user_id)
+        else:
+            await self._session.execute(delete(TRANSACTIONS_FTS))
+        await self._session.execute(self.populate_statement(user_id))
+
+    @staticmethod
+    def populate_statement(user_id: Optional[UUID] = None) -> Insert:
+        """INSERT ... SELECT que indexa as transações existentes no FTS5."""
+        source = select(
+            TransactionModel.description,
+            func.coalesce(TransactionModel.notes, ""),
+            TransactionModel.user_id,
+            TransactionModel.id,
+        )
+        if user_id:
+            source = source.where(TransactionModel.user_id == user_id)
+
+        return insert(TRANSACTIONS_FTS).from_select(
+            ["description", "notes", "user_id", "transaction_id"], source
+        )
+
+
+async def _main(argv: list[str]) -> int:
+    from src.infrastructure.database.database import get_database
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("command", choices=["rebuild"])
+    parser.add_argument("--user-id", type=UUID, default=None)
+    args = parser.parse_args(argv)
+
+    async for session in get_database().get_session():
+        await TransactionSearchIndex(session).rebuild(args.user_id)
+        print("Índice de busca reconstruído")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(_main(sys.argv[1:])))
@@ -0,0 +1,4 @@
+from .csv_writer import EXPORT_COLUMNS, write_csv
+from .ndjson_writer import write_ndjson
+
+__all__ = ["EXPORT_COLUMNS", "write_csv", "write_ndjson"]
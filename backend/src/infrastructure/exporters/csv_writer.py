@@ -0,0 +1,33 @@
+import csv
+import io
+from typing import Any, AsyncIterator
+
+EXPORT_COLUMNS = ("id", "date", "description", "amount", "type", "category_id", "notes")
+
+
+async def write_csv(
+    batches: AsyncIterator[list[tuple[Any, ...]]],
+) -> AsyncIterator[bytes]:
+    """Codifica lotes de linhas de transação em CSV, um bloco de bytes por lote."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    writer.writerow(EXPORT_COLUMNS)
+    yield buffer.getvalue().encode()
+
+    async for rows in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(
+            (
+                id,
+                date.isoformat(),
+                description,
+                amount,
+                type.value,
+                category_id or "",
+                notes or "",
+            )
+            for id, date, description, amount, type, category_id, notes in rows
+        )
+        yield buffer.getvalue().encode()
@@ -0,0 +1,27 @@
+import json
+from typing import Any, AsyncIterator
+
+from .csv_writer import EXPORT_COLUMNS
+
+
+async def write_ndjson(
+    batches: AsyncIterator[list[tuple[Any, ...]]],
+) -> AsyncIterator[bytes]:
+    """Codifica lotes de linhas de transação em NDJSON (um objeto por linha)."""
+    encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+    async for rows in batches:
+        lines = []
+        for id, date, description, amount, type, category_id, notes in rows:
+            values = (
+                str(id),
+                date.isoformat(),
+                description,
+                str(amount),
+                type.value,
+                str(category_id) if category_id else None,
+                notes,
+            )
+            lines.append(encoder.encode(dict(zip(EXPORT_COLUMNS, values))))
+        lines.append("")
+        yield "\n".join(lines).encode()
@@ -0,0 +1,4 @@
+from .csv_parser import parse_csv
+from .ofx_parser import parse_ofx
+
+__all__ = ["parse_csv", "parse_ofx"]
@@ -0,0 +1,24 @@
+import csv
+import io
+from typing import Any, BinaryIO, Iterator
+
+COLUMNS = ("description", "amount", "type", "category_id", "date", "notes")
+
+
+def parse_csv(
+    file: BinaryIO, encoding: str = "utf-8-sig"
+) -> Iterator[tuple[int, dict[str, Any]]]:
+    """Lê um CSV de transações linha a linha, sem carregar o arquivo inteiro.
+
+    O cabeçalho deve usar os nomes de campo de TransactionCreateDTO. Retorna
+    pares (número da linha, campos) com células vazias omitidas.
+    """
+    reader = csv.DictReader(io.TextIOWrapper(file, encoding=encoding, newline=""))
+
+    for row in reader:
+        data = {
+            key.strip().lower(): value.strip()
+            for key, value in row.items()
+            if key and value and key.strip().lower() in COLUMNS
+        }
+        yield reader.line_num, data
@@ -0,0 +1,79 @@
+import io
+import re
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from typing import Any, BinaryIO, Iterator
+
+from src.domain.entities import TransactionType
+
+_TAG = re.compile(r"<(/?)([A-Za-z0-9.]+)>([^<]*)")
+
+
+def _parse_date(value: str) -> str:
+    # Formato OFX: AAAAMMDD[HHMMSS[.XXX]][[-3:BRT]]
+    digits = value[:14]
+    fmt = "%Y%m%d%H%M%S" if len(digits) == 14 else "%Y%m%d"
+    try:
+        return datetime.strptime(digits, fmt).isoformat()
+    except ValueError:
+        return value
+
+
+def _to_row(fields: dict[str, str]) -> dict[str, Any]:
+    data: dict[str, Any] = {}
+
+    name = fields.get("NAME") or fields.get("MEMO")
+    if name:
+        data["description"] = name[:200]
+    if fields.get("NAME") and fields.get("MEMO"):
+        data["notes"] = fields["MEMO"][:500]
+    if "DTPOSTED" in fields:
+        data["date"] = _parse_date(fields["DTPOSTED"])
+
+    raw_amount = fields.get("TRNAMT", "").replace(",", ".")
+    try:
+        amount = Decimal(raw_amount)
+    except InvalidOperation:
+        data["amount"] = raw_amount
+    else:
+        data["amount"] = abs(amount)
+        data["type"] = TransactionType.EXPENSE if amount < 0 else TransactionType.INCOME
+
+    return data
+
+
+def parse_ofx(
+    file: BinaryIO, encoding: str = "latin-1"
+) -> Iterator[tuple[int, dict[str, Any]]]:
+    """Lê os lançamentos (<STMTTRN>) de um extrato OFX de forma incremental.
+
+    Aceita tanto o formato SGML (OFX 1.x, sem tags de fechamento) quanto o XML
+    (OFX 2.x). Retorna pares (número do lançamento, campos).
+    """
+    text = io.TextIOWrapper(file, encoding=encoding, errors="replace")
+    buffer = ""
+    fields: dict[str, str] | None = None
+    number = 0
+
+    for line in text:
+        buffer += line
+        # Processa apenas tags completas; o restante aguarda a próxima linha
+        cut = buffer.rfind("<")
+        complete, buffer = buffer[:cut], buffer[cut:]
+
+        for closing, tag, value in _TAG.findall(complete):
+            tag = tag.upper()
+            if tag == "STMTTRN":
+                if closing and fields is not None:
+                    number += 1
+                    yield number, _to_row(fields)
+                    fields = None
+                elif not closing:
+                    fields = {}
+            elif fields is not None and not closing:
+                fields[tag] = value.strip()
+
+    for closing, tag, value in _TAG.findall(buffer):
+        if tag.upper() == "STMTTRN" and closing and fields is not None:
+            number += 1
+            yield number, _to_row(fields)
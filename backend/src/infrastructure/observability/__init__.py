@@ -0,0 +1,21 @@
+from .metrics import REGISTRY, Counter, Gauge, Histogram, MetricsRegistry
+from .sql import (
+    QueryStats,
+    instrument_engine,
+    log_event,
+    normalize_statement,
+    query_stats_scope,
+)
+
+__all__ = [
+    "REGISTRY",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "QueryStats",
+    "instrument_engine",
+    "log_event",
+    "normalize_statement",
+    "query_stats_scope",
+]
@@ -0,0 +1,114 @@
+"""Instrumentação das consultas SQL por engine e por requisição."""
+
+import json
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from src.infrastructure.observability.metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+QUERY_DURATION = REGISTRY.histogram(
+    "db_query_duration_seconds",
+    "Duração das consultas SQL",
+    ("engine", "operation"),
+)
+
+_OPERATIONS = {"SELECT", "INSERT", "UPDATE", "DELETE", "WITH", "PRAGMA"}
+_STATEMENT_MAX_LENGTH = 500
+
+
+@dataclass(slots=True)
+class QueryStats:
+    """Consultas executadas dentro de um escopo (normalmente uma requisição)."""
+
+    count: int = 0
+    total_seconds: float = 0.0
+    slowest_seconds: float = 0.0
+    slowest_statement: Optional[str] = None
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.count += 1
+        self.total_seconds += elapsed
+        if elapsed > self.slowest_seconds:
+            self.slowest_seconds = elapsed
+            self.slowest_statement = statement
+
+
+# Guarda um objeto mutável: os eventos do SQLAlchemy rodam em outro greenlet
+# e registram no mesmo QueryStats da requisição
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar(
+    "db_query_stats", default=None
+)
+
+
+@contextmanager
+def query_stats_scope() -> Iterator[QueryStats]:
+    """Acumula as consultas executadas no contexto atual."""
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def normalize_statement(statement: str) -> str:
+    """Remove quebras de linha e limita o tamanho do SQL para logs."""
+    return " ".join(statement.split())[:_STATEMENT_MAX_LENGTH]
+
+
+def log_event(event_name: str, level: int = logging.WARNING, **fields: Any) -> None:
+    """Linha de log estruturada (JSON)."""
+    logger.log(level, json.dumps({"event": event_name, **fields}, ensure_ascii=False))
+
+
+def instrument_engine(engine: Engine, name: str, slow_query_seconds: float) -> None:
+    """Mede cada consulta do engine e loga as que excedem o limite."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        elapsed = time.perf_counter() - conn.info["query_start_time"].pop()
+        words = statement.split(None, 1)
+        operation = words[0].upper() if words else ""
+        if operation not in _OPERATIONS:
+            operation = "OTHER"
+        QUERY_DURATION.observe(elapsed, engine=name, operation=operation)
+
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.record(statement, elapsed)
+
+        if elapsed >= slow_query_seconds:
+            log_event(
+                "slow_query",
+                engine=name,
+                duration_ms=round(elapsed * 1000, 2),
+                executemany=executemany,
+                statement=normalize_statement(statement),
+            )
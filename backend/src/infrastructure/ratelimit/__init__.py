@@ -0,0 +1,23 @@
+from .admission import (
+    AdmissionController,
+    AdmissionRejectedError,
+    get_admission_controller,
+)
+from .token_bucket import (
+    InMemoryRateLimitBackend,
+    RateLimitBackend,
+    RateLimitDecision,
+    RedisRateLimitBackend,
+    get_rate_limit_backend,
+)
+
+__all__ = [
+    "RateLimitBackend",
+    "RateLimitDecision",
+    "InMemoryRateLimitBackend",
+    "RedisRateLimitBackend",
+    "get_rate_limit_backend",
+    "AdmissionController",
+    "AdmissionRejectedError",
+    "get_admission_controller",
+]
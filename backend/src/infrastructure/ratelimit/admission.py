@@ -0,0 +1,140 @@
+import asyncio
+import time
+from collections import deque
+from typing import Callable, Optional
+
+from src.infrastructure.config import get_settings
+from src.infrastructure.database.database import pool_saturation
+from src.infrastructure.observability import REGISTRY
+
+ADMISSION_REJECTED = REGISTRY.counter(
+    "http_admission_rejected_total",
+    "Requisições recusadas pelo controle de admissão",
+    ("reason",),
+)
+ADMISSION_WAIT = REGISTRY.histogram(
+    "http_admission_wait_seconds",
+    "Tempo na fila de admissão das requisições que esperaram",
+)
+
+# Intervalo para reavaliar a saturação do pool enquanto ninguém libera vaga
+# (o pool também é usado fora das requisições, ex.: agendador)
+_POLL_SECONDS = 0.05
+
+
+class AdmissionRejectedError(Exception):
+    """Fila de admissão cheia ou tempo de espera esgotado."""
+
+
+class AdmissionController:
+    """Limita as requisições simultâneas e a ocupação do pool de conexões.
+
+    Uma requisição entra quando há menos de ``max_concurrency`` em andamento
+    (0 desativa o limite fixo) e a saturação do pool está abaixo de
+    ``saturation_threshold``. Caso contrário espera em uma fila FIFO de até
+    ``max_queue`` posições por no máximo ``queue_timeout`` segundos; fora
+    disso é recusada com AdmissionRejectedError.
+    """
+
+    def __init__(
+        self,
+        saturation: Callable[[], float],
+        saturation_threshold: float = 0.9,
+        max_concurrency: int = 0,
+        max_queue: int = 100,
+        queue_timeout: float = 2.0,
+    ) -> None:
+        self._saturation = saturation
+        self._threshold = saturation_threshold
+        self._max_concurrency = max_concurrency
+        self._max_queue = max_queue
+        self._queue_timeout = queue_timeout
+        self._in_flight = 0
+        self._waiters: deque[object] = deque()
+        self._changed = asyncio.Event()
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    def _has_capacity(self) -> bool:
+        if self._max_concurrency and self._in_flight >= self._max_concurrency:
+            return False
+        return self._saturation() < self._threshold
+
+    def _notify(self) -> None:
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def _wait_turn(self) -> None:
+        if len(self._waiters) >= self._max_queue:
+            ADMISSION_REJECTED.inc(reason="queue_full")
+            raise AdmissionRejectedError("Servidor sobrecarregado")
+
+        start = time.monotonic()
+        deadline = start + self._queue_timeout
+        turn = object()
+        self._waiters.append(turn)
+        try:
+            while not (self._waiters[0] is turn and self._has_capacity()):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    ADMISSION_REJECTED.inc(reason="timeout")
+                    raise AdmissionRejectedError("Servidor sobrecarregado")
+                try:
+                    await asyncio.wait_for(
+                        self._changed.wait(), min(remaining, _POLL_SECONDS)
+                    )
+                except TimeoutError:
+                    pass
+        finally:
+            self._waiters.remove(turn)
+            # O próximo da fila reavalia sem esperar o intervalo
+            self._notify()
+        ADMISSION_WAIT.observe(time.monotonic() - start)
+
+    async def acquire(self) -> None:
+        """Aguarda a vez da requisição; cada acquire exige um release."""
+        if self._waiters or not self._has_capacity():
+            await self._wait_turn()
+        self._in_flight += 1
+
+    def release(self) -> None:
+        self._in_flight -= 1
+        self._notify()
+
+
+_admission_controller: Optional[AdmissionController] = None
+
+
+def get_admission_controller() -> AdmissionController:
+    global _admission_controller
+    if _admission_controller is None:
+        settings = get_settings()
+        _admission_controller = AdmissionController(
+            pool_saturation,
+            saturation_threshold=settings.admission_pool_saturation,
+            max_concurrency=settings.admission_max_concurrency,
+            max_queue=settings.admission_max_queue,
+            queue_timeout=settings.admission_queue_timeout,
+        )
+    return _admission_controller
+
+
+def _admission_usage() -> dict[tuple[str, ...], float]:
+    controller = _admission_controller
+    if controller is None:
+        return {}
+    return {("in_flight",): controller.in_flight, ("queued",): controller.queued}
+
+
+REGISTRY.gauge(
+    "http_admission_requests",
+    "Requisições admitidas em andamento e na fila de admissão",
+    ("state",),
+    callback=_admission_usage,
+)
@@ -0,0 +1,145 @@
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from src.infrastructure.config import get_settings
+from src.infrastructure.observability import REGISTRY, log_event
+
+RATE_LIMIT_BACKEND_ERRORS = REGISTRY.counter(
+    "rate_limit_backend_errors_total",
+    "Falhas do backend compartilhado de rate limit (requisição liberada)",
+)
+
+
+@dataclass(slots=True)
+class RateLimitDecision:
+    """Resultado de uma tentativa de consumir fichas do bucket."""
+
+    allowed: bool
+    remaining: float
+    retry_after: float = 0.0
+
+
+class RateLimitBackend(ABC):
+    """Interface para o armazenamento dos token buckets.
+
+    Implementações compartilhadas (ex.: Redis) aplicam o mesmo limite a
+    todos os workers.
+    """
+
+    @abstractmethod
+    async def consume(
+        self, key: str, cost: float, rate: float, burst: float
+    ) -> RateLimitDecision:
+        """Consome ``cost`` fichas do bucket de ``key``, que recebe ``rate``
+        fichas por segundo até o máximo de ``burst``."""
+        pass
+
+
+def _refill(
+    tokens: float, elapsed: float, cost: float, rate: float, burst: float
+) -> tuple[float, RateLimitDecision]:
+    tokens = min(burst, tokens + elapsed * rate)
+    # Um custo acima do burst nunca seria atendido
+    cost = min(cost, burst)
+    if tokens >= cost:
+        return tokens - cost, RateLimitDecision(True, tokens - cost)
+    return tokens, RateLimitDecision(False, tokens, (cost - tokens) / rate)
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """Buckets em memória do processo, com descarte LRU das chaves."""
+
+    def __init__(self, max_keys: int) -> None:
+        self._max_keys = max_keys
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    async def consume(
+        self, key: str, cost: float, rate: float, burst: float
+    ) -> RateLimitDecision:
+        now = time.monotonic()
+        tokens, updated_at = self._buckets.get(key, (burst, now))
+        tokens, decision = _refill(tokens, now - updated_at, cost, rate, burst)
+
+        self._buckets[key] = (tokens, now)
+        self._buckets.move_to_end(key)
+        while len(self._buckets) > self._max_keys:
+            self._buckets.popitem(last=False)
+        return decision
+
+
+# Atualiza o bucket atomicamente no Redis, com o relógio do próprio servidor
+_REDIS_CONSUME = """
+local burst = tonumber(ARGV[3])
+local rate = tonumber(ARGV[2])
+local cost = math.min(tonumber(ARGV[1]), burst)
+local clock = redis.call("TIME")
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call("HMGET", KEYS[1], "tokens", "ts")
+local tokens = tonumber(state[1]) or burst
+local ts = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+if tokens >= cost then
+    tokens = tokens - cost
+    allowed = 1
+end
+redis.call("HSET", KEYS[1], "tokens", tostring(tokens), "ts", tostring(now))
+redis.call("PEXPIRE", KEYS[1], math.ceil(burst / rate * 1000) + 1000)
+return {allowed, tostring(tokens)}
+"""
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """Buckets no Redis, compartilhados entre workers e instâncias.
+
+    Requer o extra ``redis`` (``pip install -e .[redis]``). Se o Redis ficar
+    indisponível, as requisições são liberadas em vez de falhar.
+    """
+
+    def __init__(self, url: str, prefix: str = "ratelimit:") -> None:
+        import redis.asyncio as redis
+
+        self._errors: tuple[type[Exception], ...] = (redis.RedisError, OSError)
+        self._client: Any = redis.from_url(url)
+        self._script = self._client.register_script(_REDIS_CONSUME)
+        self._prefix = prefix
+
+    async def consume(
+        self, key: str, cost: float, rate: float, burst: float
+    ) -> RateLimitDecision:
+        try:
+            allowed, tokens = await self._script(
+                keys=[self._prefix + key], args=[cost, rate, burst]
+            )
+        except self._errors as error:
+            RATE_LIMIT_BACKEND_ERRORS.inc()
+            log_event("rate_limit_backend_error", error=repr(error))
+            return RateLimitDecision(True, burst)
+
+        remaining = float(tokens)
+        if allowed:
+            return RateLimitDecision(True, remaining)
+        retry_after = (min(cost, burst) - remaining) / rate
+        return RateLimitDecision(False, remaining, retry_after)
+
+
+_rate_limit_backend: Optional[RateLimitBackend] = None
+
+
+def get_rate_limit_backend() -> RateLimitBackend:
+    global _rate_limit_backend
+    if _rate_limit_backend is None:
+        settings = get_settings()
+        if settings.rate_limit_backend == "redis":
+            _rate_limit_backend = RedisRateLimitBackend(settings.rate_limit_redis_url)
+        else:
+            _rate_limit_backend = InMemoryRateLimitBackend(
+                max_keys=settings.rate_limit_max_keys
+            )
+    return _rate_limit_backend
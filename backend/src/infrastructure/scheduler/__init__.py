@@ -0,0 +1,3 @@
+from .recurring_scheduler import RecurringTransactionScheduler
+
+__all__ = ["RecurringTransactionScheduler"]
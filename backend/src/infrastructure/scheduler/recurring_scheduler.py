@@ -0,0 +1,91 @@
+import asyncio
+import logging
+from datetime import datetime
+from typing import Optional
+
+from src.application.use_cases import MaterializeRecurringRulesUseCase
+from src.infrastructure.database.database import Database
+from src.infrastructure.database.repositories import (
+    RecurringRuleRepositoryImpl,
+    TransactionRepositoryImpl,
+)
+from src.infrastructure.observability import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+RECURRING_CREATED = REGISTRY.counter(
+    "recurring_transactions_created_total",
+    "Transações geradas a partir de regras recorrentes",
+)
+RECURRING_FAILURES = REGISTRY.counter(
+    "recurring_scheduler_failures_total",
+    "Execuções do agendador de recorrências que falharam",
+)
+
+
+class RecurringTransactionScheduler:
+    """Tarefa em segundo plano que gera as transações das regras recorrentes.
+
+    A cada ``interval_seconds`` processa as regras vencidas de todos os
+    usuários em lotes limitados, cada um na sua própria transação de banco.
+    Depois de uma parada, os lotes seguintes recuperam o atraso; a chave
+    única (regra, data) torna seguro repetir um lote ou rodar vários workers.
+    """
+
+    def __init__(
+        self,
+        database: Database,
+        interval_seconds: float = 60.0,
+        rule_batch_size: int = 200,
+        occurrence_batch_size: int = 24,
+    ) -> None:
+        self._database = database
+        self._interval = interval_seconds
+        self._rule_batch_size = rule_batch_size
+        self._occurrence_batch_size = occurrence_batch_size
+        self._task: Optional[asyncio.Task[None]] = None
+
+    async def run_once(self, now: Optional[datetime] = None) -> int:
+        """Processa lotes até esgotar as regras vencidas; retorna o total criado."""
+        now = now or datetime.utcnow()
+        total = 0
+        while True:
+            async for session in self._database.get_session():
+                use_case = MaterializeRecurringRulesUseCase(
+                    RecurringRuleRepositoryImpl(session),
+                    TransactionRepositoryImpl(session),
+                    rule_limit=self._rule_batch_size,
+                    occurrence_limit=self._occurrence_batch_size,
+                )
+                processed, created = await use_case.execute(now)
+
+            total += created
+            RECURRING_CREATED.inc(created)
+            if not processed:
+                return total
+            # Cada lote avança todas as regras processadas; cede o loop
+            # entre lotes para não atrasar as requisições
+            await asyncio.sleep(0)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except Exception:
+                RECURRING_FAILURES.inc()
+                logger.exception("Falha ao gerar transações recorrentes")
+            await asyncio.sleep(self._interval)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
@@ -1,4 +1,10 @@
+from .hash_executor import PasswordHashExecutor, get_hash_executor
 from .password_service_impl import PasswordServiceImpl
 from .jwt_service import JWTService
 
-__all__ = ["PasswordServiceImpl", "JWTService"]
+__all__ = [
+    "PasswordServiceImpl",
+    "JWTService",
+    "PasswordHashExecutor",
+    "get_hash_executor",
+]
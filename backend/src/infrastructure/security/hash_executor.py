@@ -0,0 +1,70 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+
+from src.domain.services import PasswordServiceBusyError
+from src.infrastructure.config import get_settings
+from src.infrastructure.observability import REGISTRY
+
+T = TypeVar("T")
+
+HASH_REJECTED = REGISTRY.counter(
+    "password_hash_rejected_total",
+    "Operações de hashing recusadas por fila cheia",
+)
+
+
+class PasswordHashExecutor:
+    """Executa o bcrypt em um pool de threads limitado, fora do event loop.
+
+    O bcrypt libera o GIL, então as threads rodam em paralelo. Quando há mais
+    de ``max_workers + max_queue`` operações pendentes, novas chamadas falham
+    imediatamente com PasswordServiceBusyError em vez de acumular latência.
+    """
+
+    def __init__(self, max_workers: int = 4, max_queue: int = 32) -> None:
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="bcrypt"
+        )
+        self._limit = max_workers + max_queue
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    async def run(self, func: Callable[..., T], *args: object) -> T:
+        if self._pending >= self._limit:
+            HASH_REJECTED.inc()
+            raise PasswordServiceBusyError("Serviço temporariamente sobrecarregado")
+
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+        finally:
+            self._pending -= 1
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_hash_executor: Optional[PasswordHashExecutor] = None
+
+
+def get_hash_executor() -> PasswordHashExecutor:
+    global _hash_executor
+    if _hash_executor is None:
+        settings = get_settings()
+        _hash_executor = PasswordHashExecutor(
+            max_workers=settings.password_hash_workers,
+            max_queue=settings.password_hash_max_queue,
+        )
+    return _hash_executor
+
+
+REGISTRY.gauge(
+    "password_hash_pending",
+    "Operações de hashing em execução ou na fila",
+    callback=lambda: {(): float(_hash_executor.pending if _hash_executor else 0)},
+)
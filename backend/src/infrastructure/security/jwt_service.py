@@ -1,5 +1,12 @@
-from datetime import datetime, timedelta
-from typing import Any, Optional
+import base64
+import hashlib
+import hmac
+import json
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Optional
 from uuid import UUID
 
 from jose import JWTError, jwt
@@ -7,28 +14,141 @@ from jose import JWTError, jwt
 from src.infrastructure.config import Settings
 
 
+class JWTBackend(ABC):
+    """Interface para codificação e verificação de tokens JWT."""
+
+    @abstractmethod
+    def encode(self, claims: dict[str, Any]) -> str:
+        """Assina as claims e retorna o token."""
+        pass
+
+    @abstractmethod
+    def decode(self, token: str) -> Optional[dict[str, Any]]:
+        """Verifica o token e retorna as claims, ou None se inválido."""
+        pass
+
+
+class JoseBackend(JWTBackend):
+    """Backend padrão usando python-jose."""
+
+    def __init__(self, secret_key: str, algorithm: str) -> None:
+        self._secret_key = secret_key
+        self._algorithm = algorithm
+
+    def encode(self, claims: dict[str, Any]) -> str:
+        return jwt.encode(claims, self._secret_key, algorithm=self._algorithm)
+
+    def decode(self, token: str) -> Optional[dict[str, Any]]:
+        try:
+            return jwt.decode(token, self._secret_key, algorithms=[self._algorithm])
+        except JWTError:
+            return None
+
+
+def _b64encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _b64decode(data: bytes) -> bytes:
+    return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+
+
+class HMACBackend(JWTBackend):
+    """Backend enxuto para HS256/HS384/HS512 com a chave HMAC pré-computada.
+
+    Cada token copia o objeto HMAC já inicializado com a chave, evitando o
+    processamento da chave e a camada genérica do python-jose.
+    """
+
+    _DIGESTS = {
+        "HS256": hashlib.sha256,
+        "HS384": hashlib.sha384,
+        "HS512": hashlib.sha512,
+    }
+
+    def __init__(self, secret_key: str, algorithm: str) -> None:
+        if algorithm not in self._DIGESTS:
+            raise ValueError(f"Algoritmo não suportado pelo backend hmac: {algorithm}")
+        self._algorithm = algorithm
+        self._mac = hmac.new(secret_key.encode(), digestmod=self._DIGESTS[algorithm])
+        header = json.dumps({"alg": algorithm, "typ": "JWT"}, separators=(",", ":"))
+        self._header = _b64encode(header.encode())
+
+    def _sign(self, signing_input: bytes) -> bytes:
+        mac = self._mac.copy()
+        mac.update(signing_input)
+        return mac.digest()
+
+    def encode(self, claims: dict[str, Any]) -> str:
+        payload = _b64encode(json.dumps(claims, separators=(",", ":")).encode())
+        signing_input = self._header + b"." + payload
+        return (signing_input + b"." + _b64encode(self._sign(signing_input))).decode()
+
+    def decode(self, token: str) -> Optional[dict[str, Any]]:
+        try:
+            raw = token.encode("ascii")
+            signing_input, _, signature = raw.rpartition(b".")
+            header, _, payload = signing_input.partition(b".")
+            expected = self._sign(signing_input)
+            if not hmac.compare_digest(expected, _b64decode(signature)):
+                return None
+            if json.loads(_b64decode(header)).get("alg") != self._algorithm:
+                return None
+            claims = json.loads(_b64decode(payload))
+        except (ValueError, UnicodeError):
+            return None
+
+        if not isinstance(claims, dict):
+            return None
+        now = time.time()
+        exp = claims.get("exp", now + 1)
+        if not isinstance(exp, (int, float)) or exp <= now:
+            return None
+        nbf = claims.get("nbf", now)
+        if not isinstance(nbf, (int, float)) or nbf > now:
+            return None
+        return claims
+
+
+_BACKENDS: dict[str, Callable[[str, str], JWTBackend]] = {
+    "jose": JoseBackend,
+    "hmac": HMACBackend,
+}
+
+
 class JWTService:
-    """Serviço para criação e validação de tokens JWT."""
+    """Serviço para criação e validação de tokens JWT.
+
+    Tokens já verificados ficam em um LRU (token -> user_id, exp) até expirarem,
+    então requisições repetidas com o mesmo token não refazem a verificação.
+    """
 
     def __init__(self, settings: Settings) -> None:
-        self._secret_key = settings.jwt_secret_key
-        self._algorithm = settings.jwt_algorithm
         self._expire_minutes = settings.jwt_expire_minutes
+        self._backend = _BACKENDS[settings.jwt_backend](
+            settings.jwt_secret_key, settings.jwt_algorithm
+        )
+        self._cache: OrderedDict[str, tuple[UUID, float]] = OrderedDict()
+        self._cache_size = settings.jwt_cache_size
 
     def create_access_token(self, data: dict[str, Any]) -> str:
         to_encode = data.copy()
-        expire = datetime.utcnow() + timedelta(minutes=self._expire_minutes)
-        to_encode.update({"exp": expire})
-        return jwt.encode(to_encode, self._secret_key, algorithm=self._algorithm)
+        expire = datetime.now(timezone.utc) + timedelta(minutes=self._expire_minutes)
+        to_encode.update({"exp": int(expire.timestamp())})
+        return self._backend.encode(to_encode)
 
     def decode_token(self, token: str) -> Optional[dict[str, Any]]:
-        try:
-            payload = jwt.decode(token, self._secret_key, algorithms=[self._algorithm])
-            return payload
-        except JWTError:
-            return None
+        return self._backend.decode(token)
 
     def get_user_id_from_token(self, token: str) -> Optional[UUID]:
+        cached = self._cache.get(token)
+        if cached is not None:
+            cached_user_id, cached_exp = cached
+            if cached_exp > time.time():
+                self._cache.move_to_end(token)
+                return cached_user_id
+            del self._cache[token]
+
         payload = self.decode_token(token)
         if not payload:
             return None
@@ -38,6 +158,14 @@ class JWTService:
             return None
 
         try:
-            return UUID(user_id)
-        except ValueError:
+            user_uuid = UUID(user_id)
+        except (TypeError, ValueError):
             return None
+
+        exp = payload.get("exp")
+        if self._cache_size and isinstance(exp, (int, float)):
+            self._cache[token] = (user_uuid, float(exp))
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+        return user_uuid
@@ -1,16 +1,39 @@
+from typing import Optional
+
 from passlib.context import CryptContext
 
 from src.domain.services import PasswordService
+from src.infrastructure.security.hash_executor import (
+    PasswordHashExecutor,
+    get_hash_executor,
+)
 
 
 class PasswordServiceImpl(PasswordService):
     """Implementação do serviço de senhas usando bcrypt."""
 
-    def __init__(self) -> None:
-        self._context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    def __init__(
+        self,
+        rounds: int = 12,
+        executor: Optional[PasswordHashExecutor] = None,
+    ) -> None:
+        self._context = CryptContext(
+            schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=rounds
+        )
+        self._executor = executor or get_hash_executor()
 
     def hash_password(self, password: str) -> str:
         return self._context.hash(password)
 
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         return self._context.verify(plain_password, hashed_password)
+
+    async def hash_password_async(self, password: str) -> str:
+        return await self._executor.run(self.hash_password, password)
+
+    async def verify_password_async(
+        self, plain_password: str, hashed_password: str
+    ) -> bool:
+        return await self._executor.run(
+            self.verify_password, plain_password, hashed_password
+        )
@@ -2,26 +2,61 @@ from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from fastapi import FastAPI
+from fastapi.datastructures import Default
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 
 from src.infrastructure.config import get_settings
 from src.infrastructure.database.database import get_database
+from src.infrastructure.database.schema import ensure_schema_current
+from src.infrastructure.observability import REGISTRY
+from src.infrastructure.ratelimit import (
+    get_admission_controller,
+    get_rate_limit_backend,
+)
+from src.infrastructure.scheduler import RecurringTransactionScheduler
 from src.presentation.api import (
+    analytics_router,
     auth_router,
     budgets_router,
     categories_router,
+    recurring_rules_router,
     transactions_router,
     users_router,
 )
+from src.presentation.api.middleware import (
+    AdmissionControlMiddleware,
+    QueryInstrumentationMiddleware,
+    RateLimitMiddleware,
+    ReadReplicaRoutingMiddleware,
+)
+from src.presentation.api.responses import PydanticJSONResponse
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Gerencia o ciclo de vida da aplicação."""
+    settings = get_settings()
     database = get_database()
-    await database.create_tables()
+    # O esquema é aplicado pelo Alembic (alembic upgrade head), nunca por create_all
+    await ensure_schema_current(database)
+
+    scheduler = None
+    if settings.recurring_scheduler_enabled:
+        scheduler = RecurringTransactionScheduler(
+            database,
+            interval_seconds=settings.recurring_scheduler_interval_seconds,
+            rule_batch_size=settings.recurring_rule_batch_size,
+            occurrence_batch_size=settings.recurring_occurrence_batch_size,
+        )
+        scheduler.start()
+
     yield
 
+    if scheduler is not None:
+        await scheduler.stop()
+    await database.dispose()
+
 
 def create_app() -> FastAPI:
     """Factory para criar a aplicação FastAPI."""
@@ -34,14 +69,38 @@ def create_app() -> FastAPI:
         docs_url="/docs",
         redoc_url="/redoc",
         lifespan=lifespan,
+        # Default() mantém a serialização direta via response_model nas rotas tipadas.
+        default_response_class=Default(PydanticJSONResponse),
     )
 
+    app.add_middleware(ReadReplicaRoutingMiddleware)
+    app.add_middleware(
+        QueryInstrumentationMiddleware,
+        server_timing=settings.server_timing_enabled,
+        slow_request_db_ms=settings.slow_request_db_threshold_ms,
+        slow_request_query_count=settings.slow_request_query_count,
+    )
+    # Executados antes da instrumentação: o rate limit descarta o excesso de
+    # cada cliente e só então a requisição disputa vaga na admissão
+    if settings.admission_control_enabled:
+        app.add_middleware(
+            AdmissionControlMiddleware, controller=get_admission_controller()
+        )
+    if settings.rate_limit_enabled:
+        app.add_middleware(
+            RateLimitMiddleware,
+            backend=get_rate_limit_backend(),
+            rate=settings.rate_limit_rate,
+            burst=settings.rate_limit_burst,
+            route_costs=settings.rate_limit_route_costs,
+        )
     app.add_middleware(
         CORSMiddleware,
         allow_origins=settings.cors_origins,
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["X-Next-Cursor", "ETag", "Server-Timing", "Retry-After"],
     )
 
     api_prefix = "/api/v1"
@@ -50,11 +109,17 @@ def create_app() -> FastAPI:
     app.include_router(categories_router, prefix=api_prefix)
     app.include_router(transactions_router, prefix=api_prefix)
     app.include_router(budgets_router, prefix=api_prefix)
+    app.include_router(analytics_router, prefix=api_prefix)
+    app.include_router(recurring_rules_router, prefix=api_prefix)
 
     @app.get("/health")
     async def health_check() -> dict[str, str]:
         return {"status": "healthy"}
 
+    @app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+    async def metrics() -> str:
+        return REGISTRY.render()
+
     return app
 
 
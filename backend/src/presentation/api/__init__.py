@@ -1,5 +1,13 @@
 from .dependencies import get_current_user
-from .routers import auth_router, users_router, categories_router, transactions_router, budgets_router
+from .routers import (
+    auth_router,
+    users_router,
+    categories_router,
+    transactions_router,
+    budgets_router,
+    analytics_router,
+    recurring_rules_router,
+)
 
 __all__ = [
     "get_current_user",
@@ -8,4 +16,6 @@ __all__ = [
     "categories_router",
     "transactions_router",
     "budgets_router",
+    "analytics_router",
+    "recurring_rules_router",
 ]
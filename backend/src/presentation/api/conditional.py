@@ -0,0 +1,71 @@
+import hashlib
+from typing import Any, Awaitable, Callable, Optional
+from uuid import UUID
+
+from fastapi import Request, Response, status
+
+from src.infrastructure.cache import ResponseCacheBackend
+from src.presentation.api.responses import dump_json
+
+
+class ConditionalResponder:
+    """Respostas de leitura com ETag derivado da versão dos dados do usuário.
+
+    Se o cliente envia um ETag ainda válido em If-None-Match, responde 304 sem
+    executar a consulta. Com o cache de respostas ativo, reaproveita o corpo
+    serializado para a mesma (usuário, rota, parâmetros, versão). O corpo é
+    gerado pelo serializador pré-compilado do ``response_model`` da rota.
+    """
+
+    def __init__(
+        self,
+        request: Request,
+        user_id: UUID,
+        version: int,
+        cache: Optional[ResponseCacheBackend] = None,
+    ) -> None:
+        self._request = request
+        self._user_id = user_id
+        self._version = version
+        self._cache = cache
+
+    def _matches(self, etag: str) -> bool:
+        header = self._request.headers.get("if-none-match")
+        if not header:
+            return False
+        candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+        return etag in candidates or "*" in candidates
+
+    async def respond(
+        self, build: Callable[[], Awaitable[Any]], **params: Any
+    ) -> Response:
+        """Executa ``build`` apenas se não houver 304 nem corpo em cache.
+
+        ``params`` deve conter os parâmetros já resolvidos que afetam o
+        resultado (inclusive valores padrão dependentes da data atual).
+        """
+        key = (
+            self._user_id,
+            self._request.url.path,
+            tuple(sorted((name, str(value)) for name, value in params.items())),
+            self._version,
+        )
+        digest = hashlib.blake2b(repr(key).encode(), digest_size=12).hexdigest()
+        etag = f'"{digest}"'
+        headers = {
+            "ETag": etag,
+            "Cache-Control": "private, no-cache",
+            "Vary": "Authorization",
+        }
+
+        if self._matches(etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        body = await self._cache.get(key) if self._cache is not None else None
+        if body is None:
+            route = self._request.scope.get("route")
+            body = dump_json(await build(), getattr(route, "response_model", None))
+            if self._cache is not None:
+                await self._cache.set(key, body)
+
+        return Response(content=body, media_type="application/json", headers=headers)
@@ -1,38 +1,55 @@
-from typing import Annotated
+from functools import lru_cache
+from typing import Annotated, Optional
 from uuid import UUID
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.entities import User
-from src.infrastructure.config import Settings, get_settings
-from src.infrastructure.database import get_db
+from src.infrastructure.cache import (
+    ResponseCacheBackend,
+    UserCacheBackend,
+    get_response_cache,
+    get_user_cache,
+)
+from src.infrastructure.config import get_settings
+from src.infrastructure.database import get_db, get_read_db
+from src.infrastructure.database.data_versions import DataVersionStore
 from src.infrastructure.database.repositories import (
     BudgetRepositoryImpl,
     CategoryRepositoryImpl,
+    RecurringRuleRepositoryImpl,
     TransactionRepositoryImpl,
     UserRepositoryImpl,
 )
-from src.infrastructure.security import JWTService, PasswordServiceImpl
+from src.infrastructure.security import (
+    JWTService,
+    PasswordServiceImpl,
+    get_hash_executor,
+)
+from src.presentation.api.conditional import ConditionalResponder
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
 
+@lru_cache
 def get_password_service() -> PasswordServiceImpl:
-    return PasswordServiceImpl()
+    """Instância única por processo, como o executor de hash que ela usa."""
+    return PasswordServiceImpl(get_settings().bcrypt_rounds, get_hash_executor())
 
 
-def get_jwt_service(
-    settings: Annotated[Settings, Depends(get_settings)]
-) -> JWTService:
-    return JWTService(settings)
+@lru_cache
+def get_jwt_service() -> JWTService:
+    """Instância única por processo, compartilhando o cache de tokens."""
+    return JWTService(get_settings())
 
 
 def get_user_repository(
-    session: Annotated[AsyncSession, Depends(get_db)]
+    session: Annotated[AsyncSession, Depends(get_db)],
+    user_cache: Annotated[UserCacheBackend, Depends(get_user_cache)],
 ) -> UserRepositoryImpl:
-    return UserRepositoryImpl(session)
+    return UserRepositoryImpl(session, user_cache)
 
 
 def get_category_repository(
@@ -53,10 +70,35 @@ def get_budget_repository(
     return BudgetRepositoryImpl(session)
 
 
+def get_recurring_rule_repository(
+    session: Annotated[AsyncSession, Depends(get_db)]
+) -> RecurringRuleRepositoryImpl:
+    return RecurringRuleRepositoryImpl(session)
+
+
+def get_read_category_repository(
+    session: Annotated[AsyncSession, Depends(get_read_db)]
+) -> CategoryRepositoryImpl:
+    return CategoryRepositoryImpl(session)
+
+
+def get_read_transaction_repository(
+    session: Annotated[AsyncSession, Depends(get_read_db)]
+) -> TransactionRepositoryImpl:
+    return TransactionRepositoryImpl(session)
+
+
+def get_read_budget_repository(
+    session: Annotated[AsyncSession, Depends(get_read_db)]
+) -> BudgetRepositoryImpl:
+    return BudgetRepositoryImpl(session)
+
+
 async def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)],
     jwt_service: Annotated[JWTService, Depends(get_jwt_service)],
     user_repository: Annotated[UserRepositoryImpl, Depends(get_user_repository)],
+    user_cache: Annotated[UserCacheBackend, Depends(get_user_cache)],
 ) -> User:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -68,9 +110,13 @@ async def get_current_user(
     if not user_id:
         raise credentials_exception
 
-    user = await user_repository.get_by_id(user_id)
-    if not user:
-        raise credentials_exception
+    user = await user_cache.get(user_id)
+    if user is None:
+        user = await user_repository.get_by_id(user_id)
+        if not user:
+            raise credentials_exception
+        if user.is_active:
+            await user_cache.set(user)
 
     if not user.is_active:
         raise HTTPException(
@@ -82,3 +128,18 @@ async def get_current_user(
 
 
 CurrentUser = Annotated[User, Depends(get_current_user)]
+
+
+async def get_conditional_responder(
+    request: Request,
+    current_user: CurrentUser,
+    session: Annotated[AsyncSession, Depends(get_read_db)],
+    response_cache: Annotated[
+        Optional[ResponseCacheBackend], Depends(get_response_cache)
+    ],
+) -> ConditionalResponder:
+    version = await DataVersionStore(session).get(current_user.id)
+    return ConditionalResponder(request, current_user.id, version, response_cache)
+
+
+Conditional = Annotated[ConditionalResponder, Depends(get_conditional_responder)]
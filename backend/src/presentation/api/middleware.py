@@ -0,0 +1,255 @@
+import math
+import re
+import time
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse
+from starlette.routing import compile_path
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.database.database import request_routing_scope
+from src.infrastructure.observability import (
+    REGISTRY,
+    QueryStats,
+    log_event,
+    normalize_statement,
+    query_stats_scope,
+)
+from src.infrastructure.ratelimit import (
+    AdmissionController,
+    AdmissionRejectedError,
+    RateLimitBackend,
+)
+from src.presentation.api.dependencies import get_jwt_service
+
+REQUEST_DB_QUERIES = REGISTRY.histogram(
+    "http_request_db_queries",
+    "Consultas SQL por requisição",
+    ("method", "route"),
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100, 200),
+)
+REQUEST_DB_SECONDS = REGISTRY.histogram(
+    "http_request_db_seconds",
+    "Tempo total em SQL por requisição",
+    ("method", "route"),
+)
+RATE_LIMITED = REGISTRY.counter(
+    "http_rate_limited_total",
+    "Requisições recusadas pelo rate limit",
+    ("method", "route"),
+)
+
+# Rotas que nunca passam pelo rate limit nem pelo controle de admissão
+EXEMPT_PATHS = ("/health", "/metrics")
+
+
+class ReadReplicaRoutingMiddleware:
+    """Reinicia o roteamento para réplicas no início de cada requisição.
+
+    Depois de uma escrita, as leituras da mesma requisição usam o primário.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with request_routing_scope():
+            await self.app(scope, receive, send)
+
+
+def _server_timing(stats: QueryStats, elapsed: float) -> str:
+    return (
+        f'db;dur={stats.total_seconds * 1000:.2f};desc="{stats.count} queries", '
+        f"db-slowest;dur={stats.slowest_seconds * 1000:.2f}, "
+        f"app;dur={elapsed * 1000:.2f}"
+    )
+
+
+def _route_template(scope: Scope) -> str:
+    """Caminho da rota encontrada, com parâmetros, para rotular métricas."""
+    # O router grava a rota no scope; em routers incluídos ela pode vir sem o
+    # prefixo da inclusão, recuperado do trecho do caminho antes do casamento
+    route = scope.get("route")
+    path_regex = getattr(route, "path_regex", None)
+    if route is None or path_regex is None:
+        return "unmatched"
+    match = re.search(path_regex.pattern.removeprefix("^"), scope["path"])
+    prefix = scope["path"][: match.start()] if match else ""
+    return prefix + str(route.path)
+
+
+class QueryInstrumentationMiddleware:
+    """Mede as consultas SQL de cada requisição.
+
+    Envia o resumo no cabeçalho Server-Timing, registra histogramas por rota
+    e gera um log estruturado quando a requisição passa do tempo total em SQL
+    ou do número de consultas configurados.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        server_timing: bool = True,
+        slow_request_db_ms: float = 250.0,
+        slow_request_query_count: int = 25,
+    ) -> None:
+        self.app = app
+        self.server_timing = server_timing
+        self.slow_request_db_seconds = slow_request_db_ms / 1000
+        self.slow_request_query_count = slow_request_query_count
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+
+        with query_stats_scope() as stats:
+
+            async def send_with_timing(message: Message) -> None:
+                nonlocal status_code
+                if message["type"] == "http.response.start":
+                    status_code = message["status"]
+                    if self.server_timing:
+                        headers = MutableHeaders(scope=message)
+                        headers.append(
+                            "Server-Timing",
+                            _server_timing(stats, time.perf_counter() - start),
+                        )
+                await send(message)
+
+            await self.app(scope, receive, send_with_timing)
+
+        route = _route_template(scope)
+        method = scope["method"]
+        REQUEST_DB_QUERIES.observe(stats.count, method=method, route=route)
+        REQUEST_DB_SECONDS.observe(stats.total_seconds, method=method, route=route)
+
+        if (
+            stats.total_seconds >= self.slow_request_db_seconds
+            or stats.count >= self.slow_request_query_count
+        ):
+            log_event(
+                "slow_request_db",
+                method=method,
+                route=route,
+                status=status_code,
+                db_queries=stats.count,
+                db_time_ms=round(stats.total_seconds * 1000, 2),
+                duration_ms=round((time.perf_counter() - start) * 1000, 2),
+                slowest_ms=round(stats.slowest_seconds * 1000, 2),
+                slowest_statement=normalize_statement(stats.slowest_statement or ""),
+            )
+
+
+class _RouteCosts:
+    """Custo de cada rota no rate limit, a partir de "MÉTODO /caminho"."""
+
+    def __init__(self, costs: dict[str, float], default: float = 1.0) -> None:
+        self._default = default
+        self._routes: list[tuple[str, re.Pattern[str], str, float]] = []
+        for route, cost in costs.items():
+            method, _, path = route.partition(" ")
+            self._routes.append((method.upper(), compile_path(path)[0], path, cost))
+
+    def match(self, method: str, path: str) -> tuple[str, float]:
+        for route_method, regex, template, cost in self._routes:
+            if route_method == method and regex.match(path):
+                return template, cost
+        return "other", self._default
+
+
+class RateLimitMiddleware:
+    """Token bucket por usuário autenticado (JWT) ou, sem token válido, por IP.
+
+    Cada rota consome o custo configurado; sem fichas suficientes a resposta
+    é 429 com Retry-After. O IP vem do servidor ASGI (use --proxy-headers do
+    uvicorn atrás de um proxy reverso).
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        backend: RateLimitBackend,
+        rate: float,
+        burst: float,
+        route_costs: Optional[dict[str, float]] = None,
+    ) -> None:
+        self.app = app
+        self.backend = backend
+        self.rate = rate
+        self.burst = burst
+        self.route_costs = _RouteCosts(route_costs or {})
+
+    @staticmethod
+    def _client_key(scope: Scope) -> str:
+        authorization = Headers(scope=scope).get("authorization", "")
+        scheme, _, token = authorization.partition(" ")
+        if scheme.lower() == "bearer" and token:
+            # Tokens já verificados saem do cache do JWTService
+            user_id = get_jwt_service().get_user_id_from_token(token)
+            if user_id:
+                return f"user:{user_id}"
+
+        client = scope.get("client")
+        return f"ip:{client[0] if client else 'unknown'}"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in EXEMPT_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        route, cost = self.route_costs.match(method, scope["path"])
+        decision = await self.backend.consume(
+            self._client_key(scope), cost, self.rate, self.burst
+        )
+        if decision.allowed:
+            await self.app(scope, receive, send)
+            return
+
+        RATE_LIMITED.inc(method=method, route=route)
+        response = JSONResponse(
+            {"detail": "Limite de requisições excedido"},
+            status_code=429,
+            headers={"Retry-After": str(max(1, math.ceil(decision.retry_after)))},
+        )
+        await response(scope, receive, send)
+
+
+class AdmissionControlMiddleware:
+    """Admite as requisições pelo AdmissionController.
+
+    Com a fila de admissão cheia ou o tempo de espera esgotado, responde 503
+    com Retry-After antes de abrir qualquer conexão com o banco.
+    """
+
+    def __init__(self, app: ASGIApp, controller: AdmissionController) -> None:
+        self.app = app
+        self.controller = controller
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in EXEMPT_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            await self.controller.acquire()
+        except AdmissionRejectedError as error:
+            response = JSONResponse(
+                {"detail": str(error)}, status_code=503, headers={"Retry-After": "1"}
+            )
+            await response(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.release()
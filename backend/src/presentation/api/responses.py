@@ -0,0 +1,34 @@
+from functools import lru_cache
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+
+
+class PydanticJSONResponse(JSONResponse):
+    """JSONResponse serializada pelo pydantic-core.
+
+    Decimal vira string, UUID e datetime viram texto ISO, como nas rotas
+    com ``response_model``.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+@lru_cache(maxsize=None)
+def serializer_for(response_type: Any) -> TypeAdapter[Any]:
+    """TypeAdapter compilado uma única vez por tipo de resposta."""
+    return TypeAdapter(response_type)
+
+
+def dump_json(value: Any, response_type: Any = None) -> bytes:
+    """Serializa ``value`` direto para bytes.
+
+    Com ``response_type`` usa o serializador pré-compilado do tipo; sem ele,
+    infere a serialização a partir dos valores.
+    """
+    if response_type is None:
+        return to_json(value)
+    return serializer_for(response_type).dump_json(value)
@@ -3,6 +3,8 @@ from .users import router as users_router
 from .categories import router as categories_router
 from .transactions import router as transactions_router
 from .budgets import router as budgets_router
+from .analytics import router as analytics_router
+from .recurring_rules import router as recurring_rules_router
 
 __all__ = [
     "auth_router",
@@ -10,4 +12,6 @@ __all__ = [
     "categories_router",
     "transactions_router",
     "budgets_router",
+    "analytics_router",
+    "recurring_rules_router",
 ]
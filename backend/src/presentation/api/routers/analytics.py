@@ -0,0 +1,183 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import Annotated, Optional
+from uuid import UUID
+
+import numpy as np
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.dtos import (
+    CashflowDTO,
+    CashflowPointDTO,
+    CategoryBreakdownDTO,
+    CategoryBreakdownItemDTO,
+)
+from src.domain.entities import AggregationPeriod, TransactionType
+from src.infrastructure.analytics import (
+    AnalyticsEngine,
+    load_balance_before,
+    load_category_names,
+    load_transaction_columns,
+)
+from src.infrastructure.database import get_read_db
+from src.presentation.api.dependencies import Conditional, CurrentUser
+
+router = APIRouter(prefix="/analytics", tags=["Análises"])
+
+UNCATEGORIZED = "Sem categoria"
+
+
+def _money(cents: int) -> Decimal:
+    return Decimal(int(cents)).scaleb(-2)
+
+
+def _check_range(start_date: Optional[datetime], end_date: Optional[datetime]) -> None:
+    if start_date and end_date and start_date >= end_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="A data inicial deve ser anterior à data final",
+        )
+
+
+@router.get("/cashflow", response_model=CashflowDTO)
+async def get_cashflow(
+    current_user: CurrentUser,
+    session: Annotated[AsyncSession, Depends(get_read_db)],
+    conditional: Conditional,
+    start_date: Optional[datetime] = Query(None),
+    end_date: Optional[datetime] = Query(None),
+    period: AggregationPeriod = Query(AggregationPeriod.MONTH),
+    window: int = Query(3, ge=1, le=60),
+) -> Response:
+    """Retorna receitas, despesas e saldo acumulado por período."""
+    _check_range(start_date, end_date)
+
+    async def build() -> CashflowDTO:
+        opening = int(current_user.initial_balance * 100)
+        if start_date:
+            opening += await load_balance_before(session, current_user.id, start_date)
+        columns = await load_transaction_columns(
+            session, current_user.id, start_date, end_date
+        )
+        series = AnalyticsEngine(columns, start_date, end_date).cashflow(
+            period, opening, window
+        )
+
+        points = [
+            CashflowPointDTO(
+                period_start=period_start,
+                income=_money(income),
+                expense=_money(expense),
+                net=_money(income - expense),
+                balance=_money(balance),
+                moving_average=None if np.isnan(average) else _money(round(average)),
+            )
+            for period_start, income, expense, balance, average in zip(
+                series.periods.tolist(),
+                series.income.tolist(),
+                series.expense.tolist(),
+                series.balance.tolist(),
+                series.moving_average.tolist(),
+            )
+        ]
+        return CashflowDTO(
+            period=period,
+            window=window,
+            opening_balance=_money(opening),
+            closing_balance=points[-1].balance if points else _money(opening),
+            points=points,
+        )
+
+    try:
+        return await conditional.respond(
+            build,
+            start_date=start_date,
+            end_date=end_date,
+            period=period.value,
+            window=window,
+            initial_balance=current_user.initial_balance,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+
+@router.get("/breakdown", response_model=CategoryBreakdownDTO)
+async def get_breakdown(
+    current_user: CurrentUser,
+    session: Annotated[AsyncSession, Depends(get_read_db)],
+    conditional: Conditional,
+    start_date: Optional[datetime] = Query(None),
+    end_date: Optional[datetime] = Query(None),
+    period: AggregationPeriod = Query(AggregationPeriod.MONTH),
+    type: TransactionType = Query(TransactionType.EXPENSE),
+    top: int = Query(5, ge=1, le=50),
+) -> Response:
+    """Retorna as maiores categorias e a série de cada uma por período."""
+    _check_range(start_date, end_date)
+
+    async def build() -> CategoryBreakdownDTO:
+        columns = await load_transaction_columns(
+            session, current_user.id, start_date, end_date
+        )
+        breakdown = AnalyticsEngine(columns, start_date, end_date).breakdown(
+            period, type == TransactionType.INCOME, top
+        )
+        names = await load_category_names(session, current_user.id)
+        grand_total = breakdown.grand_total
+
+        def item(
+            category_id: Optional[UUID], name: str, total: int, series: np.ndarray
+        ) -> CategoryBreakdownItemDTO:
+            return CategoryBreakdownItemDTO(
+                category_id=category_id,
+                name=name,
+                total=_money(total),
+                share=round(total / grand_total, 4) if grand_total else 0.0,
+                series=[_money(cents) for cents in series.tolist()],
+            )
+
+        return CategoryBreakdownDTO(
+            period=period,
+            type=type,
+            periods=breakdown.periods.tolist(),
+            total=_money(grand_total),
+            categories=[
+                item(
+                    category_id,
+                    (
+                        names.get(category_id, UNCATEGORIZED)
+                        if category_id
+                        else UNCATEGORIZED
+                    ),
+                    total,
+                    series,
+                )
+                for category_id, total, series in zip(
+                    breakdown.category_ids, breakdown.totals.tolist(), breakdown.series
+                )
+            ],
+            other=(
+                item(None, "Outras", breakdown.other_total, breakdown.other_series)
+                if breakdown.other_total
+                else None
+            ),
+        )
+
+    try:
+        return await conditional.respond(
+            build,
+            start_date=start_date,
+            end_date=end_date,
+            period=period.value,
+            type=type.value,
+            top=top,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
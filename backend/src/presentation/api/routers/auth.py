@@ -5,6 +5,7 @@ from fastapi.security import OAuth2PasswordRequestForm
 
 from src.application.dtos import LoginDTO, TokenDTO, UserCreateDTO, UserResponseDTO
 from src.application.use_cases import CreateUserUseCase, LoginUseCase
+from src.domain.services import PasswordServiceBusyError
 from src.infrastructure.database.repositories import UserRepositoryImpl
 from src.infrastructure.security import JWTService, PasswordServiceImpl
 from src.presentation.api.dependencies import (
@@ -16,6 +17,14 @@ from src.presentation.api.dependencies import (
 router = APIRouter(prefix="/auth", tags=["Autenticação"])
 
 
+def _service_busy(error: PasswordServiceBusyError) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=str(error),
+        headers={"Retry-After": "1"},
+    )
+
+
 @router.post("/register", response_model=UserResponseDTO, status_code=status.HTTP_201_CREATED)
 async def register(
     dto: UserCreateDTO,
@@ -27,6 +36,8 @@ async def register(
 
     try:
         return await use_case.execute(dto)
+    except PasswordServiceBusyError as e:
+        raise _service_busy(e)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -45,7 +56,10 @@ async def login(
     use_case = LoginUseCase(user_repository, password_service, jwt_service)
 
     dto = LoginDTO(email=form_data.username, password=form_data.password)
-    result = await use_case.execute(dto)
+    try:
+        result = await use_case.execute(dto)
+    except PasswordServiceBusyError as e:
+        raise _service_busy(e)
 
     if not result:
         raise HTTPException(
@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 
 from src.application.dtos import BudgetCreateDTO, BudgetResponseDTO, BudgetUpdateDTO
 from src.application.use_cases import (
@@ -13,9 +13,11 @@ from src.application.use_cases import (
 )
 from src.infrastructure.database.repositories import BudgetRepositoryImpl, TransactionRepositoryImpl
 from src.presentation.api.dependencies import (
+    Conditional,
     CurrentUser,
     get_budget_repository,
-    get_transaction_repository,
+    get_read_budget_repository,
+    get_read_transaction_repository,
 )
 
 router = APIRouter(prefix="/budgets", tags=["Orçamentos"])
@@ -42,14 +44,23 @@ async def create_budget(
 @router.get("/", response_model=list[BudgetResponseDTO])
 async def list_budgets(
     current_user: CurrentUser,
-    budget_repository: Annotated[BudgetRepositoryImpl, Depends(get_budget_repository)],
-    transaction_repository: Annotated[TransactionRepositoryImpl, Depends(get_transaction_repository)],
+    budget_repository: Annotated[
+        BudgetRepositoryImpl, Depends(get_read_budget_repository)
+    ],
+    transaction_repository: Annotated[
+        TransactionRepositoryImpl, Depends(get_read_transaction_repository)
+    ],
+    conditional: Conditional,
     month: int = Query(default_factory=lambda: datetime.utcnow().month, ge=1, le=12),
     year: int = Query(default_factory=lambda: datetime.utcnow().year, ge=2000),
-) -> list[BudgetResponseDTO]:
+) -> Response:
     """Lista os orçamentos do usuário para um período."""
     use_case = GetBudgetsUseCase(budget_repository, transaction_repository)
-    return await use_case.execute(current_user.id, month, year)
+    return await conditional.respond(
+        lambda: use_case.execute(current_user.id, month, year),
+        month=month,
+        year=year,
+    )
 
 
 @router.patch("/{budget_id}", response_model=BudgetResponseDTO)
@@ -1,7 +1,7 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 
 from src.application.dtos import CategoryCreateDTO, CategoryResponseDTO, CategoryUpdateDTO
 from src.application.use_cases import (
@@ -11,7 +11,12 @@ from src.application.use_cases import (
     UpdateCategoryUseCase,
 )
 from src.infrastructure.database.repositories import CategoryRepositoryImpl
-from src.presentation.api.dependencies import CurrentUser, get_category_repository
+from src.presentation.api.dependencies import (
+    Conditional,
+    CurrentUser,
+    get_category_repository,
+    get_read_category_repository,
+)
 
 router = APIRouter(prefix="/categories", tags=["Categorias"])
 
@@ -30,11 +35,14 @@ async def create_category(
 @router.get("/", response_model=list[CategoryResponseDTO])
 async def list_categories(
     current_user: CurrentUser,
-    category_repository: Annotated[CategoryRepositoryImpl, Depends(get_category_repository)],
-) -> list[CategoryResponseDTO]:
+    category_repository: Annotated[
+        CategoryRepositoryImpl, Depends(get_read_category_repository)
+    ],
+    conditional: Conditional,
+) -> Response:
     """Lista todas as categorias do usuário."""
     use_case = GetCategoriesUseCase(category_repository)
-    return await use_case.execute(current_user.id)
+    return await conditional.respond(lambda: use_case.execute(current_user.id))
 
 
 @router.patch("/{category_id}", response_model=CategoryResponseDTO)
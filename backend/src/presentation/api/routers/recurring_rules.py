@@ -0,0 +1,102 @@
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from src.application.dtos import (
+    RecurringRuleCreateDTO,
+    RecurringRuleResponseDTO,
+    RecurringRuleUpdateDTO,
+)
+from src.application.use_cases import (
+    CreateRecurringRuleUseCase,
+    DeleteRecurringRuleUseCase,
+    GetRecurringRulesUseCase,
+    UpdateRecurringRuleUseCase,
+)
+from src.infrastructure.database.repositories import RecurringRuleRepositoryImpl
+from src.presentation.api.dependencies import CurrentUser, get_recurring_rule_repository
+
+router = APIRouter(prefix="/recurring-rules", tags=["Recorrências"])
+
+RuleRepository = Annotated[
+    RecurringRuleRepositoryImpl, Depends(get_recurring_rule_repository)
+]
+
+
+@router.post(
+    "/", response_model=RecurringRuleResponseDTO, status_code=status.HTTP_201_CREATED
+)
+async def create_recurring_rule(
+    dto: RecurringRuleCreateDTO,
+    current_user: CurrentUser,
+    rule_repository: RuleRepository,
+) -> RecurringRuleResponseDTO:
+    """Cria uma regra de transação recorrente.
+
+    As ocorrências vencidas (inclusive as anteriores a hoje) são geradas pelo
+    agendador em segundo plano.
+    """
+    use_case = CreateRecurringRuleUseCase(rule_repository)
+
+    try:
+        return await use_case.execute(current_user.id, dto)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+
+@router.get("/", response_model=list[RecurringRuleResponseDTO])
+async def list_recurring_rules(
+    current_user: CurrentUser,
+    rule_repository: RuleRepository,
+) -> list[RecurringRuleResponseDTO]:
+    """Lista as regras recorrentes do usuário."""
+    use_case = GetRecurringRulesUseCase(rule_repository)
+    return await use_case.execute(current_user.id)
+
+
+@router.patch("/{rule_id}", response_model=RecurringRuleResponseDTO)
+async def update_recurring_rule(
+    rule_id: UUID,
+    dto: RecurringRuleUpdateDTO,
+    current_user: CurrentUser,
+    rule_repository: RuleRepository,
+) -> RecurringRuleResponseDTO:
+    """Atualiza uma regra recorrente."""
+    use_case = UpdateRecurringRuleUseCase(rule_repository)
+
+    try:
+        result = await use_case.execute(rule_id, current_user.id, dto)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+    if not result:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Regra recorrente não encontrada",
+        )
+
+    return result
+
+
+@router.delete("/{rule_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_recurring_rule(
+    rule_id: UUID,
+    current_user: CurrentUser,
+    rule_repository: RuleRepository,
+) -> None:
+    """Remove uma regra recorrente; as transações já geradas são mantidas."""
+    use_case = DeleteRecurringRuleUseCase(rule_repository)
+    success = await use_case.execute(rule_id, current_user.id)
+
+    if not success:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Regra recorrente não encontrada",
+        )
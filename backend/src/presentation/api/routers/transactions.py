@@ -1,24 +1,60 @@
+import csv
 from datetime import datetime
-from typing import Annotated, Optional
+from decimal import Decimal
+from typing import Annotated, Any, AsyncIterator, Literal, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Response,
+    UploadFile,
+    status,
+)
+from fastapi.responses import StreamingResponse
 
 from src.application.dtos import (
+    TransactionBulkDeleteDTO,
+    TransactionBulkResultDTO,
+    TransactionBulkUpdateDTO,
     TransactionCreateDTO,
+    TransactionImportResultDTO,
     TransactionResponseDTO,
     TransactionUpdateDTO,
 )
 from src.application.use_cases import (
+    BulkDeleteTransactionsUseCase,
+    BulkUpdateTransactionsUseCase,
     CreateTransactionUseCase,
     DeleteTransactionUseCase,
-    GetTransactionsUseCase,
+    GetTransactionsPageUseCase,
     GetTransactionSummaryUseCase,
+    ImportTransactionsUseCase,
+    SearchTransactionsUseCase,
+)
+from src.application.use_cases.transaction_use_cases import (
+    MonthlySummaryDTO,
+    TransactionSummaryDTO,
+)
+from src.domain.entities import AggregationPeriod, TransactionType
+from src.infrastructure.config import Settings, get_settings
+from src.infrastructure.database.database import get_database
+from src.infrastructure.database.repositories import (
+    CategoryRepositoryImpl,
+    TransactionRepositoryImpl,
+)
+from src.infrastructure.exporters import write_csv, write_ndjson
+from src.infrastructure.importers import parse_csv, parse_ofx
+from src.presentation.api.dependencies import (
+    Conditional,
+    CurrentUser,
+    get_category_repository,
+    get_read_transaction_repository,
+    get_transaction_repository,
 )
-from src.application.use_cases.transaction_use_cases import TransactionSummaryDTO
-from src.domain.entities import TransactionType
-from src.infrastructure.database.repositories import TransactionRepositoryImpl
-from src.presentation.api.dependencies import CurrentUser, get_transaction_repository
 
 router = APIRouter(prefix="/transactions", tags=["Transações"])
 
@@ -34,84 +70,252 @@ async def create_transaction(
     return await use_case.execute(current_user.id, dto)
 
 
+@router.post("/import", response_model=TransactionImportResultDTO)
+async def import_transactions(
+    current_user: CurrentUser,
+    transaction_repository: Annotated[
+        TransactionRepositoryImpl, Depends(get_transaction_repository)
+    ],
+    category_repository: Annotated[
+        CategoryRepositoryImpl, Depends(get_category_repository)
+    ],
+    settings: Annotated[Settings, Depends(get_settings)],
+    file: UploadFile = File(...),
+    format: Optional[Literal["csv", "ofx"]] = Query(None),
+) -> TransactionImportResultDTO:
+    """Importa transações de um arquivo CSV ou OFX.
+
+    O arquivo é lido em fluxo e inserido em lotes dentro de uma única transação;
+    linhas inválidas são ignoradas e listadas no resultado.
+    """
+    if format is None:
+        filename = (file.filename or "").lower()
+        format = "ofx" if filename.endswith((".ofx", ".qfx")) else "csv"
+
+    rows = parse_ofx(file.file) if format == "ofx" else parse_csv(file.file)
+    use_case = ImportTransactionsUseCase(
+        transaction_repository, category_repository, settings.import_batch_size
+    )
+
+    try:
+        return await use_case.execute(current_user.id, rows)
+    except (UnicodeDecodeError, csv.Error):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Arquivo inválido",
+        )
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_transactions(
+    current_user: CurrentUser,
+    format: Literal["csv", "ndjson"] = Query("csv"),
+    start_date: Optional[datetime] = Query(None),
+    end_date: Optional[datetime] = Query(None),
+    type: Optional[TransactionType] = Query(None),
+    category_id: Optional[UUID] = Query(None),
+) -> StreamingResponse:
+    """Exporta as transações do usuário em CSV ou NDJSON, em fluxo."""
+
+    async def batches() -> AsyncIterator[list[tuple[Any, ...]]]:
+        # A resposta é enviada depois que o endpoint retorna, então a
+        # exportação usa uma sessão própria, aberta durante o streaming
+        async for session in get_database().get_read_session():
+            repository = TransactionRepositoryImpl(session)
+            async for rows in repository.stream_by_user(
+                user_id=current_user.id,
+                start_date=start_date,
+                end_date=end_date,
+                type=type,
+                category_id=category_id,
+            ):
+                yield rows
+
+    if format == "ndjson":
+        body, media_type = write_ndjson(batches()), "application/x-ndjson"
+    else:
+        body, media_type = write_csv(batches()), "text/csv; charset=utf-8"
+
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="transacoes.{format}"'},
+    )
+
+
 @router.get("/", response_model=list[TransactionResponseDTO])
 async def list_transactions(
+    response: Response,
     current_user: CurrentUser,
-    transaction_repository: Annotated[TransactionRepositoryImpl, Depends(get_transaction_repository)],
+    transaction_repository: Annotated[
+        TransactionRepositoryImpl, Depends(get_read_transaction_repository)
+    ],
     start_date: Optional[datetime] = Query(None),
     end_date: Optional[datetime] = Query(None),
     type: Optional[TransactionType] = Query(None),
     category_id: Optional[UUID] = Query(None),
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None),
 ) -> list[TransactionResponseDTO]:
-    """Lista as transações do usuário com filtros opcionais."""
-    use_case = GetTransactionsUseCase(transaction_repository)
-    return await use_case.execute(
-        user_id=current_user.id,
-        start_date=start_date,
-        end_date=end_date,
-        type=type,
-        category_id=category_id,
-        limit=limit,
-        offset=offset,
-    )
+    """Lista as transações do usuário com filtros opcionais.
+
+    Quando existem mais resultados, o cabeçalho X-Next-Cursor traz o cursor da
+    próxima página, que pode ser enviado em ``cursor`` no lugar de ``offset``.
+    """
+    if cursor and offset:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Use cursor ou offset, não ambos",
+        )
+
+    use_case = GetTransactionsPageUseCase(transaction_repository)
+
+    try:
+        page = await use_case.execute(
+            user_id=current_user.id,
+            start_date=start_date,
+            end_date=end_date,
+            type=type,
+            category_id=category_id,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+    if page.next_cursor:
+        response.headers["X-Next-Cursor"] = page.next_cursor
+
+    return page.items
+
+
+@router.get("/search", response_model=list[TransactionResponseDTO])
+async def search_transactions(
+    current_user: CurrentUser,
+    transaction_repository: Annotated[
+        TransactionRepositoryImpl, Depends(get_read_transaction_repository)
+    ],
+    conditional: Conditional,
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+) -> Response:
+    """Busca transações por descrição e observações, ordenadas por relevância.
+
+    Cada palavra também casa como prefixo ("super" encontra "Supermercado").
+    """
+    use_case = SearchTransactionsUseCase(transaction_repository)
+
+    async def build() -> list[TransactionResponseDTO]:
+        try:
+            return await use_case.execute(
+                user_id=current_user.id, query=q, limit=limit, offset=offset
+            )
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e),
+            )
+
+    return await conditional.respond(build, q=q, limit=limit, offset=offset)
 
 
 @router.get("/summary", response_model=TransactionSummaryDTO)
 async def get_summary(
     current_user: CurrentUser,
-    transaction_repository: Annotated[TransactionRepositoryImpl, Depends(get_transaction_repository)],
+    transaction_repository: Annotated[
+        TransactionRepositoryImpl, Depends(get_read_transaction_repository)
+    ],
+    conditional: Conditional,
     start_date: Optional[datetime] = Query(None),
     end_date: Optional[datetime] = Query(None),
-) -> TransactionSummaryDTO:
+) -> Response:
     """Retorna o resumo das transações do usuário."""
     use_case = GetTransactionSummaryUseCase(transaction_repository)
-    return await use_case.execute(
-        user_id=current_user.id,
+    return await conditional.respond(
+        lambda: use_case.execute(
+            user_id=current_user.id,
+            start_date=start_date,
+            end_date=end_date,
+        ),
         start_date=start_date,
         end_date=end_date,
     )
 
 
-@router.get("/monthly")
+@router.get("/monthly", response_model=list[MonthlySummaryDTO])
 async def get_monthly_summary(
     current_user: CurrentUser,
-    transaction_repository: Annotated[TransactionRepositoryImpl, Depends(get_transaction_repository)],
+    transaction_repository: Annotated[
+        TransactionRepositoryImpl, Depends(get_read_transaction_repository)
+    ],
+    conditional: Conditional,
     year: int = Query(default_factory=lambda: datetime.now().year),
-) -> list[dict]:
+) -> Response:
     """Retorna o resumo mensal das transações do usuário."""
-    from calendar import monthrange
+    return await conditional.respond(
+        lambda: _monthly_summary(transaction_repository, current_user.id, year),
+        year=year,
+    )
 
-    monthly_data = []
+
+async def _monthly_summary(
+    transaction_repository: TransactionRepositoryImpl, user_id: UUID, year: int
+) -> list[MonthlySummaryDTO]:
     month_names = ["Jan", "Fev", "Mar", "Abr", "Mai", "Jun", "Jul", "Ago", "Set", "Out", "Nov", "Dez"]
 
+    totals = await transaction_repository.get_totals_by_period(
+        user_id=user_id,
+        period=AggregationPeriod.MONTH,
+        start_date=datetime(year, 1, 1),
+        end_date=datetime(year + 1, 1, 1),
+    )
+    totals_by_month = {t.period_start.month: t for t in totals}
+
+    cents = Decimal("0.01")
+    monthly_data = []
     for month in range(1, 13):
-        start_date = datetime(year, month, 1)
-        _, last_day = monthrange(year, month)
-        end_date = datetime(year, month, last_day, 23, 59, 59)
+        month_totals = totals_by_month.get(month)
+        income = month_totals.total_income if month_totals else Decimal("0")
+        expense = month_totals.total_expense if month_totals else Decimal("0")
+        monthly_data.append(MonthlySummaryDTO(
+            name=month_names[month - 1],
+            receitas=income.quantize(cents),
+            despesas=expense.quantize(cents),
+        ))
 
-        income = await transaction_repository.get_total_by_type(
-            user_id=current_user.id,
-            type=TransactionType.INCOME,
-            start_date=start_date,
-            end_date=end_date,
-        )
+    return monthly_data
 
-        expense = await transaction_repository.get_total_by_type(
-            user_id=current_user.id,
-            type=TransactionType.EXPENSE,
-            start_date=start_date,
-            end_date=end_date,
-        )
 
-        monthly_data.append({
-            "name": month_names[month - 1],
-            "receitas": float(income),
-            "despesas": float(expense),
-        })
+@router.patch("/bulk", response_model=TransactionBulkResultDTO)
+async def bulk_update_transactions(
+    dto: TransactionBulkUpdateDTO,
+    current_user: CurrentUser,
+    transaction_repository: Annotated[
+        TransactionRepositoryImpl, Depends(get_transaction_repository)
+    ],
+) -> TransactionBulkResultDTO:
+    """Atualiza em lote as transações selecionadas por ids ou por filtro."""
+    use_case = BulkUpdateTransactionsUseCase(transaction_repository)
+    return await use_case.execute(current_user.id, dto)
 
-    return monthly_data
+
+@router.delete("/bulk", response_model=TransactionBulkResultDTO)
+async def bulk_delete_transactions(
+    dto: TransactionBulkDeleteDTO,
+    current_user: CurrentUser,
+    transaction_repository: Annotated[
+        TransactionRepositoryImpl, Depends(get_transaction_repository)
+    ],
+) -> TransactionBulkResultDTO:
+    """Remove em lote as transações selecionadas por ids ou por filtro."""
+    use_case = BulkDeleteTransactionsUseCase(transaction_repository)
+    return await use_case.execute(current_user.id, dto)
 
 
 @router.patch("/{transaction_id}", response_model=TransactionResponseDTO)
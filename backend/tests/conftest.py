@@ -0,0 +1,159 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import AsyncIterator
+from uuid import UUID, uuid4
+
+import httpx
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities import Transaction, TransactionType
+from src.infrastructure.cache import response_cache, user_cache
+from src.infrastructure.config import Settings, get_settings
+from src.infrastructure.database import CategoryModel, Database, UserModel
+from src.infrastructure.database import database as database_module
+from src.infrastructure.database.repositories import TransactionRepositoryImpl
+from src.infrastructure.database.schema import upgrade_schema
+from src.infrastructure.ratelimit import admission, token_bucket
+from src.main import create_app, lifespan
+from src.presentation.api.dependencies import get_jwt_service, get_password_service
+
+
+@pytest.fixture
+def database_url(tmp_path) -> str:
+    """Banco SQLite em arquivo, migrado até a última revisão."""
+    url = f"sqlite+aiosqlite:///{tmp_path / 'test.db'}"
+    upgrade_schema(url)
+    return url
+
+
+@pytest.fixture
+async def database(database_url: str) -> AsyncIterator[Database]:
+    database = Database(database_url, Settings(database_url=database_url))
+    yield database
+    await database.dispose()
+
+
+@pytest.fixture
+async def session(database: Database) -> AsyncIterator[AsyncSession]:
+    async for session in database.get_session():
+        yield session
+
+
+@pytest.fixture
+async def user_id(session: AsyncSession) -> UUID:
+    user_id = uuid4()
+    session.add(
+        UserModel(
+            id=user_id,
+            email=f"{user_id.hex}@example.com",
+            name="Ana",
+            hashed_password="x",
+        )
+    )
+    await session.flush()
+    return user_id
+
+
+@pytest.fixture
+async def category_id(session: AsyncSession, user_id: UUID) -> UUID:
+    category_id = uuid4()
+    session.add(CategoryModel(id=category_id, name="Mercado", user_id=user_id))
+    await session.flush()
+    return category_id
+
+
+@pytest.fixture
+async def transactions(
+    session: AsyncSession, user_id: UUID, category_id: UUID
+) -> list[Transaction]:
+    """Doze transações, uma por mês de 2025, alternando receita e despesa."""
+    repository = TransactionRepositoryImpl(session)
+    created = []
+    for month in range(1, 13):
+        created.append(
+            await repository.create(
+                Transaction(
+                    id=uuid4(),
+                    description=f"Compra {month}",
+                    amount=Decimal("10.00") * month,
+                    type=(
+                        TransactionType.INCOME if month % 2 else TransactionType.EXPENSE
+                    ),
+                    date=datetime(2025, month, 10) + timedelta(hours=month),
+                    user_id=user_id,
+                    category_id=category_id,
+                    notes="feira do mês" if month == 3 else None,
+                )
+            )
+        )
+    return created
+
+
+@pytest.fixture
+def app_env() -> dict[str, str]:
+    """Variáveis de ambiente da aplicação; módulos de teste podem sobrescrever."""
+    return {}
+
+
+@pytest.fixture
+async def client(
+    monkeypatch: pytest.MonkeyPatch, database_url: str, app_env: dict[str, str]
+) -> AsyncIterator[httpx.AsyncClient]:
+    """Cliente HTTP em processo para uma aplicação nova sobre o banco migrado."""
+    env = {
+        "DATABASE_URL": database_url,
+        "BCRYPT_ROUNDS": "4",
+        "RECURRING_SCHEDULER_ENABLED": "false",
+        "RATE_LIMIT_ENABLED": "false",
+        **app_env,
+    }
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+
+    # Singletons do processo são recriados com a configuração do teste
+    get_settings.cache_clear()
+    get_jwt_service.cache_clear()
+    get_password_service.cache_clear()
+    monkeypatch.setattr(database_module, "_database", None)
+    monkeypatch.setattr(user_cache, "_user_cache", None)
+    monkeypatch.setattr(response_cache, "_response_cache", None)
+    monkeypatch.setattr(token_bucket, "_rate_limit_backend", None)
+    monkeypatch.setattr(admission, "_admission_controller", None)
+
+    app = create_app()
+    async with lifespan(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            yield client
+
+    get_settings.cache_clear()
+    get_jwt_service.cache_clear()
+    get_password_service.cache_clear()
+
+
+@pytest.fixture
+async def auth_headers(client: httpx.AsyncClient) -> dict[str, str]:
+    credentials = {"email": "ana@example.com", "name": "Ana", "password": "12345678"}
+    response = await client.post("/api/v1/auth/register", json=credentials)
+    assert response.status_code == 201, response.text
+    response = await client.post(
+        "/api/v1/auth/login",
+        data={"username": credentials["email"], "password": credentials["password"]},
+    )
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+@pytest.fixture
+async def other_auth_headers(client: httpx.AsyncClient) -> dict[str, str]:
+    """Cabeçalhos de um segundo usuário, dono de nenhum dado de Ana."""
+    credentials = {"email": "bia@example.com", "name": "Bia", "password": "secret123"}
+    response = await client.post("/api/v1/auth/register", json=credentials)
+    assert response.status_code == 201, response.text
+    response = await client.post(
+        "/api/v1/auth/login",
+        data={"username": credentials["email"], "password": credentials["password"]},
+    )
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
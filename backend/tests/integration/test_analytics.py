@@ -0,0 +1,44 @@
+"""Rotas de análise: distribuição por categoria."""
+
+import httpx
+
+
+async def test_breakdown_names_categories_and_uncategorized(
+    client: httpx.AsyncClient, auth_headers: dict[str, str]
+) -> None:
+    category = await client.post(
+        "/api/v1/categories/",
+        json={"name": "Mercado", "color": "#00ff00", "icon": "cart"},
+        headers=auth_headers,
+    )
+    category_id = category.json()["id"]
+    for amount, category_ref in (("30.00", category_id), ("10.00", None)):
+        response = await client.post(
+            "/api/v1/transactions/",
+            json={
+                "description": "Compra",
+                "amount": amount,
+                "type": "expense",
+                "date": "2025-02-10T12:00:00",
+                "category_id": category_ref,
+            },
+            headers=auth_headers,
+        )
+        assert response.status_code == 201, response.text
+
+    response = await client.get(
+        "/api/v1/analytics/breakdown",
+        params={
+            "start_date": "2025-01-01T00:00:00Z",
+            "end_date": "2025-02-28T21:00:00-03:00",
+        },
+        headers=auth_headers,
+    )
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["periods"] == ["2025-01-01", "2025-02-01"]
+    assert [(item["name"], item["total"]) for item in body["categories"]] == [
+        ("Mercado", "30.00"),
+        ("Sem categoria", "10.00"),
+    ]
+    assert body["categories"][0]["share"] == 0.75
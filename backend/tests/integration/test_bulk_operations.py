@@ -0,0 +1,80 @@
+"""Atualização e remoção de transações em lote."""
+
+import httpx
+
+URL = "/api/v1/transactions/bulk"
+
+
+async def _create(
+    client: httpx.AsyncClient, headers: dict[str, str], count: int
+) -> list[str]:
+    ids = []
+    for index in range(count):
+        response = await client.post(
+            "/api/v1/transactions/",
+            json={
+                "description": f"Compra {index}",
+                "amount": "10.00",
+                "type": "expense",
+                "date": f"2025-0{index + 1}-10T12:00:00",
+            },
+            headers=headers,
+        )
+        assert response.status_code == 201, response.text
+        ids.append(response.json()["id"])
+    return ids
+
+
+async def test_bulk_update_reports_affected_rows(
+    client: httpx.AsyncClient, auth_headers: dict[str, str]
+) -> None:
+    ids = await _create(client, auth_headers, 3)
+
+    response = await client.patch(
+        URL,
+        json={"ids": ids[:2], "changes": {"type": "income"}},
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+    assert response.json() == {"affected": 2}
+
+    response = await client.patch(
+        URL,
+        json={"filter": {"type": "expense"}, "changes": {"notes": "revisar"}},
+        headers=auth_headers,
+    )
+    assert response.json() == {"affected": 1}
+
+    summary = await client.get("/api/v1/transactions/summary", headers=auth_headers)
+    assert summary.json()["total_income"] == "20.00"
+
+
+async def test_bulk_delete_reports_affected_rows(
+    client: httpx.AsyncClient, auth_headers: dict[str, str]
+) -> None:
+    ids = await _create(client, auth_headers, 3)
+
+    response = await client.request(
+        "DELETE", URL, json={"ids": ids[:2]}, headers=auth_headers
+    )
+    assert response.json() == {"affected": 2}
+
+    response = await client.request(
+        "DELETE", URL, json={"ids": ids[:2]}, headers=auth_headers
+    )
+    assert response.json() == {"affected": 0}
+
+
+async def test_bulk_requests_are_validated(
+    client: httpx.AsyncClient, auth_headers: dict[str, str]
+) -> None:
+    ids = await _create(client, auth_headers, 1)
+
+    for body in (
+        {"ids": ids, "filter": {}, "changes": {"notes": "x"}},
+        {"changes": {"notes": "x"}},
+        {"ids": ids, "changes": {}},
+        {"ids": ids, "changes": {"type": None}},
+    ):
+        response = await client.patch(URL, json=body, headers=auth_headers)
+        assert response.status_code == 422, body
@@ -0,0 +1,93 @@
+"""ETag / If-None-Match nas rotas de leitura."""
+
+import httpx
+import pytest
+
+SUMMARY = "/api/v1/transactions/summary"
+
+
+async def _create_transaction(
+    client: httpx.AsyncClient, headers: dict[str, str], amount: str = "10.00"
+) -> None:
+    response = await client.post(
+        "/api/v1/transactions/",
+        json={
+            "description": "Mercado",
+            "amount": amount,
+            "type": "expense",
+            "date": "2025-05-10T10:00:00",
+        },
+        headers=headers,
+    )
+    assert response.status_code == 201
+
+
+@pytest.mark.parametrize(
+    "path",
+    [SUMMARY, "/api/v1/transactions/monthly?year=2025", "/api/v1/categories/"],
+)
+async def test_unchanged_data_answers_304(
+    client: httpx.AsyncClient, auth_headers: dict[str, str], path: str
+) -> None:
+    first = await client.get(path, headers=auth_headers)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+
+    second = await client.get(path, headers={**auth_headers, "If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["ETag"] == etag
+
+    weak = await client.get(
+        path, headers={**auth_headers, "If-None-Match": f'"outro", W/{etag}'}
+    )
+    assert weak.status_code == 304
+
+
+async def test_write_changes_etag(
+    client: httpx.AsyncClient, auth_headers: dict[str, str]
+) -> None:
+    await _create_transaction(client, auth_headers)
+    first = await client.get(SUMMARY, headers=auth_headers)
+
+    await _create_transaction(client, auth_headers, "5.00")
+    second = await client.get(
+        SUMMARY, headers={**auth_headers, "If-None-Match": first.headers["ETag"]}
+    )
+    assert second.status_code == 200
+    assert second.headers["ETag"] != first.headers["ETag"]
+    assert second.json()["total_expense"] == "15.00"
+
+
+async def test_etag_depends_on_query_params(
+    client: httpx.AsyncClient, auth_headers: dict[str, str]
+) -> None:
+    first = await client.get(
+        "/api/v1/transactions/monthly", params={"year": 2025}, headers=auth_headers
+    )
+    other = await client.get(
+        "/api/v1/transactions/monthly",
+        params={"year": 2024},
+        headers={**auth_headers, "If-None-Match": first.headers["ETag"]},
+    )
+    assert other.status_code == 200
+    assert other.headers["ETag"] != first.headers["ETag"]
+
+
+class TestWithResponseCache:
+    @pytest.fixture
+    def app_env(self) -> dict[str, str]:
+        return {"RESPONSE_CACHE_ENABLED": "true"}
+
+    async def test_cached_body_matches_fresh_body(
+        self, client: httpx.AsyncClient, auth_headers: dict[str, str]
+    ) -> None:
+        await _create_transaction(client, auth_headers)
+        fresh = await client.get(SUMMARY, headers=auth_headers)
+        cached = await client.get(SUMMARY, headers=auth_headers)
+        assert cached.content == fresh.content
+        assert cached.headers["ETag"] == fresh.headers["ETag"]
+
+        await _create_transaction(client, auth_headers)
+        updated = await client.get(SUMMARY, headers=auth_headers)
+        assert updated.json()["transaction_count"] == 2
@@ -0,0 +1,80 @@
+"""Paginação por cursor da listagem de transações (X-Next-Cursor)."""
+
+import httpx
+
+URL = "/api/v1/transactions/"
+
+
+async def _create(
+    client: httpx.AsyncClient, headers: dict[str, str], dates: list[str]
+) -> None:
+    for index, date in enumerate(dates):
+        response = await client.post(
+            URL,
+            json={
+                "description": f"Compra {index}",
+                "amount": "10.00",
+                "type": "expense",
+                "date": date,
+            },
+            headers=headers,
+        )
+        assert response.status_code == 201, response.text
+
+
+async def test_cursor_walks_every_transaction_once_in_order(
+    client: httpx.AsyncClient, auth_headers: dict[str, str]
+) -> None:
+    # Datas repetidas: o id desempata a ordem entre páginas
+    dates = [f"2025-0{month}-10T12:00:00" for month in (1, 2, 2, 2, 3, 4, 4)]
+    await _create(client, auth_headers, dates)
+
+    full = await client.get(URL, params={"limit": 100}, headers=auth_headers)
+    expected = [item["id"] for item in full.json()]
+    assert "X-Next-Cursor" not in full.headers
+
+    seen: list[str] = []
+    params: dict[str, str | int] = {"limit": 2}
+    while True:
+        page = await client.get(URL, params=params, headers=auth_headers)
+        assert page.status_code == 200
+        seen += [item["id"] for item in page.json()]
+        cursor = page.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+        params = {"limit": 2, "cursor": cursor}
+
+    assert seen == expected
+    assert len(seen) == len(dates)
+
+
+async def test_cursor_survives_inserts_ahead_of_it(
+    client: httpx.AsyncClient, auth_headers: dict[str, str]
+) -> None:
+    await _create(client, auth_headers, [f"2025-0{m}-10T12:00:00" for m in range(1, 6)])
+
+    first = await client.get(URL, params={"limit": 2}, headers=auth_headers)
+    # Transação mais recente que todas: com offset deslocaria a próxima página
+    await _create(client, auth_headers, ["2025-09-01T12:00:00"])
+    second = await client.get(
+        URL,
+        params={"limit": 2, "cursor": first.headers["X-Next-Cursor"]},
+        headers=auth_headers,
+    )
+
+    descriptions = [item["description"] for item in first.json() + second.json()]
+    assert descriptions == ["Compra 4", "Compra 3", "Compra 2", "Compra 1"]
+
+
+async def test_cursor_rejects_offset_and_garbage(
+    client: httpx.AsyncClient, auth_headers: dict[str, str]
+) -> None:
+    response = await client.get(
+        URL, params={"cursor": "abc", "offset": 5}, headers=auth_headers
+    )
+    assert response.status_code == 400
+
+    response = await client.get(
+        URL, params={"cursor": "não-é-cursor"}, headers=auth_headers
+    )
+    assert response.status_code == 400
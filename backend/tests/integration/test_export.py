@@ -0,0 +1,139 @@
+"""Exportação de transações em CSV e NDJSON."""
+
+import csv
+import io
+import json
+
+import httpx
+import pytest
+
+EXPORT = "/api/v1/transactions/export"
+
+
+@pytest.fixture
+async def exported(
+    client: httpx.AsyncClient,
+    auth_headers: dict[str, str],
+    other_auth_headers: dict[str, str],
+) -> list[dict]:
+    """Três transações de Ana, em meses diferentes, e uma de Bia."""
+    created = []
+    for month, description, notes in (
+        (1, "Salário", None),
+        (3, "Feira", 'tomate, "orgânico"'),
+        (5, "Aluguel", "maio"),
+    ):
+        response = await client.post(
+            "/api/v1/transactions/",
+            json={
+                "description": description,
+                "amount": f"{month * 100}.50",
+                "type": "income" if month == 1 else "expense",
+                "date": f"2025-{month:02d}-10T12:00:00",
+                "notes": notes,
+            },
+            headers=auth_headers,
+        )
+        assert response.status_code == 201, response.text
+        created.append(response.json())
+
+    response = await client.post(
+        "/api/v1/transactions/",
+        json={
+            "description": "De Bia",
+            "amount": "9.99",
+            "type": "expense",
+            "date": "2025-03-15T12:00:00",
+        },
+        headers=other_auth_headers,
+    )
+    assert response.status_code == 201
+    return created
+
+
+async def _export(
+    client: httpx.AsyncClient, headers: dict[str, str], **params: str
+) -> httpx.Response:
+    response = await client.get(EXPORT, params=params, headers=headers)
+    assert response.status_code == 200, response.text
+    return response
+
+
+async def test_csv_has_header_and_one_line_per_transaction(
+    client: httpx.AsyncClient, auth_headers: dict[str, str], exported: list[dict]
+) -> None:
+    response = await _export(client, auth_headers)
+    assert response.headers["content-type"].startswith("text/csv")
+    assert "transacoes.csv" in response.headers["content-disposition"]
+
+    rows = list(csv.reader(io.StringIO(response.text)))
+    assert rows[0] == [
+        "id",
+        "date",
+        "description",
+        "amount",
+        "type",
+        "category_id",
+        "notes",
+    ]
+    records = {row[0]: row for row in rows[1:]}
+    assert set(records) == {transaction["id"] for transaction in exported}
+
+    feira = records[exported[1]["id"]]
+    assert feira[2:] == ["Feira", "300.50", "expense", "", 'tomate, "orgânico"']
+    assert feira[1].startswith("2025-03-10T12:00:00")
+
+
+async def test_ndjson_has_one_object_per_line(
+    client: httpx.AsyncClient, auth_headers: dict[str, str], exported: list[dict]
+) -> None:
+    response = await _export(client, auth_headers, format="ndjson")
+    assert response.headers["content-type"] == "application/x-ndjson"
+
+    lines = response.text.splitlines()
+    assert len(lines) == len(exported)
+    records = {record["id"]: record for record in map(json.loads, lines)}
+    assert set(records) == {transaction["id"] for transaction in exported}
+
+    salary = records[exported[0]["id"]]
+    assert salary["amount"] == "100.50"
+    assert salary["type"] == "income"
+    assert salary["category_id"] is None
+    assert salary["notes"] is None
+
+
+@pytest.mark.parametrize("format", ["csv", "ndjson"])
+async def test_date_range_filters_rows(
+    client: httpx.AsyncClient,
+    auth_headers: dict[str, str],
+    exported: list[dict],
+    format: str,
+) -> None:
+    response = await _export(
+        client,
+        auth_headers,
+        format=format,
+        start_date="2025-02-01T00:00:00",
+        end_date="2025-04-30T23:59:59",
+    )
+
+    if format == "csv":
+        ids = [row[0] for row in csv.reader(io.StringIO(response.text))][1:]
+    else:
+        ids = [json.loads(line)["id"] for line in response.text.splitlines()]
+    assert ids == [exported[1]["id"]]
+
+
+@pytest.mark.parametrize("format", ["csv", "ndjson"])
+async def test_other_users_rows_are_excluded(
+    client: httpx.AsyncClient,
+    other_auth_headers: dict[str, str],
+    exported: list[dict],
+    format: str,
+) -> None:
+    response = await _export(client, other_auth_headers, format=format)
+
+    assert "De Bia" in response.text
+    for transaction in exported:
+        assert transaction["id"] not in response.text
+        assert transaction["description"] not in response.text
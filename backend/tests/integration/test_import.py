@@ -0,0 +1,166 @@
+"""Importação de transações por CSV e OFX."""
+
+import httpx
+import pytest
+
+URL = "/api/v1/transactions/import"
+
+OFX = b"""OFXHEADER:100
+DATA:OFXSGML
+
+<OFX>
+<BANKMSGSRSV1><STMTTRNRS><STMTRS><BANKTRANLIST>
+<STMTTRN>
+<TRNTYPE>DEBIT
+<DTPOSTED>20250305120000[-3:BRT]
+<TRNAMT>-42,50
+<NAME>PADARIA CENTRAL
+<MEMO>Cafe da manha
+</STMTTRN>
+<STMTTRN>
+<TRNTYPE>CREDIT
+<DTPOSTED>20250310
+<TRNAMT>1500.00
+<MEMO>Salario
+</STMTTRN>
+</BANKTRANLIST></STMTRS></STMTTRNRS></BANKMSGSRSV1>
+</OFX>
+"""
+
+
+async def _import(
+    client: httpx.AsyncClient,
+    headers: dict[str, str],
+    content: bytes,
+    filename: str = "extrato.csv",
+) -> httpx.Response:
+    return await client.post(URL, files={"file": (filename, content)}, headers=headers)
+
+
+async def _descriptions(
+    client: httpx.AsyncClient, headers: dict[str, str]
+) -> list[str]:
+    response = await client.get("/api/v1/transactions/", headers=headers)
+    return sorted(item["description"] for item in response.json())
+
+
+async def test_csv_rows_are_imported(
+    client: httpx.AsyncClient, auth_headers: dict[str, str]
+) -> None:
+    content = (
+        "Description,Amount,Type,Date,Notes\n"
+        "Mercado,120.50,expense,2025-03-01T10:00:00,\n"
+        "Salário,5000,income,2025-03-05,março\n"
+    ).encode()
+    response = await _import(client, auth_headers, content)
+
+    assert response.status_code == 200
+    assert response.json() == {"imported": 2, "failed": 0, "errors": []}
+    assert await _descriptions(client, auth_headers) == ["Mercado", "Salário"]
+
+
+async def test_bad_rows_are_reported_by_line_number(
+    client: httpx.AsyncClient, auth_headers: dict[str, str]
+) -> None:
+    content = (
+        "description,amount,type,date\n"
+        "Mercado,10,expense,2025-03-01\n"
+        "Negativo,-5,expense,2025-03-01\n"
+        "Sem valor,,expense,2025-03-01\n"
+        "Padaria,7,expense,2025-03-02\n"
+    ).encode()
+    response = await _import(client, auth_headers, content)
+
+    body = response.json()
+    assert (body["imported"], body["failed"]) == (2, 2)
+    assert [error["row"] for error in body["errors"]] == [3, 4]
+    assert body["errors"][1]["message"].startswith("amount:")
+
+
+async def test_unknown_or_foreign_categories_are_rejected(
+    client: httpx.AsyncClient, auth_headers: dict[str, str]
+) -> None:
+    own = await client.post(
+        "/api/v1/categories/",
+        json={"name": "Mercado", "color": "#00ff00", "icon": "cart"},
+        headers=auth_headers,
+    )
+    await client.post(
+        "/api/v1/auth/register",
+        json={"email": "bia@example.com", "name": "Bia", "password": "secret123"},
+    )
+    login = await client.post(
+        "/api/v1/auth/login",
+        data={"username": "bia@example.com", "password": "secret123"},
+    )
+    other_headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+    foreign = await client.post(
+        "/api/v1/categories/",
+        json={"name": "Dela", "color": "#ff0000", "icon": "tag"},
+        headers=other_headers,
+    )
+
+    content = (
+        "description,amount,type,date,category_id\n"
+        f"Própria,10,expense,2025-03-01,{own.json()['id']}\n"
+        f"Alheia,10,expense,2025-03-01,{foreign.json()['id']}\n"
+        "Inexistente,10,expense,2025-03-01,00000000-0000-0000-0000-00000000abcd\n"
+    ).encode()
+    response = await _import(client, auth_headers, content)
+
+    body = response.json()
+    assert (body["imported"], body["failed"]) == (1, 2)
+    assert body["errors"] == [
+        {"row": 3, "message": "category_id: Categoria não encontrada"},
+        {"row": 4, "message": "category_id: Categoria não encontrada"},
+    ]
+    assert await _descriptions(client, auth_headers) == ["Própria"]
+
+
+async def test_undecodable_file_is_rejected_without_importing(
+    client: httpx.AsyncClient, auth_headers: dict[str, str]
+) -> None:
+    content = (
+        "description,amount,type,date\n"
+        "Mercado,10,expense,2025-03-01\n"
+        "Açougue,10,expense,2025-03-01\n"
+    ).encode("latin-1")
+    response = await _import(client, auth_headers, content)
+
+    assert response.status_code == 400
+    assert await _descriptions(client, auth_headers) == []
+
+
+async def test_ofx_statement_is_imported(
+    client: httpx.AsyncClient, auth_headers: dict[str, str]
+) -> None:
+    response = await _import(client, auth_headers, OFX, filename="extrato.ofx")
+    assert response.json() == {"imported": 2, "failed": 0, "errors": []}
+
+    listed = await client.get("/api/v1/transactions/", headers=auth_headers)
+    by_description = {item["description"]: item for item in listed.json()}
+    padaria = by_description["PADARIA CENTRAL"]
+    assert (padaria["type"], padaria["amount"]) == ("expense", "42.50")
+    assert padaria["notes"] == "Cafe da manha"
+    assert padaria["date"] == "2025-03-05T12:00:00"
+    assert by_description["Salario"]["type"] == "income"
+
+
+class TestSmallBatches:
+    @pytest.fixture
+    def app_env(self) -> dict[str, str]:
+        return {"IMPORT_BATCH_SIZE": "1"}
+
+    async def test_failed_file_rolls_back_earlier_batches(
+        self, client: httpx.AsyncClient, auth_headers: dict[str, str]
+    ) -> None:
+        content = (
+            "description,amount,type,date\n"
+            "Mercado,10,expense,2025-03-01\n"
+            "Padaria,10,expense,2025-03-01\n"
+            "Açougue,10,expense,2025-03-01\n"
+        ).encode("latin-1")
+        response = await _import(client, auth_headers, content)
+
+        assert response.status_code == 400
+        assert await _descriptions(client, auth_headers) == []
@@ -0,0 +1,88 @@
+"""Um usuário não altera nem remove dados de outro usuário."""
+
+import httpx
+import pytest
+
+API = "/api/v1"
+
+
+@pytest.fixture
+async def owned(
+    client: httpx.AsyncClient, auth_headers: dict[str, str]
+) -> dict[str, dict]:
+    """Uma categoria, um orçamento e uma transação de Ana."""
+    category = await client.post(
+        f"{API}/categories/",
+        json={"name": "Mercado", "color": "#00ff00", "icon": "cart"},
+        headers=auth_headers,
+    )
+    budget = await client.post(
+        f"{API}/budgets/",
+        json={
+            "category_id": category.json()["id"],
+            "amount": "500.00",
+            "month": 3,
+            "year": 2025,
+        },
+        headers=auth_headers,
+    )
+    transaction = await client.post(
+        f"{API}/transactions/",
+        json={
+            "description": "Feira",
+            "amount": "42.50",
+            "type": "expense",
+            "category_id": category.json()["id"],
+            "date": "2025-03-10T12:00:00",
+        },
+        headers=auth_headers,
+    )
+    for response in (category, budget, transaction):
+        assert response.status_code == 201, response.text
+    return {
+        "categories": category.json(),
+        "budgets": budget.json(),
+        "transactions": transaction.json(),
+    }
+
+
+async def _listed(
+    client: httpx.AsyncClient, headers: dict[str, str], resource: str
+) -> list[dict]:
+    params = {"month": 3, "year": 2025} if resource == "budgets" else {}
+    response = await client.get(f"{API}/{resource}/", params=params, headers=headers)
+    assert response.status_code == 200
+    return response.json()
+
+
+UPDATES = {
+    "categories": {"name": "Invadida"},
+    "budgets": {"amount": "1.00"},
+    "transactions": {"description": "Invadida", "amount": "1.00"},
+}
+
+
+@pytest.mark.parametrize("resource", ["categories", "budgets", "transactions"])
+async def test_other_user_gets_404_and_row_is_unchanged(
+    client: httpx.AsyncClient,
+    auth_headers: dict[str, str],
+    other_auth_headers: dict[str, str],
+    owned: dict[str, dict],
+    resource: str,
+) -> None:
+    row = owned[resource]
+    url = f"{API}/{resource}/{row['id']}"
+
+    response = await client.patch(
+        url, json=UPDATES[resource], headers=other_auth_headers
+    )
+    assert response.status_code == 404
+    response = await client.delete(url, headers=other_auth_headers)
+    assert response.status_code == 404
+
+    (listed,) = await _listed(client, auth_headers, resource)
+    assert listed["id"] == row["id"]
+    assert listed["updated_at"] is None
+    for field in UPDATES[resource]:
+        assert listed[field] == row[field]
+    assert await _listed(client, other_auth_headers, resource) == []
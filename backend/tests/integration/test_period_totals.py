@@ -0,0 +1,150 @@
+"""Totais por período calculados direto das transações (dia, semana, ano)."""
+
+from contextlib import contextmanager
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Iterator
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities import (
+    AggregationPeriod,
+    PeriodTotals,
+    Transaction,
+    TransactionType,
+)
+from src.infrastructure.database import Database
+from src.infrastructure.database.repositories import TransactionRepositoryImpl
+
+
+@contextmanager
+def statements(database: Database) -> Iterator[list[str]]:
+    """Registra o SQL executado no engine."""
+    engine = database.engine.sync_engine
+    executed: list[str] = []
+
+    def capture(*args: Any) -> None:
+        executed.append(args[2])
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        yield executed
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+
+@pytest.fixture
+async def repository(
+    session: AsyncSession, user_id: UUID, category_id: UUID
+) -> TransactionRepositoryImpl:
+    """Transações em torno da virada de 2024 para 2025."""
+    repository = TransactionRepositoryImpl(session)
+    for when, amount, type in (
+        (datetime(2024, 6, 10, 9), "500.00", TransactionType.INCOME),
+        (datetime(2024, 12, 29, 23, 59), "7.00", TransactionType.EXPENSE),
+        (datetime(2024, 12, 30, 8), "10.00", TransactionType.EXPENSE),
+        (datetime(2024, 12, 31, 20), "20.00", TransactionType.EXPENSE),
+        (datetime(2025, 1, 2, 12), "100.00", TransactionType.INCOME),
+        (datetime(2025, 1, 2, 18), "5.00", TransactionType.EXPENSE),
+        (datetime(2025, 1, 6, 0), "40.00", TransactionType.EXPENSE),
+    ):
+        await repository.create(
+            Transaction(
+                id=uuid4(),
+                description="Compra",
+                amount=Decimal(amount),
+                type=type,
+                date=when,
+                user_id=user_id,
+                category_id=category_id,
+            )
+        )
+    return repository
+
+
+def _totals(rows: list[PeriodTotals]) -> list[tuple[str, str, str]]:
+    return [
+        (
+            row.period_start.date().isoformat(),
+            str(row.total_income),
+            str(row.total_expense),
+        )
+        for row in rows
+    ]
+
+
+async def test_day_buckets(
+    database: Database, repository: TransactionRepositoryImpl, user_id: UUID
+) -> None:
+    with statements(database) as executed:
+        rows = await repository.get_totals_by_period(
+            user_id,
+            AggregationPeriod.DAY,
+            datetime(2024, 12, 30),
+            datetime(2025, 1, 3),
+        )
+
+    assert _totals(rows) == [
+        ("2024-12-30", "0", "10.00"),
+        ("2024-12-31", "0", "20.00"),
+        ("2025-01-02", "100.00", "5.00"),
+    ]
+    assert not any("monthly_rollups" in sql for sql in executed)
+
+
+async def test_week_crossing_year_boundary_starts_on_monday(
+    database: Database, repository: TransactionRepositoryImpl, user_id: UUID
+) -> None:
+    with statements(database) as executed:
+        rows = await repository.get_totals_by_period(
+            user_id,
+            AggregationPeriod.WEEK,
+            datetime(2024, 12, 20),
+            datetime(2025, 1, 10),
+        )
+
+    # 2024-12-29 é domingo (semana de 23/12); de 30/12 a 05/01 é uma só semana
+    assert _totals(rows) == [
+        ("2024-12-23", "0", "7.00"),
+        ("2024-12-30", "100.00", "35.00"),
+        ("2025-01-06", "0", "40.00"),
+    ]
+    assert not any("monthly_rollups" in sql for sql in executed)
+
+
+async def test_year_buckets_with_range_not_aligned_to_months(
+    database: Database, repository: TransactionRepositoryImpl, user_id: UUID
+) -> None:
+    with statements(database) as executed:
+        rows = await repository.get_totals_by_period(
+            user_id,
+            AggregationPeriod.YEAR,
+            datetime(2024, 6, 15),
+            datetime(2025, 1, 2, 15),
+        )
+
+    # O início exclui a receita de 10/06 e o fim corta o dia 02/01 ao meio
+    assert _totals(rows) == [
+        ("2024-01-01", "0", "37.00"),
+        ("2025-01-01", "100.00", "0"),
+    ]
+    assert not any("monthly_rollups" in sql for sql in executed)
+
+
+async def test_month_aligned_range_uses_rollups(
+    database: Database, repository: TransactionRepositoryImpl, user_id: UUID
+) -> None:
+    with statements(database) as executed:
+        rows = await repository.get_totals_by_period(
+            user_id, AggregationPeriod.YEAR, datetime(2024, 1, 1), datetime(2026, 1, 1)
+        )
+
+    assert _totals(rows) == [
+        ("2024-01-01", "500.00", "37.00"),
+        ("2025-01-01", "100.00", "45.00"),
+    ]
+    assert any("monthly_rollups" in sql for sql in executed)
+    assert not any("FROM transactions" in sql for sql in executed)
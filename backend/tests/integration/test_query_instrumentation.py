@@ -0,0 +1,99 @@
+"""Instrumentação SQL por requisição: Server-Timing, histogramas e /metrics."""
+
+import logging
+import re
+from uuid import uuid4
+
+import httpx
+import pytest
+
+CATEGORIES = "/api/v1/categories/"
+
+
+def _sample(metrics: str, name: str, **labels: str) -> float:
+    """Valor de uma amostra do /metrics, ou 0 se ainda não existir."""
+    for line in metrics.splitlines():
+        if line.startswith("#"):
+            continue
+        sample, _, value = line.rpartition(" ")
+        metric, _, rendered = sample.partition("{")
+        found = dict(re.findall(r'(\w+)="([^"]*)"', rendered))
+        if metric == name and found == labels:
+            return float(value)
+    return 0.0
+
+
+async def test_server_timing_reports_request_queries(
+    client: httpx.AsyncClient, auth_headers: dict[str, str]
+) -> None:
+    response = await client.get(CATEGORIES, headers=auth_headers)
+
+    timing = response.headers["Server-Timing"]
+    match = re.fullmatch(
+        r'db;dur=([\d.]+);desc="(\d+) queries", '
+        r"db-slowest;dur=([\d.]+), app;dur=([\d.]+)",
+        timing,
+    )
+    assert match, timing
+    db, queries, slowest, app = match.groups()
+    assert int(queries) >= 1
+    assert float(slowest) <= float(db) <= float(app)
+
+
+async def test_histograms_are_exposed_in_metrics(
+    client: httpx.AsyncClient, auth_headers: dict[str, str]
+) -> None:
+    route = {"method": "GET", "route": CATEGORIES}
+    select = {"engine": "primary", "operation": "SELECT"}
+    before = (await client.get("/metrics")).text
+
+    response = await client.get(CATEGORIES, headers=auth_headers)
+    queries = int(re.search(r'"(\d+) queries"', response.headers["Server-Timing"])[1])
+    metrics = (await client.get("/metrics")).text
+
+    assert "# TYPE http_request_db_queries histogram" in metrics
+    assert "# TYPE db_query_duration_seconds histogram" in metrics
+    for name in ("http_request_db_queries_count", "http_request_db_seconds_count"):
+        assert _sample(metrics, name, **route) == _sample(before, name, **route) + 1
+    assert _sample(metrics, "http_request_db_queries_sum", **route) == (
+        _sample(before, "http_request_db_queries_sum", **route) + queries
+    )
+    assert _sample(metrics, "db_query_duration_seconds_count", **select) >= (
+        _sample(before, "db_query_duration_seconds_count", **select) + queries
+    )
+
+
+class TestDisabledServerTiming:
+    @pytest.fixture
+    def app_env(self) -> dict[str, str]:
+        return {"SERVER_TIMING_ENABLED": "false", "SLOW_REQUEST_QUERY_COUNT": "1"}
+
+    async def test_header_is_omitted_and_slow_request_is_logged(
+        self,
+        client: httpx.AsyncClient,
+        auth_headers: dict[str, str],
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        with caplog.at_level(logging.WARNING):
+            response = await client.get(CATEGORIES, headers=auth_headers)
+
+        assert response.status_code == 200
+        assert "Server-Timing" not in response.headers
+        assert any(
+            '"event": "slow_request_db"' in record.getMessage()
+            and CATEGORIES in record.getMessage()
+            for record in caplog.records
+        )
+
+
+async def test_route_label_is_the_full_template(
+    client: httpx.AsyncClient, auth_headers: dict[str, str]
+) -> None:
+    await client.delete(f"{CATEGORIES}{uuid4()}", headers=auth_headers)
+    await client.get("/api/v1/nao-existe", headers=auth_headers)
+    metrics = (await client.get("/metrics")).text
+
+    route = {"method": "DELETE", "route": "/api/v1/categories/{category_id}"}
+    assert _sample(metrics, "http_request_db_queries_count", **route) >= 1
+    unmatched = {"method": "GET", "route": "unmatched"}
+    assert _sample(metrics, "http_request_db_queries_count", **unmatched) >= 1
@@ -0,0 +1,180 @@
+"""Os SELECTs dos repositórios usam os índices compostos (EXPLAIN QUERY PLAN)."""
+
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Iterator
+from uuid import UUID
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities import AggregationPeriod, Transaction, TransactionType
+from src.infrastructure.database import Database
+from src.infrastructure.database.repositories import TransactionRepositoryImpl
+
+LISTING_INDEX = "ix_transactions_user_id_date_id"
+TYPE_INDEX = "ix_transactions_user_id_type_date"
+ROLLUPS_INDEX = "sqlite_autoindex_monthly_rollups_1"
+
+
+@contextmanager
+def captured_selects(database: Database) -> Iterator[list[tuple[str, Any]]]:
+    """Registra os SELECTs executados no engine dentro do bloco."""
+    statements: list[tuple[str, Any]] = []
+
+    def capture(
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        if statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            statements.append((statement, parameters))
+
+    engine = database.engine.sync_engine
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+
+async def query_plans(
+    database: Database, session: AsyncSession, call: Callable[[], Awaitable[Any]]
+) -> list[list[str]]:
+    """Plano de cada SELECT emitido por ``call``."""
+    with captured_selects(database) as statements:
+        await call()
+    assert statements
+
+    connection = await session.connection()
+    plans = []
+    for statement, parameters in statements:
+        result = await connection.exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {statement}", parameters
+        )
+        plans.append([row[3] for row in result])
+    return plans
+
+
+def assert_index_search(plans: list[list[str]], table: str, index: str) -> None:
+    for plan in plans:
+        assert any(
+            line.startswith(f"SEARCH {table} USING ") and f"INDEX {index} " in line
+            for line in plan
+        ), plan
+        assert not any(line.startswith("SCAN ") for line in plan), plan
+
+
+@pytest.fixture
+def repository(session: AsyncSession) -> TransactionRepositoryImpl:
+    return TransactionRepositoryImpl(session)
+
+
+async def test_listing_searches_user_date_index_without_sorting(
+    database: Database,
+    session: AsyncSession,
+    repository: TransactionRepositoryImpl,
+    user_id: UUID,
+    category_id: UUID,
+    transactions: list[Transaction],
+) -> None:
+    for call in (
+        lambda: repository.get_all_by_user(user_id, limit=20),
+        lambda: repository.get_all_by_user(user_id, category_id=category_id),
+        lambda: repository.get_all_by_user(user_id, type=TransactionType.EXPENSE),
+        lambda: repository.get_all_by_user(
+            user_id, start_date=datetime(2025, 3, 1), end_date=datetime(2025, 6, 1)
+        ),
+    ):
+        plans = await query_plans(database, session, call)
+        assert_index_search(plans, "transactions", LISTING_INDEX)
+        # A ordem (date, id) vem do próprio índice
+        assert not any("TEMP B-TREE" in line for plan in plans for line in plan)
+
+
+async def test_cursor_page_seeks_into_listing_index(
+    database: Database,
+    session: AsyncSession,
+    repository: TransactionRepositoryImpl,
+    user_id: UUID,
+    transactions: list[Transaction],
+) -> None:
+    last = transactions[5]
+    plans = await query_plans(
+        database,
+        session,
+        lambda: repository.get_all_by_user(user_id, after=(last.date, last.id)),
+    )
+    assert_index_search(plans, "transactions", LISTING_INDEX)
+    assert any("(date,id)<(?,?)" in line for plan in plans for line in plan)
+
+
+async def test_summary_reads_rollups_or_date_range(
+    database: Database,
+    session: AsyncSession,
+    repository: TransactionRepositoryImpl,
+    user_id: UUID,
+    transactions: list[Transaction],
+) -> None:
+    plans = await query_plans(
+        database, session, lambda: repository.get_summary(user_id)
+    )
+    assert_index_search(plans, "monthly_rollups", ROLLUPS_INDEX)
+
+    # Meses parciais são somados direto das transações, pelo intervalo de datas
+    plans = await query_plans(
+        database,
+        session,
+        lambda: repository.get_summary(
+            user_id, datetime(2025, 3, 5), datetime(2025, 6, 1)
+        ),
+    )
+    assert all(
+        any(
+            f"INDEX {LISTING_INDEX} (user_id=? AND date>? AND date<?)" in line
+            for line in plan
+        )
+        or any(f"INDEX {ROLLUPS_INDEX} " in line for line in plan)
+        for plan in plans
+    ), plans
+    assert not any(line.startswith("SCAN ") for plan in plans for line in plan)
+
+
+async def test_monthly_totals_search_rollups_by_period(
+    database: Database,
+    session: AsyncSession,
+    repository: TransactionRepositoryImpl,
+    user_id: UUID,
+    transactions: list[Transaction],
+) -> None:
+    plans = await query_plans(
+        database,
+        session,
+        lambda: repository.get_totals_by_period(
+            user_id, AggregationPeriod.MONTH, datetime(2025, 1, 1), datetime(2026, 1, 1)
+        ),
+    )
+    assert_index_search(plans, "monthly_rollups", ROLLUPS_INDEX)
+
+
+async def test_category_totals_search_user_type_date_index(
+    database: Database,
+    session: AsyncSession,
+    repository: TransactionRepositoryImpl,
+    user_id: UUID,
+    category_id: UUID,
+    transactions: list[Transaction],
+) -> None:
+    start, end = datetime(2025, 3, 5), datetime(2025, 6, 1)
+    for call in (
+        lambda: repository.get_totals_by_categories(user_id, [category_id], start, end),
+        lambda: repository.get_total_by_type(
+            user_id, TransactionType.EXPENSE, start, end
+        ),
+    ):
+        plans = await query_plans(database, session, call)
+        assert_index_search(plans, "transactions", TYPE_INDEX)
@@ -0,0 +1,72 @@
+"""Rate limit (429) e controle de admissão (503) na aplicação."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from starlette.types import Receive, Scope, Send
+
+from src.infrastructure.ratelimit import AdmissionController
+from src.presentation.api.middleware import AdmissionControlMiddleware
+
+
+@pytest.fixture
+def app_env() -> dict[str, str]:
+    return {
+        "RATE_LIMIT_ENABLED": "true",
+        "RATE_LIMIT_RATE": "0.5",
+        "RATE_LIMIT_BURST": "10",
+        "RATE_LIMIT_ROUTE_COSTS": json.dumps(
+            {"POST /api/v1/auth/login": 5, "GET /api/v1/categories/": 2}
+        ),
+    }
+
+
+async def test_bucket_per_user_answers_429_with_retry_after(
+    client: httpx.AsyncClient, auth_headers: dict[str, str]
+) -> None:
+    for _ in range(5):
+        response = await client.get("/api/v1/categories/", headers=auth_headers)
+        assert response.status_code == 200
+
+    response = await client.get("/api/v1/categories/", headers=auth_headers)
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "4"
+
+    # Monitoramento não consome fichas
+    assert (await client.get("/health")).status_code == 200
+
+
+async def test_anonymous_clients_are_limited_by_ip(client: httpx.AsyncClient) -> None:
+    credentials = {"username": "ninguem@example.com", "password": "errada123"}
+    statuses = [
+        (await client.post("/api/v1/auth/login", data=credentials)).status_code
+        for _ in range(3)
+    ]
+    assert statuses == [401, 401, 429]
+
+
+async def test_admission_answers_503_when_queue_is_full() -> None:
+    release = asyncio.Event()
+
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        await release.wait()
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    controller = AdmissionController(
+        lambda: 0.0, max_concurrency=1, max_queue=0, queue_timeout=0.1
+    )
+    transport = httpx.ASGITransport(app=AdmissionControlMiddleware(app, controller))
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        first = asyncio.create_task(client.get("/api/v1/transactions/"))
+        await asyncio.sleep(0.01)
+
+        rejected = await client.get("/api/v1/transactions/")
+        assert rejected.status_code == 503
+        assert rejected.headers["Retry-After"] == "1"
+
+        release.set()
+        assert (await first).status_code == 200
+    assert controller.in_flight == 0
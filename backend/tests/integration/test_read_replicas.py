@@ -0,0 +1,128 @@
+"""Roteamento de leituras para réplicas e leitura-após-escrita.
+
+A "réplica" é outro arquivo SQLite migrado, sem replicação: cada consulta
+mostra pelo conteúdo (ou pelo engine que a executou) de onde leu.
+"""
+
+import json
+from contextlib import contextmanager
+from typing import Any, AsyncIterator, Iterator
+from uuid import uuid4
+
+import httpx
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.infrastructure.config import Settings
+from src.infrastructure.database import CategoryModel, Database, UserModel
+from src.infrastructure.database.database import request_routing_scope
+from src.infrastructure.database.schema import upgrade_schema
+
+
+@pytest.fixture
+def replica_url(tmp_path: Any) -> str:
+    url = f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}"
+    upgrade_schema(url)
+    return url
+
+
+@pytest.fixture
+async def replicated(database_url: str, replica_url: str) -> AsyncIterator[Database]:
+    settings = Settings(database_url=database_url)
+    database = Database(database_url, settings, replica_urls=[replica_url])
+    yield database
+    await database.dispose()
+
+
+@contextmanager
+def selects_by_engine(database: Database) -> Iterator[dict[str, int]]:
+    """Conta os SELECTs executados no primário e em cada réplica."""
+    engines: dict[str, AsyncEngine] = {"primary": database.engine}
+    replicas = database._replicas
+    assert replicas is not None
+    engines.update(
+        (f"replica-{index}", engine) for index, engine in enumerate(replicas.engines)
+    )
+    counts = dict.fromkeys(engines, 0)
+    listeners = []
+    for name, engine in engines.items():
+
+        def count(*args: Any, name: str = name) -> None:
+            if args[2].lstrip().upper().startswith("SELECT"):
+                counts[name] += 1
+
+        event.listen(engine.sync_engine, "before_cursor_execute", count)
+        listeners.append((engine, count))
+    try:
+        yield counts
+    finally:
+        for engine, count in listeners:
+            event.remove(engine.sync_engine, "before_cursor_execute", count)
+
+
+async def test_reads_go_to_replica(replicated: Database) -> None:
+    with request_routing_scope(), selects_by_engine(replicated) as counts:
+        async for session in replicated.get_read_session():
+            await session.execute(select(UserModel))
+            await session.execute(select(CategoryModel))
+
+    assert counts == {"primary": 0, "replica-0": 2}
+
+
+async def test_reads_after_write_are_pinned_to_primary(replicated: Database) -> None:
+    with request_routing_scope(), selects_by_engine(replicated) as counts:
+        async for session in replicated.get_session():
+            session.add(
+                UserModel(
+                    id=uuid4(), email="a@example.com", name="A", hashed_password="x"
+                )
+            )
+            await session.flush()
+        async for session in replicated.get_read_session():
+            users = (await session.execute(select(UserModel.email))).scalars().all()
+
+    assert users == ["a@example.com"]
+    assert counts["replica-0"] == 0
+
+    # A próxima requisição volta a ler da réplica, que não recebeu a escrita
+    with request_routing_scope(), selects_by_engine(replicated) as counts:
+        async for session in replicated.get_read_session():
+            users = (await session.execute(select(UserModel.email))).scalars().all()
+
+    assert users == []
+    assert counts == {"primary": 0, "replica-0": 1}
+
+
+async def test_read_session_uses_primary_without_replicas(database: Database) -> None:
+    async for session in database.get_session():
+        session.add(
+            UserModel(id=uuid4(), email="b@example.com", name="B", hashed_password="x")
+        )
+
+    with request_routing_scope():
+        async for session in database.get_read_session():
+            users = (await session.execute(select(UserModel.email))).scalars().all()
+
+    assert users == ["b@example.com"]
+
+
+class TestApiRouting:
+    @pytest.fixture
+    def app_env(self, replica_url: str) -> dict[str, str]:
+        return {"DATABASE_REPLICA_URLS": json.dumps([replica_url])}
+
+    async def test_get_routes_read_from_replica(
+        self, client: httpx.AsyncClient, auth_headers: dict[str, str]
+    ) -> None:
+        created = await client.post(
+            "/api/v1/categories/",
+            json={"name": "Mercado", "color": "#00ff00", "icon": "cart"},
+            headers=auth_headers,
+        )
+        assert created.status_code == 201
+
+        # A réplica de teste nunca recebe a escrita feita no primário
+        listed = await client.get("/api/v1/categories/", headers=auth_headers)
+        assert listed.status_code == 200
+        assert listed.json() == []
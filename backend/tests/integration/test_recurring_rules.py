@@ -0,0 +1,92 @@
+"""Geração das ocorrências e remoção de regras recorrentes."""
+
+from datetime import datetime
+from decimal import Decimal
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.use_cases import MaterializeRecurringRulesUseCase
+from src.domain.entities import RecurrenceFrequency, RecurringRule, TransactionType
+from src.infrastructure.database import MonthlyRollupModel, TransactionModel
+from src.infrastructure.database.models import UNCATEGORIZED_ID
+from src.infrastructure.database.repositories import (
+    CategoryRepositoryImpl,
+    RecurringRuleRepositoryImpl,
+    TransactionRepositoryImpl,
+)
+from src.infrastructure.database.rollups import MonthlyRollupStore
+
+
+async def _materialize(session: AsyncSession, now: datetime) -> tuple[int, int]:
+    use_case = MaterializeRecurringRulesUseCase(
+        RecurringRuleRepositoryImpl(session), TransactionRepositoryImpl(session)
+    )
+    return await use_case.execute(now)
+
+
+async def test_deleting_rule_keeps_its_transactions_unlinked(
+    session: AsyncSession, user_id: UUID
+) -> None:
+    rules = RecurringRuleRepositoryImpl(session)
+    rule = await rules.create(
+        RecurringRule(
+            user_id=user_id,
+            description="Aluguel",
+            amount=Decimal("1500.00"),
+            type=TransactionType.EXPENSE,
+            frequency=RecurrenceFrequency.MONTHLY,
+            start_date=datetime(2025, 1, 5),
+        )
+    )
+
+    assert await _materialize(session, datetime(2025, 3, 10)) == (1, 3)
+    # Ocorrências já geradas não se repetem
+    assert await _materialize(session, datetime(2025, 3, 10)) == (0, 0)
+
+    assert await rules.delete(rule.id, user_id)
+    assert not await rules.delete(rule.id, user_id)
+
+    result = await session.execute(
+        select(TransactionModel.recurring_rule_id).where(
+            TransactionModel.user_id == user_id
+        )
+    )
+    assert result.scalars().all() == [None, None, None]
+
+
+async def test_deleted_category_is_dropped_from_rules(
+    session: AsyncSession, user_id: UUID, category_id: UUID
+) -> None:
+    rules = RecurringRuleRepositoryImpl(session)
+    rule = await rules.create(
+        RecurringRule(
+            user_id=user_id,
+            description="Feira",
+            amount=Decimal("80.00"),
+            type=TransactionType.EXPENSE,
+            frequency=RecurrenceFrequency.MONTHLY,
+            start_date=datetime(2025, 1, 5),
+            category_id=category_id,
+        )
+    )
+    assert await _materialize(session, datetime(2025, 1, 10)) == (1, 1)
+
+    assert await CategoryRepositoryImpl(session).delete(category_id, user_id)
+    stored = await rules.get_by_id(rule.id)
+    assert stored is not None and stored.category_id is None
+
+    assert await _materialize(session, datetime(2025, 3, 10)) == (1, 2)
+
+    result = await session.execute(
+        select(TransactionModel.category_id).where(TransactionModel.user_id == user_id)
+    )
+    assert result.scalars().all() == [None, None, None]
+    result = await session.execute(
+        select(MonthlyRollupModel.category_id).where(
+            MonthlyRollupModel.user_id == user_id
+        )
+    )
+    assert set(result.scalars()) == {UNCATEGORIZED_ID}
+    assert await MonthlyRollupStore(session).verify(user_id) == []
@@ -0,0 +1,108 @@
+"""Os rollups mensais acompanham todas as escritas de transações."""
+
+from dataclasses import replace
+from datetime import datetime
+from decimal import Decimal
+from uuid import UUID
+
+import httpx
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities import Transaction, TransactionType
+from src.infrastructure.database.repositories import (
+    CategoryRepositoryImpl,
+    TransactionRepositoryImpl,
+)
+from src.infrastructure.database.rollups import MonthlyRollupStore
+
+
+async def test_writes_keep_rollups_in_sync(
+    session: AsyncSession,
+    user_id: UUID,
+    category_id: UUID,
+    transactions: list[Transaction],
+) -> None:
+    repository = TransactionRepositoryImpl(session)
+    rollups = MonthlyRollupStore(session)
+    assert await rollups.verify(user_id) == []
+
+    # Muda valor, mês, tipo e categoria de uma transação
+    moved = replace(
+        transactions[0],
+        amount=Decimal("99.90"),
+        date=datetime(2024, 12, 31, 23, 0),
+        type=TransactionType.EXPENSE,
+        category_id=None,
+    )
+    await repository.update(moved)
+    await repository.delete(transactions[1].id, user_id)
+    await repository.create_many(
+        [
+            Transaction(
+                description="Lote",
+                amount=Decimal("5.00"),
+                type=TransactionType.EXPENSE,
+                user_id=user_id,
+                category_id=category_id,
+                date=datetime(2025, 2, day),
+            )
+            for day in range(1, 4)
+        ]
+    )
+    await repository.update_many(
+        user_id,
+        {"type": TransactionType.INCOME, "category_id": None},
+        start_date=datetime(2025, 2, 1),
+        end_date=datetime(2025, 6, 1),
+    )
+    await repository.delete_many(user_id, type=TransactionType.INCOME)
+    await CategoryRepositoryImpl(session).delete(category_id, user_id)
+
+    assert await rollups.verify(user_id) == []
+
+
+async def test_verify_reports_drift_and_rebuild_repairs_it(
+    session: AsyncSession, user_id: UUID, transactions: list[Transaction]
+) -> None:
+    rollups = MonthlyRollupStore(session)
+
+    # Alteração direta no banco, sem passar pelo repositório
+    await session.execute(
+        text("UPDATE transactions SET amount = amount + 1 WHERE id = :id"),
+        {"id": transactions[2].id.hex},
+    )
+    drift = await rollups.verify(user_id)
+    assert len(drift) == 1
+    assert drift[0].key[1:3] == (2025, 3)
+
+    await rollups.rebuild(user_id)
+    assert await rollups.verify(user_id) == []
+
+
+async def test_summary_matches_created_transactions(
+    client: httpx.AsyncClient, auth_headers: dict[str, str]
+) -> None:
+    for amount, type in (
+        ("100.00", "income"),
+        ("30.50", "expense"),
+        ("19.50", "expense"),
+    ):
+        response = await client.post(
+            "/api/v1/transactions/",
+            json={
+                "description": "t",
+                "amount": amount,
+                "type": type,
+                "date": "2025-05-10T10:00:00",
+            },
+            headers=auth_headers,
+        )
+        assert response.status_code == 201
+
+    summary = (
+        await client.get("/api/v1/transactions/summary", headers=auth_headers)
+    ).json()
+    assert Decimal(summary["total_income"]) == Decimal("100.00")
+    assert Decimal(summary["total_expense"]) == Decimal("50.00")
+    assert summary["transaction_count"] == 3
@@ -0,0 +1,102 @@
+"""A aplicação só inicia com o esquema na última migração."""
+
+import asyncio
+import sqlite3
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from src.infrastructure.config import Settings
+from src.infrastructure.database import Database
+from src.infrastructure.database.repositories import TransactionRepositoryImpl
+from src.infrastructure.database.rollups import MonthlyRollupStore
+from src.infrastructure.database.schema import (
+    SchemaOutOfDateError,
+    ensure_schema_current,
+    upgrade_schema,
+)
+
+
+async def test_unmigrated_database_is_refused(tmp_path) -> None:
+    url = f"sqlite+aiosqlite:///{tmp_path / 'old.db'}"
+    await asyncio.to_thread(upgrade_schema, url, "0003")
+    database = Database(url, Settings(database_url=url))
+    try:
+        with pytest.raises(SchemaOutOfDateError, match="0003"):
+            await ensure_schema_current(database)
+    finally:
+        await database.dispose()
+
+
+async def test_migrated_database_is_accepted(database: Database) -> None:
+    await ensure_schema_current(database)
+
+
+async def test_upgrade_backfills_rollups_and_search_index(tmp_path) -> None:
+    url = f"sqlite+aiosqlite:///{tmp_path / 'old.db'}"
+    await asyncio.to_thread(upgrade_schema, url, "0003")
+
+    user_id = uuid4()
+    with sqlite3.connect(tmp_path / "old.db") as connection:
+        connection.execute(
+            "INSERT INTO users VALUES (?, 'ana@example.com', 'Ana', 'x', 1, 0, "
+            "'2025-01-01 00:00:00', NULL)",
+            (user_id.hex,),
+        )
+        connection.executemany(
+            "INSERT INTO transactions VALUES (?, ?, ?, ?, ?, ?, ?, NULL, "
+            "'2025-01-01 00:00:00', NULL)",
+            [
+                (
+                    uuid4().hex,
+                    "Mercado",
+                    "10.50",
+                    "EXPENSE",
+                    "2025-01-05 10:00:00",
+                    None,
+                    user_id.hex,
+                ),
+                (
+                    uuid4().hex,
+                    "Padaria",
+                    "4.50",
+                    "EXPENSE",
+                    "2025-01-20 08:00:00",
+                    "pão de queijo",
+                    user_id.hex,
+                ),
+                (
+                    uuid4().hex,
+                    "Salário",
+                    "100.00",
+                    "INCOME",
+                    "2025-02-01 09:00:00",
+                    None,
+                    user_id.hex,
+                ),
+            ],
+        )
+
+    await asyncio.to_thread(upgrade_schema, url)
+
+    database = Database(url, Settings(database_url=url))
+    try:
+        async for session in database.get_session():
+            store = MonthlyRollupStore(session)
+            assert await store.verify() == []
+            totals = await TransactionRepositoryImpl(session).get_summary(user_id)
+            assert (
+                totals.total_income,
+                totals.total_expense,
+                totals.transaction_count,
+            ) == (
+                Decimal("100.00"),
+                Decimal("15.00"),
+                3,
+            )
+
+            found = await TransactionRepositoryImpl(session).search(user_id, "queijo")
+            assert [t.description for t in found] == ["Padaria"]
+    finally:
+        await database.dispose()
@@ -0,0 +1,118 @@
+"""Busca textual de transações e sincronização do índice FTS5."""
+
+import httpx
+import pytest
+
+URL = "/api/v1/transactions/"
+SEARCH = "/api/v1/transactions/search"
+
+
+async def _create(
+    client: httpx.AsyncClient,
+    headers: dict[str, str],
+    description: str,
+    notes: str | None = None,
+    date: str = "2025-03-10T12:00:00",
+) -> str:
+    response = await client.post(
+        URL,
+        json={
+            "description": description,
+            "amount": "10.00",
+            "type": "expense",
+            "date": date,
+            "notes": notes,
+        },
+        headers=headers,
+    )
+    assert response.status_code == 201, response.text
+    return str(response.json()["id"])
+
+
+async def _search(
+    client: httpx.AsyncClient, headers: dict[str, str], q: str, **params: int
+) -> list[str]:
+    response = await client.get(SEARCH, params={"q": q, **params}, headers=headers)
+    assert response.status_code == 200, response.text
+    return [item["description"] for item in response.json()]
+
+
+async def test_words_match_as_prefixes_ignoring_accents(
+    client: httpx.AsyncClient, auth_headers: dict[str, str]
+) -> None:
+    await _create(client, auth_headers, "Supermercado São João")
+    await _create(client, auth_headers, "Farmácia", notes="remédio do mês")
+    await _create(client, auth_headers, "Padaria")
+
+    assert await _search(client, auth_headers, "super") == ["Supermercado São João"]
+    assert await _search(client, auth_headers, "sao joao") == ["Supermercado São João"]
+    assert await _search(client, auth_headers, "REMEDIO") == ["Farmácia"]
+    # Todas as palavras precisam casar
+    assert await _search(client, auth_headers, "super farm") == []
+
+
+async def test_results_are_paginated_and_scoped_to_user(
+    client: httpx.AsyncClient, auth_headers: dict[str, str]
+) -> None:
+    for month in range(1, 6):
+        await _create(
+            client, auth_headers, f"Mercado {month}", date=f"2025-0{month}-10T12:00:00"
+        )
+
+    first = await _search(client, auth_headers, "mercado", limit=2)
+    rest = await _search(client, auth_headers, "mercado", limit=2, offset=2)
+    assert len(first) == 2 and len(rest) == 2
+    assert not set(first) & set(rest)
+
+    await client.post(
+        "/api/v1/auth/register",
+        json={"email": "bia@example.com", "name": "Bia", "password": "secret123"},
+    )
+    login = await client.post(
+        "/api/v1/auth/login",
+        data={"username": "bia@example.com", "password": "secret123"},
+    )
+    other = {"Authorization": f"Bearer {login.json()['access_token']}"}
+    assert await _search(client, other, "mercado") == []
+
+
+@pytest.mark.parametrize("q", ["*", '"', "-- ?!"])
+async def test_query_without_words_is_rejected(
+    client: httpx.AsyncClient, auth_headers: dict[str, str], q: str
+) -> None:
+    response = await client.get(SEARCH, params={"q": q}, headers=auth_headers)
+    assert response.status_code == 400
+
+
+async def test_index_follows_updates_and_deletes(
+    client: httpx.AsyncClient, auth_headers: dict[str, str]
+) -> None:
+    first = await _create(client, auth_headers, "Mercado")
+    second = await _create(client, auth_headers, "Padaria")
+    third = await _create(client, auth_headers, "Açougue")
+
+    await client.patch(
+        f"{URL}{first}", json={"description": "Feira"}, headers=auth_headers
+    )
+    assert await _search(client, auth_headers, "mercado") == []
+    assert await _search(client, auth_headers, "feira") == ["Feira"]
+
+    response = await client.patch(
+        f"{URL}bulk",
+        json={"ids": [second, third], "changes": {"notes": "churrasco"}},
+        headers=auth_headers,
+    )
+    assert response.json() == {"affected": 2}
+    assert sorted(await _search(client, auth_headers, "churrasco")) == [
+        "Açougue",
+        "Padaria",
+    ]
+
+    await client.delete(f"{URL}{second}", headers=auth_headers)
+    assert await _search(client, auth_headers, "churrasco") == ["Açougue"]
+
+    await client.request(
+        "DELETE", f"{URL}bulk", json={"ids": [third]}, headers=auth_headers
+    )
+    assert await _search(client, auth_headers, "churrasco") == []
+    assert await _search(client, auth_headers, "acougue") == []
@@ -0,0 +1,89 @@
+"""Cache de usuários autenticados e suas invalidações."""
+
+import asyncio
+from contextlib import contextmanager
+from typing import Any, Iterator
+from uuid import UUID
+
+import httpx
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.cache import InMemoryUserCache, get_user_cache
+from src.infrastructure.database.database import get_database
+from src.infrastructure.database.repositories import UserRepositoryImpl
+
+
+@contextmanager
+def user_queries() -> Iterator[list[str]]:
+    """Registra os comandos SQL que leem a tabela de usuários."""
+    engine = get_database().engine.sync_engine
+    statements: list[str] = []
+
+    def capture(*args: Any) -> None:
+        if "FROM users" in args[2]:
+            statements.append(args[2])
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+
+async def test_second_request_skips_user_query(
+    client: httpx.AsyncClient, auth_headers: dict[str, str]
+) -> None:
+    with user_queries() as statements:
+        response = await client.get("/api/v1/users/me", headers=auth_headers)
+        assert response.status_code == 200
+        first = len(statements)
+
+        response = await client.get("/api/v1/users/me", headers=auth_headers)
+        assert response.status_code == 200
+
+    assert first == 1
+    assert len(statements) == first
+
+    metrics = (await client.get("/metrics")).text
+    assert "user_cache_hits_total" in metrics
+    assert "user_cache_misses_total" in metrics
+
+
+async def test_update_evicts_cached_user(
+    client: httpx.AsyncClient, auth_headers: dict[str, str]
+) -> None:
+    response = await client.get("/api/v1/users/me", headers=auth_headers)
+    user_id = UUID(response.json()["id"])
+    cache = get_user_cache()
+    assert await cache.get(user_id) is not None
+
+    response = await client.patch(
+        "/api/v1/users/me", json={"name": "Ana Maria"}, headers=auth_headers
+    )
+    assert response.status_code == 200
+    assert await cache.get(user_id) is None
+
+    response = await client.get("/api/v1/users/me", headers=auth_headers)
+    assert response.json()["name"] == "Ana Maria"
+
+
+async def test_deactivate_evicts_cached_user(
+    session: AsyncSession, user_id: UUID
+) -> None:
+    cache = InMemoryUserCache(ttl_seconds=60, max_size=10)
+    repository = UserRepositoryImpl(session, cache)
+    user = await repository.get_by_id(user_id)
+    assert user is not None
+    await cache.set(user)
+
+    user.deactivate()
+    await repository.update(user)
+    assert await cache.get(user_id) is None
+
+    # Leitura concorrente anterior ao commit também é descartada
+    await cache.set(user)
+    await session.commit()
+    await asyncio.sleep(0)
+    assert await cache.get(user_id) is None
+    assert len(cache) == 0
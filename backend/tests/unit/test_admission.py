@@ -0,0 +1,58 @@
+"""Fila e recusa do AdmissionController."""
+
+import asyncio
+
+import pytest
+
+from src.infrastructure.ratelimit import AdmissionController, AdmissionRejectedError
+
+
+async def test_waiters_are_admitted_in_order_when_slots_free() -> None:
+    controller = AdmissionController(lambda: 0.0, max_concurrency=1, max_queue=5)
+    await controller.acquire()
+
+    admitted: list[int] = []
+
+    async def request(index: int) -> None:
+        await controller.acquire()
+        admitted.append(index)
+
+    waiting = [asyncio.create_task(request(index)) for index in range(3)]
+    await asyncio.sleep(0.01)
+    assert controller.queued == 3 and admitted == []
+
+    for _ in range(3):
+        controller.release()
+        await asyncio.sleep(0.01)
+    await asyncio.gather(*waiting)
+    assert admitted == [0, 1, 2]
+
+
+async def test_full_queue_and_timeout_are_rejected() -> None:
+    controller = AdmissionController(
+        lambda: 0.0, max_concurrency=1, max_queue=1, queue_timeout=0.05
+    )
+    await controller.acquire()
+
+    waiter = asyncio.create_task(controller.acquire())
+    await asyncio.sleep(0.01)
+    with pytest.raises(AdmissionRejectedError):
+        await controller.acquire()
+
+    with pytest.raises(AdmissionRejectedError):
+        await waiter
+    assert controller.in_flight == 1 and controller.queued == 0
+
+
+async def test_saturated_pool_holds_requests_without_fixed_limit() -> None:
+    saturation = [0.95]
+    controller = AdmissionController(lambda: saturation[0], queue_timeout=1.0)
+
+    waiter = asyncio.create_task(controller.acquire())
+    await asyncio.sleep(0.01)
+    assert controller.queued == 1
+
+    # Sem release: a saturação é reavaliada periodicamente
+    saturation[0] = 0.5
+    await asyncio.wait_for(waiter, 0.5)
+    assert controller.in_flight == 1
@@ -0,0 +1,80 @@
+"""Agregações vetorizadas do AnalyticsEngine."""
+
+import warnings
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import numpy as np
+
+from src.domain.entities import AggregationPeriod, TransactionType
+from src.infrastructure.analytics import AnalyticsEngine, TransactionColumns
+from src.infrastructure.analytics.engine import period_starts
+
+BRT = timezone(timedelta(hours=-3))
+
+
+def test_weeks_start_on_monday() -> None:
+    dates = np.array(["2025-01-05", "2025-01-06", "2025-01-12"], dtype="datetime64[D]")
+    starts = period_starts(dates, AggregationPeriod.WEEK)
+    assert starts.tolist() == [
+        datetime(2024, 12, 30).date(),
+        datetime(2025, 1, 6).date(),
+        datetime(2025, 1, 6).date(),
+    ]
+
+
+def test_cashflow_sums_each_period_and_running_balance() -> None:
+    category = uuid4()
+    columns = TransactionColumns.from_rows(
+        [
+            (10000, datetime(2025, 1, 5), None, TransactionType.INCOME),
+            (2500, datetime(2025, 1, 20), category, TransactionType.EXPENSE),
+            (1000, datetime(2025, 3, 1), category, TransactionType.EXPENSE),
+        ]
+    )
+    series = AnalyticsEngine(columns).cashflow(AggregationPeriod.MONTH, 500, window=2)
+
+    assert series.income.tolist() == [10000, 0, 0]
+    assert series.expense.tolist() == [2500, 0, 1000]
+    assert series.balance.tolist() == [8000, 8000, 7000]
+    assert np.isnan(series.moving_average[0])
+    assert series.moving_average[1:].tolist() == [3750.0, -500.0]
+
+
+def test_timezone_aware_dates_become_naive_utc() -> None:
+    rows = [(100, datetime(2025, 1, 31, 22, tzinfo=BRT), None, TransactionType.EXPENSE)]
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        columns = TransactionColumns.from_rows(rows)
+        engine = AnalyticsEngine(
+            columns,
+            datetime(2025, 1, 1, tzinfo=BRT),
+            datetime(2025, 3, 1, tzinfo=timezone.utc),
+        )
+        series = engine.cashflow(AggregationPeriod.MONTH, 0, window=1)
+
+    # 22h em Brasília já é fevereiro em UTC
+    assert columns.dates.tolist() == [datetime(2025, 2, 1, 1)]
+    assert series.expense.tolist() == [0, 100]
+
+
+def test_breakdown_groups_tail_categories_as_other() -> None:
+    food, rent, fun = uuid4(), uuid4(), uuid4()
+    columns = TransactionColumns.from_rows(
+        [
+            (3000, datetime(2025, 1, 2), food, TransactionType.EXPENSE),
+            (9000, datetime(2025, 1, 3), rent, TransactionType.EXPENSE),
+            (500, datetime(2025, 2, 3), fun, TransactionType.EXPENSE),
+            (700, datetime(2025, 2, 4), None, TransactionType.EXPENSE),
+            (5000, datetime(2025, 2, 5), None, TransactionType.INCOME),
+        ]
+    )
+    breakdown = AnalyticsEngine(columns).breakdown(
+        AggregationPeriod.MONTH, income=False, top=2
+    )
+
+    assert breakdown.category_ids == [rent, food]
+    assert breakdown.totals.tolist() == [9000, 3000]
+    assert breakdown.other_total == 1200
+    assert breakdown.other_series.tolist() == [0, 1200]
+    assert breakdown.grand_total == 13200
@@ -0,0 +1,38 @@
+"""Leitores de CSV e OFX da importação."""
+
+import io
+from decimal import Decimal
+
+from src.domain.entities import TransactionType
+from src.infrastructure.importers import parse_csv, parse_ofx
+
+
+def test_csv_header_is_normalized_and_empty_cells_dropped() -> None:
+    content = "\ufeff Description ,AMOUNT,extra,notes\nMercado , 10.5 ,x,\n".encode()
+
+    assert list(parse_csv(io.BytesIO(content))) == [
+        (2, {"description": "Mercado", "amount": "10.5"})
+    ]
+
+
+def test_ofx_xml_transactions_split_across_lines() -> None:
+    content = b"""<?xml version="1.0"?>
+<OFX><BANKTRANLIST>
+<STMTTRN><TRNTYPE>DEBIT</TRNTYPE><DTPOSTED>20250102</DTPOSTED>
+<TRNAMT>-10.00</TRNAMT><NAME>Farm\xe1cia</NAME></STMTTRN>
+<STMTTRN><TRNTYPE>CREDIT</TRNTYPE><DTPOSTED>20250103093000</DTPOSTED>
+<TRNAMT>abc</TRNAMT><MEMO>Pix</MEMO></STMTTRN>
+</BANKTRANLIST></OFX>"""
+
+    assert list(parse_ofx(io.BytesIO(content))) == [
+        (
+            1,
+            {
+                "description": "Farmácia",
+                "date": "2025-01-02T00:00:00",
+                "amount": Decimal("10.00"),
+                "type": TransactionType.EXPENSE,
+            },
+        ),
+        (2, {"description": "Pix", "date": "2025-01-03T09:30:00", "amount": "abc"}),
+    ]
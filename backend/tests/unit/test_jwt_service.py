@@ -0,0 +1,105 @@
+"""Backends de JWT e o cache de tokens verificados do JWTService."""
+
+import json
+import time
+from uuid import uuid4
+
+import pytest
+
+from src.infrastructure.config import Settings
+from src.infrastructure.security import JWTService, jwt_service
+from src.infrastructure.security.jwt_service import (
+    HMACBackend,
+    JoseBackend,
+    _b64encode,
+)
+
+SECRET = "segredo-de-teste"
+BACKENDS = [JoseBackend, HMACBackend]
+
+
+def forge(claims: dict, header: dict, backend: HMACBackend) -> str:
+    """Monta um token com cabeçalho arbitrário, assinado com a chave correta."""
+    signing_input = (
+        _b64encode(json.dumps(header).encode())
+        + b"."
+        + _b64encode(json.dumps(claims).encode())
+    )
+    return (signing_input + b"." + _b64encode(backend._sign(signing_input))).decode()
+
+
+@pytest.mark.parametrize("backend_class", BACKENDS)
+def test_tampered_signature_is_rejected(backend_class: type) -> None:
+    backend = backend_class(SECRET, "HS256")
+    token = backend.encode({"sub": "ana", "exp": int(time.time()) + 60})
+    signing_input, _, signature = token.rpartition(".")
+    tampered = signing_input + "." + ("A" if signature[0] != "A" else "B")
+    tampered += signature[1:]
+
+    assert backend.decode(token) is not None
+    assert backend.decode(tampered) is None
+    assert backend.decode(signing_input + ".") is None
+    assert backend_class("outra-chave", "HS256").decode(token) is None
+
+
+@pytest.mark.parametrize("backend_class", BACKENDS)
+@pytest.mark.parametrize("alg", ["none", "RS256", "HS512"])
+def test_alg_header_mismatch_is_rejected(backend_class: type, alg: str) -> None:
+    claims = {"sub": "ana", "exp": int(time.time()) + 60}
+    token = forge(claims, {"alg": alg, "typ": "JWT"}, HMACBackend(SECRET, "HS256"))
+
+    assert backend_class(SECRET, "HS256").decode(token) is None
+
+
+@pytest.mark.parametrize("backend_class", BACKENDS)
+def test_expired_and_not_yet_valid_tokens_are_rejected(backend_class: type) -> None:
+    backend = backend_class(SECRET, "HS256")
+    now = int(time.time())
+
+    assert backend.decode(backend.encode({"sub": "ana", "exp": now - 10})) is None
+    assert backend.decode(backend.encode({"sub": "ana", "nbf": now + 60})) is None
+
+
+def test_backends_are_interchangeable() -> None:
+    jose, fast = JoseBackend(SECRET, "HS256"), HMACBackend(SECRET, "HS256")
+    claims = {"sub": str(uuid4()), "exp": int(time.time()) + 60, "scope": "api"}
+
+    assert fast.decode(jose.encode(claims)) == claims
+    assert jose.decode(fast.encode(claims)) == claims
+    assert fast.decode(fast.encode(claims)) == jose.decode(jose.encode(claims))
+
+
+def test_hmac_backend_rejects_asymmetric_algorithms() -> None:
+    with pytest.raises(ValueError):
+        HMACBackend(SECRET, "RS256")
+
+
+def test_cached_token_is_rejected_after_expiry(monkeypatch: pytest.MonkeyPatch) -> None:
+    # O backend hmac lê o relógio por time.time, que o teste controla
+    service = JWTService(
+        Settings(jwt_secret_key=SECRET, jwt_backend="hmac", jwt_expire_minutes=1)
+    )
+    user_id = uuid4()
+    token = service.create_access_token({"sub": str(user_id)})
+    assert service.get_user_id_from_token(token) == user_id
+    assert token in service._cache
+
+    # Enquanto válido, o cache responde sem verificar o token novamente
+    decode = service.decode_token
+    monkeypatch.setattr(service, "decode_token", lambda token: pytest.fail())
+    assert service.get_user_id_from_token(token) == user_id
+
+    now = time.time()
+    monkeypatch.setattr(jwt_service.time, "time", lambda: now + 120)
+    monkeypatch.setattr(service, "decode_token", decode)
+    assert service.get_user_id_from_token(token) is None
+    assert token not in service._cache
+
+
+def test_cache_is_bounded() -> None:
+    service = JWTService(Settings(jwt_secret_key=SECRET, jwt_cache_size=2))
+    tokens = [service.create_access_token({"sub": str(uuid4())}) for _ in range(3)]
+    for token in tokens:
+        assert service.get_user_id_from_token(token) is not None
+
+    assert list(service._cache) == tokens[1:]
@@ -0,0 +1,44 @@
+"""Registro de métricas e formato de exposição do Prometheus."""
+
+from src.infrastructure.observability.metrics import MetricsRegistry
+
+
+def test_counter_accumulates_per_label() -> None:
+    registry = MetricsRegistry()
+    counter = registry.counter("jobs_total", "Tarefas", ("kind",))
+    counter.inc(kind="a")
+    counter.inc(2, kind="a")
+    counter.inc(kind="b")
+
+    assert counter.value(kind="a") == 3
+    assert registry.counter("jobs_total", "Tarefas", ("kind",)) is counter
+    assert registry.render() == (
+        "# HELP jobs_total Tarefas\n"
+        "# TYPE jobs_total counter\n"
+        'jobs_total{kind="a"} 3.0\n'
+        'jobs_total{kind="b"} 1.0\n'
+    )
+
+
+def test_histogram_buckets_are_cumulative() -> None:
+    registry = MetricsRegistry()
+    histogram = registry.histogram("latency_seconds", "Latência", buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value)
+
+    assert histogram.samples() == [
+        'latency_seconds_bucket{le="0.1"} 2',
+        'latency_seconds_bucket{le="1.0"} 3',
+        'latency_seconds_bucket{le="+Inf"} 4',
+        "latency_seconds_sum 3.65",
+        "latency_seconds_count 4",
+    ]
+
+
+def test_gauge_callback_is_read_on_render() -> None:
+    registry = MetricsRegistry()
+    size = [1.0]
+    registry.gauge("queue_size", "Fila", callback=lambda: {(): size[0]})
+    size[0] = 5.0
+
+    assert "queue_size 5.0\n" in registry.render()
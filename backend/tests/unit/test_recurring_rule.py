@@ -0,0 +1,48 @@
+"""Cálculo das ocorrências de RecurringRule."""
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+from uuid import uuid4
+
+from src.domain.entities import RecurrenceFrequency, RecurringRule, TransactionType
+
+
+def _rule(**kwargs: Any) -> RecurringRule:
+    return RecurringRule(
+        user_id=uuid4(),
+        description="Aluguel",
+        amount=Decimal("1500.00"),
+        type=TransactionType.EXPENSE,
+        **kwargs,
+    )
+
+
+def test_monthly_day_is_clamped_to_month_end() -> None:
+    rule = _rule(
+        frequency=RecurrenceFrequency.MONTHLY, start_date=datetime(2025, 1, 31, 9)
+    )
+    occurrences = rule.advance(datetime(2025, 4, 30, 9), limit=10)
+    assert [o.date().isoformat() for o in occurrences] == [
+        "2025-01-31",
+        "2025-02-28",
+        "2025-03-31",
+        "2025-04-30",
+    ]
+    assert rule.next_occurrence == datetime(2025, 5, 31, 9)
+
+
+def test_weekly_rule_starts_on_next_weekday_and_stops_at_end() -> None:
+    rule = _rule(
+        frequency=RecurrenceFrequency.WEEKLY,
+        weekday=0,
+        interval=2,
+        start_date=datetime(2025, 1, 1),
+        end_date=datetime(2025, 2, 1),
+    )
+    occurrences = rule.advance(datetime(2025, 12, 31), limit=10)
+    assert occurrences == [
+        datetime(2025, 1, 6),
+        datetime(2025, 1, 20),
+    ]
+    assert rule.next_occurrence is None
@@ -0,0 +1,49 @@
+"""Token bucket em memória."""
+
+import pytest
+
+from src.infrastructure.ratelimit import InMemoryRateLimitBackend, token_bucket
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    now = [100.0]
+    monkeypatch.setattr(token_bucket.time, "monotonic", lambda: now[0])
+    return now
+
+
+async def test_burst_then_refill_at_rate(clock: list[float]) -> None:
+    backend = InMemoryRateLimitBackend(max_keys=10)
+
+    for _ in range(3):
+        assert (await backend.consume("a", 1, rate=2, burst=3)).allowed
+    denied = await backend.consume("a", 1, rate=2, burst=3)
+    assert not denied.allowed
+    assert denied.retry_after == pytest.approx(0.5)
+
+    clock[0] += 0.5
+    assert (await backend.consume("a", 1, rate=2, burst=3)).allowed
+    # Outras chaves têm o próprio bucket
+    assert (await backend.consume("b", 3, rate=2, burst=3)).allowed
+
+
+async def test_cost_above_burst_is_capped(clock: list[float]) -> None:
+    backend = InMemoryRateLimitBackend(max_keys=10)
+
+    assert (await backend.consume("a", 50, rate=1, burst=5)).allowed
+    denied = await backend.consume("a", 50, rate=1, burst=5)
+    assert denied.retry_after == pytest.approx(5)
+
+
+async def test_least_recently_used_keys_are_evicted(clock: list[float]) -> None:
+    backend = InMemoryRateLimitBackend(max_keys=2)
+
+    await backend.consume("a", 1, rate=1, burst=1)
+    await backend.consume("b", 1, rate=1, burst=1)
+    await backend.consume("a", 0, rate=1, burst=1)
+    await backend.consume("c", 1, rate=1, burst=1)
+
+    assert len(backend) == 2
+    # "a" foi usado depois de "b": continua vazio; "b" recomeça cheio
+    assert not (await backend.consume("a", 1, rate=1, burst=1)).allowed
+    assert (await backend.consume("b", 1, rate=1, burst=1)).allowed
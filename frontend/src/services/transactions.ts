@@ -63,9 +63,19 @@ export interface MonthlyData {
   despesas: number;
 }
 
+interface MonthlyDataResponse {
+  name: string;
+  receitas: string;
+  despesas: string;
+}
+
 export async function getMonthlyData(year?: number): Promise<MonthlyData[]> {
-  const response = await api.get<MonthlyData[]>("/transactions/monthly", {
+  const response = await api.get<MonthlyDataResponse[]>("/transactions/monthly", {
     params: { year },
   });
-  return response.data;
+  return response.data.map((month) => ({
+    name: month.name,
+    receitas: Number(month.receitas),
+    despesas: Number(month.despesas),
+  }));
 }
@@ -3,6 +3,7 @@ export interface User {
   email: string;
   name: string;
   is_active: boolean;
+  initial_balance: string;
   created_at: string;
   updated_at?: string;
 }